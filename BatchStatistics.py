@@ -0,0 +1,107 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+from DateParser import DateParser
+from StatisticsEngine import StatisticsEngine
+from Vacancies_Controller import Vacancies_Controller
+
+
+class BatchStatistics:
+    """Класс для подсчёта статистики сразу по нескольким профессиям (и регионам).
+    Файл читается и конвертируется один раз, названия профессий проверяются только по уникальным названиям
+    вакансий, после чего статистика каждой профессии считается по готовой маске без повторного разбора данных
+    теми же StatisticsEngine.count_by_years и to_year_dictionaries, что и в пуле процессов с разделяемой памятью.
+
+        Attributes:
+            professions(list<str>): названия профессий
+            regions(list<str>): названия регионов
+            main_df(dataframe): отформатированные вакансии
+            city_statistics(list<dict<str, float>>): уровень зарплат и доля вакансий по городам, общие для всех профессий
+            year_statistics(dict<str, list<dict<int, int>>>): статистика по годам для каждой профессии в порядке
+                get_final_year_statistics: средняя зарплата, средняя зарплата профессии, количество вакансий,
+                количество вакансий профессии
+            region_statistics(dict<str, dict<str, list<dict<int, int>>>>): для каждой профессии и региона
+                средняя зарплата и количество вакансий по годам, как get_final_region_statistics
+    """
+
+    def __init__(self, professions, regions=None):
+        """Инициализирует объект BatchStatistics
+            Args:
+                professions(list<str>): названия профессий
+                regions(list<str>): названия регионов
+        """
+        self.professions = list(professions)
+        self.regions = list(regions or [])
+        self.main_df = None
+        self.city_statistics = []
+        self.year_statistics = {}
+        self.region_statistics = {}
+
+    def load(self, file_name):
+        """Читает и конвертирует файл с вакансиями один раз для всех профессий
+            Args:
+                file_name(str): файл с вакансиями
+        """
+        df = pd.read_csv(file_name)
+        df = Vacancies_Controller().get_formatted_dataframe(df)
+        df = df.dropna()
+        df["years"] = DateParser.get_years(df["published_at"])
+        self.main_df = df
+
+    def initialize_statistics(self):
+        """Считает статистику по городам и статистику по годам для всех профессий и регионов"""
+        df = self.main_df
+        self.city_statistics = StatisticsEngine.get_city_statistics(df)
+
+        year_codes, years = pd.factorize(df["years"], sort=True)
+        name_codes, names = pd.factorize(df["name"])
+        area_codes, area_names = pd.factorize(df["area_name"])
+        salary = df["salary"].to_numpy(dtype=np.float64)
+        years = [int(year) for year in years]
+
+        average_salary, number_of_vacancies = StatisticsEngine.to_year_dictionaries(
+            years, *StatisticsEngine.count_by_years(year_codes, salary, len(years)))
+        region_codes = {region: area_names.get_indexer([region])[0] for region in self.regions}
+
+        for profession in self.professions:
+            matched = StatisticsEngine.get_name_matches(names, profession)[name_codes]
+            average_salary_profession, number_of_vacancies_profession = StatisticsEngine.to_year_dictionaries(
+                years, *StatisticsEngine.count_by_years(year_codes, salary, len(years), matched))
+            self.year_statistics[profession] = [average_salary, average_salary_profession,
+                                                number_of_vacancies, number_of_vacancies_profession]
+            self.region_statistics[profession] = {
+                region: StatisticsEngine.to_year_dictionaries(
+                    years, *StatisticsEngine.count_by_years(year_codes, salary, len(years),
+                                                            matched & (area_codes == region_code)))
+                for region, region_code in region_codes.items()}
+
+    def print_statistic(self):
+        """Выводит статистику по всем профессиям"""
+        print(f'Уровень зарплат по городам (в порядке убывания): {self.city_statistics[0]}')
+        print(f'Доля вакансий по городам (в порядке убывания): {self.city_statistics[1]}')
+        for profession in self.professions:
+            average_salary, average_salary_profession, number_of_vacancies, number_of_vacancies_profession = \
+                self.year_statistics[profession]
+            print(f'\n{profession}')
+            print(f'Динамика уровня зарплат по годам: {average_salary}')
+            print(f'Динамика количества вакансий по годам: {number_of_vacancies}')
+            print(f'Динамика уровня зарплат по годам для выбранной профессии: {average_salary_profession}')
+            print(f'Динамика количества вакансий по годам для выбранной профессии: {number_of_vacancies_profession}')
+            for region, (average_salary_region, number_of_vacancies_region) in \
+                    self.region_statistics[profession].items():
+                print(f'Динамика уровня зарплат по годам в {region}: {average_salary_region}')
+                print(f'Динамика количества вакансий по годам в {region}: {number_of_vacancies_region}')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Статистика по нескольким профессиям за один проход')
+    parser.add_argument('file_name', help='файл с вакансиями')
+    parser.add_argument('-p', '--professions', nargs='+', required=True, help='названия профессий')
+    parser.add_argument('-r', '--regions', nargs='*', default=[], help='названия регионов')
+    arguments = parser.parse_args()
+
+    statistics = BatchStatistics(arguments.professions, arguments.regions)
+    statistics.load(arguments.file_name)
+    statistics.initialize_statistics()
+    statistics.print_statistic()
@@ -0,0 +1,166 @@
+import os.path
+import sqlite3
+import numpy as np
+import pandas as pd
+
+from DateParser import DateParser
+
+
+class CurrencyRateIndex:
+    """Класс для быстрого получения курса валют по месяцам.
+    Курсы загружаются один раз в плотную таблицу, где строка - номер месяца, а столбец - код валюты.
+
+        Attributes:
+            first_month(int): порядковый номер первого месяца в таблице
+            currencies(dict<str, int>): номер столбца для каждой валюты
+            rates(ndarray): курсы валют, NaN - курс неизвестен
+            cache(dict<tuple<str, str>, float>): уже найденные курсы по паре (валюта, месяц)
+    """
+    shared = None
+
+    def __init__(self, currency_values):
+        """Инициализирует класс CurrencyRateIndex
+            Args:
+                currency_values(dataframe): столбец date в формате Y-m и по столбцу на каждую валюту
+            Raises:
+                ValueError: месяц не разбирается или встречается несколько раз
+        """
+        currency_columns = [column for column in currency_values.columns if column != 'date']
+        self.currencies = {currency: i for i, currency in enumerate(currency_columns)}
+        self.cache = {}
+        if currency_values.empty:
+            self.first_month = 0
+            self.rates = np.empty((0, len(currency_columns)))
+            return
+
+        months = CurrencyRateIndex.get_month_ordinals(currency_values['date'])
+        if (months < 0).any():
+            raise ValueError(f'Некорректные месяцы курсов валют: {list(currency_values["date"][months < 0])}')
+        unique_months, counts = np.unique(months, return_counts=True)
+        if (counts > 1).any():
+            duplicates = [f'{month // 12}-{month % 12 + 1:02d}' for month in unique_months[counts > 1]]
+            raise ValueError(f'Месяцы курсов валют повторяются: {duplicates}')
+        self.first_month = int(months.min())
+        self.rates = np.full((int(months.max()) - self.first_month + 1, len(currency_columns)), np.nan)
+        values = currency_values[currency_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        self.rates[months - self.first_month] = values
+        # get_salary всегда считал нулевой курс отсутствующим
+        self.rates[self.rates == 0] = np.nan
+
+    @classmethod
+    def from_csv(cls, file_name):
+        """Создаёт индекс из csv файла с курсами валют
+            Args:
+                file_name(str): путь до csv файла
+            Returns:
+                CurrencyRateIndex: индекс курсов валют
+        """
+        return cls(pd.read_csv(file_name))
+
+    @classmethod
+    def from_database(cls, con):
+        """Создаёт индекс из таблицы currency_dynamic
+            Args:
+                con(Connection): соединение с базой данных
+            Returns:
+                CurrencyRateIndex: индекс курсов валют
+        """
+        return cls(pd.read_sql_query('SELECT * FROM currency_dynamic', con))
+
+    @classmethod
+    def get_shared(cls, database_name='currency_dynamic.sqlite', file_name='currency.csv'):
+        """Возвращает общий для всех конвертеров индекс, загружая его при первом обращении.
+        Сначала используется таблица currency_dynamic, затем csv файл
+            Returns:
+                CurrencyRateIndex: индекс курсов валют
+        """
+        if cls.shared is None:
+            cls.shared = cls.load(database_name, file_name)
+        return cls.shared
+
+    @classmethod
+    def load(cls, database_name, file_name):
+        """Загружает индекс из базы данных или csv файла, если они существуют
+            Args:
+                database_name(str): путь до базы данных
+                file_name(str): путь до csv файла
+            Returns:
+                CurrencyRateIndex: индекс курсов валют
+        """
+        if os.path.exists(database_name):
+            con = sqlite3.connect(database_name)
+            try:
+                has_table = con.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'currency_dynamic'").fetchone()
+                if has_table:
+                    return cls.from_database(con)
+            finally:
+                con.close()
+        if os.path.exists(file_name):
+            return cls.from_csv(file_name)
+        return cls(pd.DataFrame({'date': []}))
+
+    @staticmethod
+    def get_month_ordinals(dates):
+        """Возвращает порядковые номера месяцев (год * 12 + месяц - 1) по строкам дат
+            Args:
+                dates(Series<str>): даты, начинающиеся с Y-m
+            Returns:
+                ndarray<int>: номера месяцев, -1 для некорректных дат
+        """
+        return DateParser.get_month_ordinals(dates)
+
+    def get_rate(self, currency, month):
+        """Возвращает курс валюты в рублях за месяц
+            Args:
+                currency(str): код валюты
+                month(str): месяц в формате Y-m
+            Returns:
+                float: курс валюты или None, если он неизвестен
+        """
+        key = (currency, month)
+        if key not in self.cache:
+            self.cache[key] = self.__find_rate(currency, month)
+        return self.cache[key]
+
+    def __find_rate(self, currency, month):
+        """Ищет курс валюты в таблице
+            Args:
+                currency(str): код валюты
+                month(str): месяц в формате Y-m
+            Returns:
+                float: курс валюты или None, если он неизвестен
+        """
+        if currency == 'RUR':
+            return 1
+        if currency not in self.currencies:
+            return None
+        try:
+            row = int(month[:4]) * 12 + int(month[5:7]) - 1 - self.first_month
+        except (TypeError, ValueError):
+            return None
+        if row < 0 or row >= len(self.rates):
+            return None
+        rate = self.rates[row, self.currencies[currency]]
+        return None if np.isnan(rate) else float(rate)
+
+    def get_rates(self, months, currencies):
+        """Возвращает курсы валют для массивов месяцев и валют
+            Args:
+                months(Series<str> or ndarray<int>): месяцы в формате Y-m или их порядковые номера
+                currencies(Series<str>): коды валют
+            Returns:
+                ndarray<float>: курсы валют, NaN - курс неизвестен
+        """
+        months = np.asarray(months)
+        if months.dtype.kind not in 'iu':
+            months = CurrencyRateIndex.get_month_ordinals(months)
+        currencies = np.asarray(currencies, dtype=object)
+        columns = pd.Index(list(self.currencies)).get_indexer(currencies)
+        rows = months - self.first_month
+
+        rates = np.full(len(months), np.nan)
+        found = (columns >= 0) & (rows >= 0) & (rows < len(self.rates)) & (months >= 0)
+        rates[found] = self.rates[rows[found], columns[found]]
+        rates[currencies == 'RUR'] = 1.0
+        return rates
@@ -0,0 +1,159 @@
+import concurrent.futures
+import json
+import os
+import sqlite3
+import xml.etree.ElementTree as ET
+from datetime import datetime
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CurrencyRateStore:
+    """Класс для получения курсов валют ЦБ РФ по месяцам с кэшем на диске.
+    Разобранный ответ за каждый месяц сохраняется в папку кэша, поэтому запрашиваются только месяцы,
+    которых ещё нет в кэше, причём параллельно, не более max_workers запросов одновременно.
+
+        Attributes:
+            cache_folder(str): папка с кэшем ответов по месяцам
+            base_url(str): адрес XML_daily.asp
+            max_workers(int): количество одновременных запросов
+            timeout(float): время ожидания ответа в секундах
+            session(Session): сессия с keep-alive соединениями
+    """
+
+    def __init__(self, cache_folder='cbr_cache', base_url='http://www.cbr.ru/scripts/XML_daily.asp', max_workers=8,
+                 timeout=10):
+        """Инициализирует класс CurrencyRateStore"""
+        self.cache_folder = cache_folder
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_cache_path(self, month):
+        """Возвращает путь до файла кэша месяца
+            Args:
+                month(str): месяц в формате Y-m
+            Returns:
+                str: путь до файла
+        """
+        return os.path.join(self.cache_folder, f'{month}.json')
+
+    @staticmethod
+    def parse_rates(content):
+        """Разбирает ответ XML_daily.asp
+            Args:
+                content(bytes): ответ в формате XML
+            Returns:
+                dict<str, float>: курс в рублях за одну единицу каждой валюты
+        """
+        rates = {}
+        for child in ET.fromstring(content).findall('Valute'):
+            rates[child.find('CharCode').text] = \
+                float(child.find('Value').text.replace(',', '.')) / float(child.find('Nominal').text)
+        return rates
+
+    def fetch_month(self, month):
+        """Запрашивает курсы валют на 12 число месяца и сохраняет их в кэш, если это число уже прошло
+            Args:
+                month(str): месяц в формате Y-m
+            Returns:
+                dict<str, float>: курсы валют
+        """
+        year, month_number = month.split('-')
+        response = self.session.get(self.base_url, params={'date_req': f'12/{month_number}/{year}'},
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        rates = CurrencyRateStore.parse_rates(response.content)
+        if datetime(int(year), int(month_number), 12) >= datetime.now():
+            return rates
+
+        os.makedirs(self.cache_folder, exist_ok=True)
+        path = self.get_cache_path(month)
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(rates, file)
+        os.replace(f'{path}.tmp', path)
+        return rates
+
+    def get_rates(self, months):
+        """Возвращает курсы валют по месяцам, запрашивая параллельно только месяцы, которых нет в кэше
+            Args:
+                months(list<str>): месяцы в формате Y-m
+            Returns:
+                dict<str, dict<str, float>>: курсы валют по месяцам
+        """
+        rates = {}
+        missing_months = []
+        for month in months:
+            if os.path.exists(self.get_cache_path(month)):
+                with open(self.get_cache_path(month), encoding='utf-8') as file:
+                    rates[month] = json.load(file)
+            else:
+                missing_months.append(month)
+
+        if missing_months:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                rates.update(zip(missing_months, executor.map(self.fetch_month, missing_months)))
+        return rates
+
+    def get_currency_dataframe(self, months, currencies):
+        """Возвращает таблицу курсов в формате currency.csv
+            Args:
+                months(list<str>): месяцы в формате Y-m
+                currencies(list<str>): валюты
+            Returns:
+                dataframe: столбец date и по столбцу на каждую валюту, None - курс неизвестен
+        """
+        rates = self.get_rates(months)
+        return pd.DataFrame({'date': months,
+                             **{currency: [rates[month].get(currency) for month in months] for currency in currencies}})
+
+    @staticmethod
+    def merge(new_values, file_name='currency.csv', con=None):
+        """Добавляет курсы в csv файл и таблицу currency_dynamic. Курсы объединяются по месяцу и валюте:
+        известный курс из new_values заменяет старый, а месяцы и валюты, которых нет в new_values,
+        и неизвестные в new_values курсы сохраняются
+            Args:
+                new_values(dataframe): курсы в формате currency.csv
+                file_name(str): csv файл с курсами
+                con(Connection): соединение с базой данных, None - таблица не обновляется
+            Returns:
+                dataframe: все курсы
+        """
+        currency_values = new_values
+        if os.path.exists(file_name):
+            old_values = pd.read_csv(file_name)
+            columns = list(old_values.columns) + [column for column in new_values.columns
+                                                  if column not in old_values.columns]
+            currency_values = new_values.set_index('date').combine_first(old_values.set_index('date')) \
+                .reset_index()[columns]
+        currency_values = currency_values.sort_values('date', ignore_index=True)
+        currency_values.to_csv(file_name, index=False)
+
+        if con is not None:
+            CurrencyRateStore.__merge_table(currency_values, new_values, con)
+        return currency_values
+
+    @staticmethod
+    def __merge_table(currency_values, new_values, con):
+        """Обновляет в таблице currency_dynamic только месяцы из new_values, если набор валют не изменился,
+        иначе перезаписывает таблицу"""
+        try:
+            columns = [row[1] for row in con.execute('PRAGMA table_info(currency_dynamic)')]
+        except sqlite3.DatabaseError:
+            columns = []
+        if columns != list(currency_values.columns):
+            currency_values.to_sql('currency_dynamic', con, if_exists='replace', index=False)
+        else:
+            con.executemany('DELETE FROM currency_dynamic WHERE date = ?', [(month,) for month in new_values['date']])
+            currency_values[currency_values['date'].isin(new_values['date'])] \
+                .to_sql('currency_dynamic', con, if_exists='append', index=False)
+        con.commit()
+
+    def close(self):
+        """Закрывает соединения"""
+        self.session.close()
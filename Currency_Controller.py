@@ -1,85 +1,126 @@
-import requests
+import sqlite3
+from contextlib import closing, nullcontext
 import pandas as pd
 from datetime import datetime
 from dateutil import rrule
-from urllib.request import urlopen
-import xml.etree.ElementTree as ET
+
+from CurrencyRateIndex import CurrencyRateIndex
+from CurrencyRateStore import CurrencyRateStore
 
 
 class Currency_Controller:
     """Класс для создания csv файла с курсом фалют, основаным на полученном csv файле.
+    Файл вакансий не читается при создании объекта: частоты и даты валют считаются потоково по двум столбцам,
+    а весь файл загружается только при обращении к df.
 
             Attributes:
                 file_path(str): путь до csv файла
-                df(dataframe): вакансии
+                chunk_size(int): количество строк, читаемых за один раз
                 currencies(list<str>): список валют, втречающихся в файле вакансий более 5000 раз
         """
-    def __init__(self):
-        """Инициализирует класс Currency_Controller"""
-        self.file_path = "vacancies_dif_currencies.csv"
-        self.df = pd.read_csv(self.file_path)
+    def __init__(self, file_path="vacancies_dif_currencies.csv", chunk_size=100000):
+        """Инициализирует класс Currency_Controller
+            Args:
+                file_path(str): путь до csv файла
+                chunk_size(int): количество строк, читаемых за один раз
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
         self.currencies = []
+        self.__df = None
+        self.__currency_summary = None
+
+    @property
+    def df(self):
+        """dataframe: вакансии, читаются из файла при первом обращении"""
+        if self.__df is None:
+            self.__df = pd.read_csv(self.file_path)
+        return self.__df
+
+    @property
+    def currency_summary(self):
+        """dataframe: количество вакансий, первая и последняя дата публикации по валютам, считаются при первом
+        обращении"""
+        if self.__currency_summary is None:
+            self.__currency_summary = Currency_Controller.count_currencies(self.file_path, self.chunk_size,
+                                                                           with_dates=True)
+        return self.__currency_summary
 
     def __initialize_currencies(self):
         """Заполняет список currencies валютами, которые встречаются более 5000 раз"""
-        value = self.df['salary_currency'].value_counts()
+        value = self.currency_summary['count'].sort_values(ascending=False)
         print(value)
-        for currency, count in value.items():
-            if count >= 5000 and currency !="RUR":
-                self.currencies.append(currency)
-
+        self.currencies = [currency for currency in Currency_Controller.get_frequent_currencies(value)
+                           if currency != "RUR"]
 
-    def __filter_vacancies_by_currency(self):
-        """Фильтрует csv файл, оставляя лишь вакансии валюты которых встречаются более 5000 раз"""
-        self.__initialize_currencies()
-        self.df = self.df[self.df['salary_currency'].isin(self.currencies)]
-
-    def filter_vacancies_by_currency(self, vacancies):
+    @staticmethod
+    def filter_vacancies_by_currency(vacancies, currencies=None):
         """Фильтрует dataframe, оставляя лишь те вакансии валюты которых встречаются более 5000 раз
             Args:
                 vacancies(dataframe): вакансии
+                currencies(list<str>): заранее подсчитанный список валют, если dataframe - лишь часть файла
             Returns:
                 dataframe: отфильтрованные по валютам вакансии
         """
-        value = vacancies['salary_currency'].value_counts()
-        currencies = []
-        for currency, count in value.items():
-            if count >= 5000:
-                currencies.append(currency)
+        if currencies is None:
+            currencies = Currency_Controller.get_frequent_currencies(vacancies['salary_currency'].value_counts())
 
         vacancies = vacancies[(vacancies['salary_currency'].isin(currencies)) | (pd.isna(vacancies['salary_currency']))]
         return vacancies
 
 
-    def create_currency_dateframe(self):
-        """Получает csv файл с инфомарцией о валютах по месяцам"""
-        self.__filter_vacancies_by_currency()
-        minDate = datetime.strptime(self.df['published_at'].min(), '%Y-%m-%dT%H:%M:%S%z').replace(day=12, hour=12, minute=0,
-                                                                                            second=0)
-        maxDate = datetime.strptime(self.df['published_at'].max(), '%Y-%m-%dT%H:%M:%S%z').replace(day=12, hour=12, minute=0,
-                                                                                            second=0)
-        result = {'date': []}
-        for currency in self.currencies:
-            result[currency] = []
-
-        for current_date in rrule.rrule(rrule.MONTHLY, dtstart=minDate, until=maxDate):
-            tree = ET.parse(
-                urlopen(f'http://www.cbr.ru/scripts/XML_daily.asp?date_req=12/{current_date.strftime("%m/%Y")}d=1'))
-            root = tree.getroot()
-            for child in root.findall('Valute'):
-                currency = child.find('CharCode').text
-                if currency in result.keys():
-                    if current_date.strftime('%Y-%m') not in result['date']:
-                        result['date'] += [current_date.strftime('%Y-%m')]
-                    currency_exchange_rate = float(child.find('Value').text.replace(',', '.')) / float(child.find('Nominal').text)
-                    result[currency].append(currency_exchange_rate)
-            #Проверяем, значение валюты на пустоту
-            for currency in self.currencies:
-                if len(result[currency]) !=len(result['date']):
-                    result[currency].append(None)
-        new_df = pd.DataFrame(result)
-        new_df.to_csv(rf"currency.csv", index=False)
-
+    @staticmethod
+    def get_frequent_currencies(currency_counts):
+        """Возвращает валюты, которые встречаются более 5000 раз
+            Args:
+                currency_counts(Series): количество вакансий по валютам
+            Returns:
+                list<str>: валюты
+        """
+        return [currency for currency, count in currency_counts.items() if count >= 5000]
 
+    @staticmethod
+    def count_currencies(file_name, chunk_size, with_dates=False):
+        """Считает количество вакансий по валютам, читая из файла частями только нужные столбцы
+            Args:
+                file_name(str): файл с вакансиями
+                chunk_size(int): количество строк в одной части
+                with_dates(bool): считать ли также первую и последнюю дату публикации по валютам
+            Returns:
+                Series: количество вакансий по валютам или, если задан with_dates,
+                dataframe: столбцы count, min, max с валютой в индексе
+        """
+        aggregations = {'count': ('salary_currency', 'size')}
+        if with_dates:
+            aggregations.update({'min': ('published_at', 'min'), 'max': ('published_at', 'max')})
+        parts = [chunk.groupby('salary_currency').agg(**aggregations)
+                 for chunk in pd.read_csv(file_name, usecols=[column for column, _ in aggregations.values()],
+                                          chunksize=chunk_size)]
+        if parts:
+            summary = pd.concat(parts).groupby(level=0).agg({name: 'sum' if name == 'count' else name
+                                                             for name in aggregations})
+        else:
+            summary = pd.DataFrame({name: pd.Series(dtype='int64' if name == 'count' else object)
+                                    for name in aggregations})
+        summary['count'] = summary['count'].astype('int64')
+        return summary if with_dates else summary['count']
 
+    def create_currency_dateframe(self, store=None, con=None):
+        """Дополняет csv файл с инфомарцией о валютах по месяцам и таблицу currency_dynamic.
+        Курсы берутся из кэша CurrencyRateStore, недостающие месяцы запрашиваются у ЦБ параллельно
+            Args:
+                store(CurrencyRateStore): хранилище курсов, по умолчанию - с настройками по умолчанию
+                con(Connection): соединение с базой данных, по умолчанию - currency_dynamic.sqlite,
+                    которое закрывается после записи
+        """
+        self.__initialize_currencies()
+        dates = self.currency_summary.loc[self.currencies]
+        min_date = datetime.strptime(dates['min'].min()[:7], '%Y-%m')
+        max_date = datetime.strptime(dates['max'].max()[:7], '%Y-%m')
+        months = [current_date.strftime('%Y-%m')
+                  for current_date in rrule.rrule(rrule.MONTHLY, dtstart=min_date, until=max_date)]
 
+        with closing(CurrencyRateStore()) if store is None else nullcontext(store) as store, \
+                closing(sqlite3.connect('currency_dynamic.sqlite')) if con is None else nullcontext(con) as con:
+            CurrencyRateStore.merge(store.get_currency_dataframe(months, self.currencies), 'currency.csv', con)
+        CurrencyRateIndex.shared = None
@@ -1,6 +1,8 @@
 from InputConect import InputConect
-from Vacancy  import Vacancy
-from datetime import datetime
+from VacancyTable import VacancyTable
+from VacancySorter import VacancySorter
+from VacancyFilter import VacancyFilter
+from VacancyIndex import VacancyIndex
 import re
 import sys
 import csv
@@ -11,28 +13,94 @@ class DataSet:
     Attributes:
         file_name(str): Название файла, откуда будут взяты данные для вакансий
         name_of_profession(str): Название професии, по которой можно будет получить список вакансий
-        vacancies_objects(list<Vacancy>): Список вакансий
+        vacancies_objects(VacancyTable): Вакансии, хранящиеся по столбцам
+        vacancy_index(VacancyIndex): Индексы по полям вакансий для фильтров
         filtering_parameter(str):параметр фильтрации
         sorting_parameter(str):параметр сортировки
         is_reverse_sorting(str):порядок сортировки
         vacancy_numbers(str): диапазон вывода
         fields(str):требуемые столбцы
+        html_tag(Pattern): регулярное выражение для html тегов
+        raw_filters(dict<str, tuple<str, bool>>): фильтры, которые проверяются по ячейке файла:
+            столбец и сравнивается ли введённое значение с расшифровкой ячейки
+        cache(VacancyCache): кэш прочитанных таблиц вакансий, по умолчанию None - файл всегда читается заново
+            с проверкой фильтра по ячейке. Включается присваиванием DataSet.cache = VacancyCache()
     """
+    html_tag = re.compile(r'<[^>]*>')
+    raw_filters = {'Название': ('name', False),
+                   'Название региона': ('area_name', False),
+                   'Компания': ('employer_name', False),
+                   'Опыт работы': ('experience_id', True),
+                   'Премиум-вакансия': ('premium', True),
+                   'Идентификатор валюты оклада': ('salary_currency', True)}
+    cache = None
 
     def __init__(self):
-        """Инициализирует объект Dataset"""
+        """Инициализирует объект Dataset. Файл читается при первом обращении к vacancies_objects,
+        когда уже известен параметр фильтрации"""
         self.file_name = input('Введите название файла: ')
         self.name_of_profession = input('Введите название профессии: ')
-        self.vacancies_objects = self.__read_data_vacancies()
+        self.filtering_parameter = ''
+        self.__vacancies_objects = None
+        self.__vacancy_index = None
+
+    @property
+    def vacancies_objects(self):
+        """VacancyTable: вакансии, читаются из файла при первом обращении"""
+        if self.__vacancies_objects is None:
+            self.__vacancies_objects = self.__read_data_vacancies()
+        return self.__vacancies_objects
+
+    @property
+    def vacancy_index(self):
+        """VacancyIndex: индексы по полям вакансий, каждый строится при первом фильтре по своему полю"""
+        if self.__vacancy_index is None:
+            self.__vacancy_index = VacancyIndex(self.vacancies_objects, InputConect.decoding)
+        return self.__vacancy_index
 
     def __read_data_vacancies(self):
-        """Преобразуе данные из файла в list<Vacancy>
+        """Преобразуе данные из файла в таблицу вакансий. Без кэша (по умолчанию) фильтр, который можно проверить
+        по ячейке файла, проверяется до создания вакансии, и в таблицу попадают только подходящие строки.
+        Если кэш включён, таблица всего файла берётся из него, а при его отсутствии читается весь файл
+        и сохраняется в кэш
         Returns:
-            list<Vacancy>: Список вакансий
+            VacancyTable: Вакансии
         """
+        if DataSet.cache is not None:
+            data_vacancies = DataSet.cache.load(self.file_name)
+            if data_vacancies is None:
+                list_naming, list_data = DataSet.csv_reader(self.file_name)
+                data_vacancies = VacancyTable.from_dictionaries(DataSet.csv_filer(list_data, list_naming))
+                DataSet.cache.store(self.file_name, data_vacancies)
+            return data_vacancies
         list_naming, list_data = DataSet.csv_reader(self.file_name)
-        data_vacancies = DataSet.csv_filer(list_data, list_naming)
-        return [Vacancy(vacancy_information) for vacancy_information in data_vacancies]
+        raw_filter = DataSet.get_raw_filter(list_naming, self.filtering_parameter)
+        data_vacancies = DataSet.csv_filer(list_data, list_naming, raw_filter)
+        return VacancyTable.from_dictionaries(data_vacancies)
+
+    @staticmethod
+    def get_raw_filter(list_naming, filtering_parameter):
+        """Возвращает фильтр по ячейке файла для первого условия, сравнивающего поле с введённым значением.
+        Остальные условия проверяются уже после чтения
+        Args:
+            list_naming(list<str>): Название столбцов
+            filtering_parameter(str): Параметр фильтрации
+        Returns:
+            tuple<int, set<str>>: номер столбца и допустимые очищенные значения ячейки или None,
+                если таких условий нет
+        """
+        for filter_name, filter_value in VacancyFilter.parse(filtering_parameter) or []:
+            if filter_name not in DataSet.raw_filters:
+                continue
+            column, is_decoded = DataSet.raw_filters[filter_name]
+            if column not in list_naming:
+                continue
+            if is_decoded:
+                values = {key for key, value in InputConect.decoding.items() if value == filter_value}
+            else:
+                values = {filter_value}
+            return list_naming.index(column), values
+        return None
 
     def print_table(self):
         """Выводит таблицу по переданным пользователем параметрам
@@ -49,33 +117,52 @@ class DataSet:
 
     @staticmethod
     def csv_reader(file_name):
-        """Возращает из прочитанного файла список столбоцов и список вакансий
+        """Возращает из файла список столбоцов и генератор строк. Строки читаются по одной,
+        файл закрывается, когда генератор дочитан до конца
         Args:
             file_name(str): навзание файла
         Returns:
             list<str>
-            list<list<str>>
+            iterator<list<str>>
         """
         file_csv = open(file_name, encoding='utf_8_sig')
         reader_csv = csv.reader(file_csv)
-        list_data = [x for x in reader_csv]
-        if len(list_data) == 0:
+        list_naming = next(reader_csv, None)
+        if list_naming is None:
+            file_csv.close()
             print("Пустой файл")
             sys.exit()
-        return list_data[0], list_data[1:]
+        return list_naming, DataSet.read_rows(file_csv, reader_csv)
+
+    @staticmethod
+    def read_rows(file_csv, reader_csv):
+        """Возвращает строки файла по одной и закрывает файл после последней
+        Args:
+            file_csv(file): открытый файл
+            reader_csv(reader): csv.reader этого файла
+        Returns:
+            iterator<list<str>>
+        """
+        with file_csv:
+            yield from reader_csv
 
     @staticmethod
-    def csv_filer(reader, list_naming):
-        """Проверяет столбцы и списки вакансии на ошибки, и преобразует список вакансии в словарь
+    def csv_filer(reader, list_naming, raw_filter=None):
+        """Проверяет столбцы и списки вакансии на ошибки, и преобразует список вакансии в словарь.
+        Строки обрабатываются по одной, в памяти не хранится весь файл
         Args:
-            reader(list<list<str>>): навзание файла
+            reader(iterable<list<str>>): строки файла
             list_naming(list<str>): Название столбцов
+            raw_filter(tuple<int, set<str>>): фильтр по ячейке из get_raw_filter, очищается только эта ячейка
         Returns:
-            list<dict<str, str>>: Список вакансий в виде словарей
+            iterator<dict<str, str>>: Вакансии в виде словарей
         """
-        rows = [x for x in reader if len(x) == len(list_naming) and '' not in x]
-        dictionary_rows = [DataSet.convert_row_to_dictionary(list_naming, row) for row in rows]
-        return dictionary_rows
+        columns_count = len(list_naming)
+        rows = (row for row in reader if len(row) == columns_count and '' not in row)
+        if raw_filter is not None:
+            column_index, values = raw_filter
+            rows = (row for row in rows if DataSet.convert_cell_to_standard(row[column_index]) in values)
+        return (DataSet.convert_row_to_dictionary(list_naming, row) for row in rows)
 
     @staticmethod
     def convert_row_to_dictionary(columns_name, row):
@@ -86,10 +173,7 @@ class DataSet:
         Returns:
             dict<str, str>: Вакансия в виде словаря
         """
-        dict = {}
-        for i in range(len(columns_name)):
-            dict[columns_name[i]] = DataSet.convert_cell_to_standard(row[i])
-        return dict
+        return {name: DataSet.convert_cell_to_standard(cell) for name, cell in zip(columns_name, row)}
 
     @staticmethod
     def convert_cell_to_standard(cell):
@@ -99,90 +183,31 @@ class DataSet:
         Returns:
             cell(str or list<str>): Отформотировання ячейка
         """
-        words = re.sub(r'<[^>]*>', '', cell).split('\n')
-        for i in range(len(words)):
-            words[i] = ' '.join(words[i].split())
-        return ';'.join(map(str, words))
+        if '<' in cell:
+            cell = DataSet.html_tag.sub('', cell)
+        return ';'.join([' '.join(line.split()) for line in cell.split('\n')])
 
     @staticmethod
     def check_entered_data(filtering_parameter, sorting_parameter, is_reverse_sorting):
         """Проверяет введённые параметры вывода таблицы(фильтр, сортировка, порядок) на корректность ввода
          Args:
-            filtering_parameter(str): Фильтр
+            filtering_parameter(str): Фильтр: условия 'ключ: значение' через '; '
             sorting_parameter(str): Параметр сортировки
             is_reverse_sorting(str): В каком порядке выводится таблица
         """
-        currency_to_rub = {
-            "AZN": 35.68,
-            "BYR": 23.91,
-            "EUR": 59.90,
-            "GEL": 21.74,
-            "KGS": 0.76,
-            "KZT": 0.13,
-            "RUR": 1,
-            "UAH": 1.64,
-            "USD": 60.66,
-            "UZS": 0.0055,
-        }
-        work_experience_convertor_weight = {
-            "noExperience": 0,
-            "between1And3": 1,
-            "between3And6": 2,
-            "moreThan6": 3
-        }
-        decoding = {"noExperience": "Нет опыта",
-                    "between1And3": "От 1 года до 3 лет",
-                    "between3And6": "От 3 до 6 лет",
-                    "moreThan6": "Более 6 лет",
-                    "AZN": "Манаты",
-                    "BYR": "Белорусские рубли",
-                    "EUR": "Евро",
-                    "GEL": "Грузинский лари",
-                    "KGS": "Киргизский сом",
-                    "KZT": "Тенге",
-                    "RUR": "Рубли",
-                    "UAH": "Гривны",
-                    "USD": "Доллары",
-                    "UZS": "Узбекский сум",
-                    'True': 'Да',
-                    'False': 'Нет'
-                    }
-        sorting_rules = {
-            'Навыки': lambda vacancy: len(vacancy.key_skills),
-            'Оклад': lambda vacancy: ((float(vacancy.salary.salary_from) + float(vacancy.salary.salary_to)) / 2) *
-                                     currency_to_rub[
-                                         vacancy.salary_currency],
-            'Дата публикации вакансии': lambda vacancy: datetime.strptime(vacancy.published_at, '%Y-%m-%dT%H:%M:%S%z'),
-            'Компания': lambda vacancy: vacancy.employer_name,
-            'Опыт работы': lambda vacancy: work_experience_convertor_weight[vacancy.experience_id],
-            'Премиум-вакансия': lambda vacancy: decoding[vacancy.premium],
-            'Название региона': lambda vacancy: vacancy.area_name,
-            'Название': lambda vacancy: vacancy.name,
-            'Идентификатор валюты оклада': lambda vacancy: decoding(vacancy.salary_currency)
-        }
-        filters = {
-            'Компания': lambda employer_name, vacancy: employer_name == vacancy.employer_name,
-            'Оклад': lambda salary, vacancy: int(float(vacancy.salary.salary_from)) <= int(float(salary)) <= int(
-                float(vacancy.salary.salary_to)),
-            'Дата публикации вакансии': lambda date, vacancy: date == vacancy.published_at.strftime('%d.%m.%Y'),
-            'Навыки': lambda skills, vacancy: set(skills.split(', ')).issubset(vacancy.key_skills),
-            'Опыт работы': lambda experience_id, vacancy: experience_id == decoding[vacancy.experience_id],
-            'Премиум-вакансия': lambda premium, vacancy: premium == decoding[vacancy.premium],
-            'Идентификатор валюты оклада': lambda salary_currency, vacancy: salary_currency == decoding[
-                vacancy.salary_currency],
-            'Название': lambda name, vacancy: name == vacancy.name,
-            'Название региона': lambda area_name, vacancy: area_name == vacancy.area_name,
-        }
-        if filtering_parameter != '' and ':' not in filtering_parameter:
+        predicates = VacancyFilter.parse(filtering_parameter)
+        if predicates is None:
             print('Формат ввода некорректен')
             sys.exit()
-        parameters = filtering_parameter.split(': ')
-        if filtering_parameter != '' and parameters[0] not in filters.keys():
+        if any(filter_name not in VacancyFilter.names for filter_name, _ in predicates):
             print('Параметр поиска некорректен')
             sys.exit()
-        if sorting_parameter != '' and is_reverse_sorting not in ('Да', 'Нет', ''):
+        sorting_fields = sorting_parameter.split(', ') if sorting_parameter != '' else []
+        directions = is_reverse_sorting.split(', ') if is_reverse_sorting != '' else []
+        if sorting_fields and (len(directions) not in (0, 1, len(sorting_fields))
+                               or any(direction not in ('Да', 'Нет') for direction in directions)):
             print('Порядок сортировки задан некорректно')
             sys.exit()
-        if sorting_parameter != '' and sorting_parameter not in sorting_rules.keys():
+        if any(field not in VacancySorter.fields for field in sorting_fields):
             print('Параметр сортировки некорректен')
             sys.exit()
\ No newline at end of file
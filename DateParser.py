@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+
+
+class DateParser:
+    """Класс для быстрого разбора дат публикации вида 2022-05-31T17:32:31+0300 сразу для целого столбца.
+    Год, месяц и день берутся из фиксированных позиций строки без strptime, позиции проверяются (цифры, дефисы,
+    допустимый месяц и день, не больший длины месяца с учётом високосных лет). Строки, не прошедшие проверку, разбираются по одной через fromisoformat и strptime,
+    а если не разбираются и так, получают -1.
+    """
+    date_format = '%Y-%m-%dT%H:%M:%S%z'
+    month_lengths = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int32)
+
+    @staticmethod
+    def get_components(dates, length=10):
+        """Возвращает год, месяц и день каждой даты
+            Args:
+                dates(Series<str> или list<str>): даты
+                length(int): сколько первых символов нужно: 4 - только год, 7 - год и месяц, 10 - вся дата
+            Returns:
+                tuple<ndarray<int>>: годы, месяцы и дни, -1 для некорректных дат и ненужных частей
+        """
+        return DateParser.__parse(DateParser.__to_series(dates), length)[:3]
+
+    @staticmethod
+    def __to_series(dates):
+        """Оборачивает даты в Series, не копируя уже готовый столбец"""
+        return dates if isinstance(dates, pd.Series) else pd.Series(dates, dtype=object)
+
+    @staticmethod
+    def __parse(dates, length):
+        """Разбирает даты по фиксированным позициям, остальные - по одной через parse_date
+            Returns:
+                tuple<ndarray>: годы, месяцы, дни и маска дат, разобранных по фиксированным позициям
+        """
+        values = dates.fillna('').to_numpy(dtype=f'U{length}')
+        codes = values.view(np.uint32).reshape(len(values), length).astype(np.int32) - ord('0')
+        is_digit = (codes >= 0) & (codes <= 9)
+        dash = ord('-') - ord('0')
+
+        years = codes[:, 0] * 1000 + codes[:, 1] * 100 + codes[:, 2] * 10 + codes[:, 3]
+        months = np.full(len(values), -1, dtype=np.int32)
+        days = np.full(len(values), -1, dtype=np.int32)
+        valid = is_digit[:, :4].all(axis=1)
+        if length >= 7:
+            months = codes[:, 5] * 10 + codes[:, 6]
+            valid &= (codes[:, 4] == dash) & is_digit[:, 5:7].all(axis=1) & (months >= 1) & (months <= 12)
+        if length >= 10:
+            days = codes[:, 8] * 10 + codes[:, 9]
+            is_leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+            month_lengths = DateParser.month_lengths[np.clip(months, 1, 12) - 1] + (is_leap & (months == 2))
+            valid &= (codes[:, 7] == dash) & is_digit[:, 8:10].all(axis=1) & (days >= 1) & (days <= month_lengths)
+
+        components = [np.where(valid, component, -1).astype(np.int32) if length >= size else component
+                      for component, size in [(years, 4), (months, 7), (days, 10)]]
+        for i in np.flatnonzero(~valid):
+            date = DateParser.parse_date(dates.iloc[i])
+            if date is not None:
+                for component, value, size in zip(components, [date.year, date.month, date.day], [4, 7, 10]):
+                    if length >= size:
+                        component[i] = value
+        return components[0], components[1], components[2], valid
+
+    @staticmethod
+    def parse_date(date_string):
+        """Разбирает одну дату: сначала fromisoformat, затем strptime по date_format
+            Args:
+                date_string(str): дата
+            Returns:
+                datetime: дата или None, если строку не удалось разобрать
+        """
+        if not isinstance(date_string, str):
+            return None
+        try:
+            return datetime.fromisoformat(date_string.strip())
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(date_string.strip(), DateParser.date_format)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def get_years(dates):
+        """Возвращает годы дат
+            Args:
+                dates(Series<str>): даты
+            Returns:
+                ndarray<int>: годы, -1 для некорректных дат
+        """
+        return DateParser.get_components(dates, length=4)[0]
+
+    @staticmethod
+    def get_month_ordinals(dates):
+        """Возвращает порядковые номера месяцев (год * 12 + месяц - 1)
+            Args:
+                dates(Series<str>): даты, начинающиеся с Y-m
+            Returns:
+                ndarray<int>: номера месяцев, -1 для некорректных дат
+        """
+        years, months, _ = DateParser.get_components(dates, length=7)
+        return np.where(years >= 0, years * 12 + months - 1, -1).astype(np.int64)
+
+    @staticmethod
+    def get_iso_dates(dates):
+        """Возвращает даты числами вида YYYYMMDD
+            Args:
+                dates(Series<str>): даты
+            Returns:
+                ndarray<int>: даты, -1 для некорректных дат
+        """
+        years, months, days = DateParser.get_components(dates, length=10)
+        return np.where(years >= 0, years * 10000 + months * 100 + days, -1).astype(np.int32)
+
+    @staticmethod
+    def get_date_strings(dates):
+        """Возвращает даты строками вида Y-m-d
+            Args:
+                dates(Series<str>): даты
+            Returns:
+                ndarray<str>: даты, None для некорректных дат
+        """
+        dates = DateParser.__to_series(dates)
+        years, months, days, valid = DateParser.__parse(dates, length=10)
+        date_strings = dates.str.slice(0, 10).to_numpy(dtype=object, copy=True)
+        for i in np.flatnonzero(~valid):
+            date_strings[i] = f'{years[i]:04d}-{months[i]:02d}-{days[i]:02d}' if years[i] >= 0 else None
+        return date_strings
+
+    @staticmethod
+    def get_timestamps(dates):
+        """Возвращает время публикации в секундах от начала эпохи (UTC) и смещение часового пояса
+            Args:
+                dates(Series<str>): даты вида 2022-05-31T17:32:31+0300
+            Returns:
+                ndarray<int>: секунды от 1970-01-01 UTC, -1 для некорректных дат
+                ndarray<int>: смещение часового пояса в минутах, даты без часового пояса считаются датами UTC
+        """
+        dates = DateParser.__to_series(dates)
+        values = dates.fillna('').to_numpy(dtype='U24')
+        codes = values.view(np.uint32).reshape(len(values), 24).astype(np.int64) - ord('0')
+        is_digit = (codes >= 0) & (codes <= 9)
+
+        def number(start, end):
+            result = np.zeros(len(values), dtype=np.int64)
+            for position in range(start, end):
+                result = result * 10 + codes[:, position]
+            return result
+
+        years, months, days, valid = DateParser.__parse(dates, length=10)
+        hours, minutes, seconds = number(11, 13), number(14, 16), number(17, 19)
+        plus, minus, colon = ord('+') - ord('0'), ord('-') - ord('0'), ord(':') - ord('0')
+        signs = np.where(codes[:, 19] == minus, -1, 1)
+        offsets = signs * (number(20, 22) * 60 + number(22, 24))
+        valid &= (codes[:, 10] == ord('T') - ord('0')) & (codes[:, 13] == colon) & (codes[:, 16] == colon) \
+            & np.isin(codes[:, 19], [plus, minus]) \
+            & is_digit[:, [11, 12, 14, 15, 17, 18, 20, 21, 22, 23]].all(axis=1) \
+            & (hours < 24) & (minutes < 60) & (seconds < 60)
+
+        timestamps = np.full(len(values), -1, dtype=np.int64)
+        epoch_days = values[valid].astype('U10').astype('datetime64[D]').astype(np.int64)
+        timestamps[valid] = epoch_days * 86400 + (hours * 3600 + minutes * 60 + seconds - offsets * 60)[valid]
+        offsets = np.where(valid, offsets, 0)
+        for i in np.flatnonzero(~valid):
+            date = DateParser.parse_date(dates.iloc[i])
+            if date is not None:
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                timestamps[i] = int(date.timestamp())
+                offsets[i] = int(date.utcoffset().total_seconds() // 60)
+        return timestamps, offsets.astype(np.int16)
+
+    @staticmethod
+    def from_timestamp(timestamp, offset):
+        """Возвращает дату с часовым поясом по результату get_timestamps
+            Args:
+                timestamp(int): секунды от 1970-01-01 UTC
+                offset(int): смещение часового пояса в минутах
+            Returns:
+                datetime: дата
+        """
+        return datetime.fromtimestamp(int(timestamp), timezone(timedelta(minutes=int(offset))))
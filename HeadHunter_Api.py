@@ -1,70 +1,81 @@
-import requests
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from HeadHunter_Client import HeadHunter_Client
+from HeadHunter_Journal import HeadHunter_Journal
+from HeadHunter_Planner import HeadHunter_Planner
+from HeadHunter_Writer import HeadHunter_Writer
 
-class HeadHunter_Vacancies:
-    def __init__(self):
-        self.dates = []
-        self.__initialize_dates()
-
-    def get_vacancies(self):
-        """Создаёт файл со списком вакансий за определенный день"""
-        all_vacancies = []
-        for i in range(len(self.dates) - 1):
-            all_vacancies.extend(self.__read_vacancies(self.dates[i], self.dates[i + 1]))
 
-        df = pd.DataFrame.from_dict(all_vacancies)
-        df.to_csv('vacancies_from_HH.csv', index=False)
+class HeadHunter_Vacancies:
+    def __init__(self, client=None):
+        """Инициализирует класс HeadHunter_Vacancies
+            Args:
+                client(HeadHunter_Client): клиент API, по умолчанию - с настройками по умолчанию
+        """
+        self.client = client or HeadHunter_Client()
+        self.planner = HeadHunter_Planner(self.client)
+        self.windows = []
 
-    def __initialize_dates(self):
-        """Инициализирует промежутки времени"""
-        date1 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=0, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date2 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=4, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date3 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=8, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date4 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=12, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date5 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=16, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date6 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=20, minute=0,
-                                                                                             second=0).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        date7 = datetime.strptime('2022-12-20T00:00:00+0300', '%Y-%m-%dT%H:%M:%S%z').replace(hour=23, minute=59,
-                                                                                             second=59).strftime(
-            '%Y-%m-%dT%H:%M:%S')
-        self.dates = [date1, date2, date3, date4, date5, date6, date7]
+    def get_vacancies(self, file_name='vacancies_from_HH.csv', start=datetime(2022, 12, 20),
+                      end=datetime(2022, 12, 20, 23, 59, 59)):
+        """Создаёт файл со списком вакансий за промежуток времени. Промежуток делится на окна так,
+        чтобы в каждом API отдавало все вакансии, страницы всех окон загружаются параллельно.
+        Страницы записываются в хронологическом порядке, как только получены все предыдущие
+            Args:
+                file_name(str): файл для записи вакансий
+                start(datetime): начало промежутка
+                end(datetime): конец промежутка (включительно)
+        """
+        self.windows = self.planner.plan(start, end)
+        order = [(date_from, page) for date_from, _, json in self.windows for page in range(max(json['pages'], 1))]
+        position = 0
+        waiting = {}
+        with HeadHunter_Writer(file_name) as writer:
+            for date_from, _, page, json in self.client.get_pages(self.windows):
+                waiting[(date_from, page)] = json
+                while position < len(order) and order[position] in waiting:
+                    writer.write_page(waiting.pop(order[position]))
+                    position += 1
 
-    def __read_vacancies(self, start_date, end_date):
-        """Возвращает список вакансий за определенный промежуток времени"""
-        def try_get_json(page, start_date, end_date):
-            """"""
-            for i in range(50):
-                response = requests.get(
-                    f'https://api.hh.ru/vacancies?specialization=1&per_page=100&page={page}&date_from={start_date}&date_to={end_date}')
-                if response.status_code == 200:
-                    return response.json()
-            raise requests.exceptions.RetryError('Не удалось получить ответ от сервеа')
+    def update_vacancies(self, file_name='vacancies_from_HH.csv', start=datetime(2022, 12, 20),
+                         end=datetime(2022, 12, 20, 23, 59, 59), journal=None, now=None):
+        """Дописывает в файл вакансии за промежуток времени, сохраняя ход загрузки в журнале.
+        Промежуток делится по календарным дням, уже загруженные дни и страницы пропускаются, вакансии
+        с уже записанными идентификаторами не записываются повторно. Страницы дописываются в файл пачками
+        по мере получения и отмечаются в журнале вместе с записью, поэтому в памяти не накапливаются
+        вакансии всего промежутка, а прерванную загрузку можно продолжить повторным вызовом. Окна, которые
+        ещё не закончились, в журнал не записываются и загружаются заново при следующем вызове.
+            Args:
+                file_name(str): файл для записи вакансий
+                start(datetime): начало промежутка
+                end(datetime): конец промежутка (включительно)
+                journal(HeadHunter_Journal): журнал загрузки, по умолчанию - hh_journal.sqlite
+                now(datetime): текущее время, по умолчанию - datetime.now()
+        """
+        journal = journal or HeadHunter_Journal()
+        now = now or datetime.now()
+        day = datetime(start.year, start.month, start.day)
+        while day <= end:
+            day_end = day + timedelta(days=1) - timedelta(seconds=1)
+            if not journal.is_day_completed(day.strftime('%Y-%m-%d')):
+                self.__update_window(file_name, max(start, day), min(end, day_end), journal, now)
+                if start <= day and day_end <= end and day_end < now:
+                    journal.complete_day(day.strftime('%Y-%m-%d'))
+            day += timedelta(days=1)
 
-        json = requests.get(
-            f'https://api.hh.ru/vacancies?specialization=1&per_page=100&date_from={start_date}&date_to={end_date}').json()
-        pages = json['pages']
-        vacancies = []
-        for page in range(pages):
-            json = try_get_json(page, start_date, end_date)
-            for vacancy in json['items']:
-                new_vacancy = {'name': vacancy['name'],
-                               'salary_from': vacancy['salary']['from'] if vacancy['salary'] else None,
-                               'salary_to': vacancy['salary']['to'] if vacancy['salary'] else None,
-                               'salary_currency': vacancy['salary']['currency'] if vacancy['salary'] else None,
-                               'area_name': vacancy['area']['name'],
-                               'published_at': vacancy['published_at']}
-                vacancies.append(new_vacancy)
-        return vacancies
+    def __update_window(self, file_name, start, end, journal, now):
+        """Дописывает в файл вакансии за промежуток внутри одного дня, отмечая записанные страницы в журнале"""
+        windows = self.planner.plan(start, end)
+        self.windows.extend(windows)
+        completed_pages = journal.get_completed_pages(windows)
+        journal.restore_output(file_name)
+        written_pages = []
+        with HeadHunter_Writer(file_name, append=True) as writer:
+            for date_from, date_to, page, json in self.client.get_pages(windows, completed_pages):
+                is_new = journal.add_vacancies([vacancy['id'] for vacancy in json['items']])
+                if datetime.strptime(date_to, HeadHunter_Planner.date_format) < now:
+                    written_pages.append((date_from, date_to, page))
+                if writer.write_page(json, is_new):
+                    journal.complete_pages(written_pages, file_name, writer.size)
+                    written_pages = []
+            journal.complete_pages(written_pages, file_name, writer.flush())
@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+import concurrent.futures
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class RateLimiter:
+    """Класс для ограничения частоты запросов из нескольких потоков.
+        Attributes:
+            interval(float): минимальный промежуток между запросами в секундах
+            next_time(float): время, раньше которого нельзя отправить следующий запрос
+    """
+
+    def __init__(self, requests_per_second):
+        """Инициализирует класс RateLimiter
+            Args:
+                requests_per_second(float): допустимое количество запросов в секунду, None - без ограничения
+        """
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self.next_time = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Ждёт, пока можно будет отправить следующий запрос"""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class HeadHunter_Client:
+    """Класс для запросов вакансий к API HeadHunter: общий пул соединений, ограничение частоты,
+    повторные попытки с экспоненциальной задержкой и параллельная загрузка страниц.
+
+        Attributes:
+            base_url(str): адрес API
+            max_workers(int): количество одновременных запросов
+            max_retries(int): количество попыток для одного запроса
+            backoff(float): начальная задержка перед повтором в секундах
+            max_backoff(float): наибольшая задержка перед повтором в секундах
+            timeout(float): время ожидания ответа в секундах
+            session(Session): сессия с keep-alive соединениями
+            rate_limiter(RateLimiter): ограничение частоты запросов
+    """
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url='https://api.hh.ru', max_workers=8, requests_per_second=10, max_retries=5,
+                 backoff=0.5, max_backoff=30, timeout=10):
+        """Инициализирует класс HeadHunter_Client"""
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_page(self, date_from, date_to, page=0):
+        """Возвращает страницу вакансий за промежуток времени
+            Args:
+                date_from(str): начало промежутка
+                date_to(str): конец промежутка
+                page(int): номер страницы
+            Returns:
+                dict: ответ API
+        """
+        params = {'specialization': 1, 'per_page': 100, 'page': page, 'date_from': date_from, 'date_to': date_to}
+        for attempt in range(self.max_retries):
+            self.rate_limiter.wait()
+            try:
+                response = self.session.get(f'{self.base_url}/vacancies', params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                response = None
+            if response is not None and response.status_code == 200:
+                return response.json()
+            if response is not None and response.status_code not in HeadHunter_Client.retry_statuses:
+                response.raise_for_status()
+            if attempt + 1 < self.max_retries:
+                self.sleep_before_retry(attempt)
+        raise requests.exceptions.RetryError('Не удалось получить ответ от сервеа')
+
+    def sleep_before_retry(self, attempt):
+        """Ждёт перед повторной попыткой: экспоненциальная задержка со случайным разбросом
+            Args:
+                attempt(int): номер неудачной попытки, начиная с 0
+        """
+        time.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+
+    def get_pages(self, windows, completed_pages=frozenset()):
+        """Загружает все страницы всех промежутков параллельно, не более max_workers запросов одновременно.
+        Сначала запрашиваются первые страницы, остальные - как только известно их количество
+            Args:
+                windows(list<tuple>): промежутки времени (начало, конец) или (начало, конец, уже полученная
+                    первая страница), как их возвращает HeadHunter_Planner
+                completed_pages(set<tuple<str, str, int>>): уже загруженные страницы (начало, конец, номер),
+                    которые не запрашиваются и не возвращаются
+            Returns:
+                iterator<tuple<str, str, int, dict>>: начало, конец, номер страницы и ответ API в порядке получения
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            for window in windows:
+                date_from, date_to = window[0], window[1]
+                if len(window) > 2:
+                    future = concurrent.futures.Future()
+                    future.set_result(window[2])
+                else:
+                    future = executor.submit(self.get_page, date_from, date_to, 0)
+                pending[future] = (date_from, date_to, 0)
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    date_from, date_to, page = pending.pop(future)
+                    json = future.result()
+                    if page == 0:
+                        for next_page in range(1, json['pages']):
+                            if (date_from, date_to, next_page) not in completed_pages:
+                                pending[executor.submit(self.get_page, date_from, date_to, next_page)] = \
+                                    (date_from, date_to, next_page)
+                    if (date_from, date_to, page) not in completed_pages:
+                        yield date_from, date_to, page, json
+
+    def close(self):
+        """Закрывает соединения"""
+        self.session.close()
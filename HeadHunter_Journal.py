@@ -0,0 +1,99 @@
+import os
+import sqlite3
+
+
+class HeadHunter_Journal:
+    """Журнал загрузки вакансий HeadHunter в базе SQLite, позволяющий продолжить прерванную загрузку.
+    Хранит загруженные страницы окон, полностью загруженные дни, идентификаторы уже записанных вакансий
+    и размер файла с вакансиями после последней записанной страницы.
+
+        Attributes:
+            con(Connection): соединение с базой данных
+    """
+
+    def __init__(self, database_name='hh_journal.sqlite'):
+        """Инициализирует класс HeadHunter_Journal и создаёт таблицы журнала
+            Args:
+                database_name(str): файл базы данных
+        """
+        self.con = sqlite3.connect(database_name)
+        self.con.execute('CREATE TABLE IF NOT EXISTS pages '
+                         '(date_from TEXT, date_to TEXT, page INTEGER, PRIMARY KEY (date_from, date_to, page))')
+        self.con.execute('CREATE TABLE IF NOT EXISTS days (day TEXT PRIMARY KEY)')
+        self.con.execute('CREATE TABLE IF NOT EXISTS vacancies (id TEXT PRIMARY KEY)')
+        self.con.execute('CREATE TABLE IF NOT EXISTS outputs (file_name TEXT PRIMARY KEY, size INTEGER)')
+        self.con.commit()
+
+    def is_day_completed(self, day):
+        """Проверяет, загружены ли все вакансии за день
+            Args:
+                day(str): день в формате Y-m-d
+            Returns:
+                bool: загружен ли день
+        """
+        return self.con.execute('SELECT 1 FROM days WHERE day = ?', (day,)).fetchone() is not None
+
+    def complete_day(self, day):
+        """Отмечает день как полностью загруженный и удаляет записи о его страницах
+            Args:
+                day(str): день в формате Y-m-d
+        """
+        self.con.execute('INSERT OR IGNORE INTO days VALUES (?)', (day,))
+        self.con.execute('DELETE FROM pages WHERE substr(date_from, 1, 10) = ?', (day,))
+        self.con.commit()
+
+    def get_completed_pages(self, windows):
+        """Возвращает уже загруженные страницы окон
+            Args:
+                windows(list<tuple>): окна, первые два элемента - начало и конец
+            Returns:
+                set<tuple<str, str, int>>: начало, конец и номер загруженной страницы
+        """
+        completed_pages = set()
+        for window in windows:
+            completed_pages.update(self.con.execute('SELECT date_from, date_to, page FROM pages '
+                                                    'WHERE date_from = ? AND date_to = ?', window[:2]))
+        return completed_pages
+
+    def restore_output(self, file_name):
+        """Обрезает файл с вакансиями до размера после последней записанной страницы,
+        чтобы строки страницы, не отмеченной в журнале, не записались дважды
+            Args:
+                file_name(str): файл с вакансиями
+            Returns:
+                int: размер файла
+        """
+        row = self.con.execute('SELECT size FROM outputs WHERE file_name = ?', (file_name,)).fetchone()
+        size = row[0] if row else 0
+        if os.path.exists(file_name) and os.path.getsize(file_name) > size:
+            os.truncate(file_name, size)
+        return os.path.getsize(file_name) if os.path.exists(file_name) else 0
+
+    def add_vacancies(self, ids):
+        """Добавляет идентификаторы вакансий в журнал, не сохраняя изменения
+            Args:
+                ids(list<str>): идентификаторы вакансий страницы
+            Returns:
+                list<bool>: для каждой вакансии - встречается ли она впервые
+        """
+        is_new = []
+        for vacancy_id in ids:
+            cursor = self.con.execute('INSERT OR IGNORE INTO vacancies VALUES (?)', (vacancy_id,))
+            is_new.append(cursor.rowcount == 1)
+        return is_new
+
+    def complete_pages(self, pages, file_name, size):
+        """Отмечает страницы как записанные и сохраняет изменения одной транзакцией
+            Args:
+                pages(list<tuple<str, str, int>>): начало, конец окна и номер страницы; только страницы окон,
+                    которые уже закончились и больше не изменятся
+                file_name(str): файл с вакансиями
+                size(int): размер файла после записи страниц
+        """
+        self.con.executemany('INSERT OR IGNORE INTO pages VALUES (?, ?, ?)', pages)
+        self.con.execute('INSERT OR REPLACE INTO outputs VALUES (?, ?)', (file_name, size))
+        self.con.commit()
+
+    def close(self):
+        """Закрывает соединение с базой данных"""
+        self.con.close()
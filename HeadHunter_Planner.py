@@ -0,0 +1,74 @@
+import concurrent.futures
+import warnings
+from datetime import timedelta
+
+
+class HeadHunter_Planner:
+    """Класс для разбиения промежутка времени на окна, в каждом из которых API HeadHunter отдаёт все вакансии.
+    API возвращает не больше pages * per_page (2000) вакансий на запрос, поэтому окна, где найдено больше,
+    делятся пополам, пока не уложатся в ограничение. Первая страница каждого окна сохраняется, чтобы не
+    запрашивать её повторно при загрузке. Если окно длиной min_window всё ещё превышает ограничение,
+    часть его вакансий загрузить нельзя: такие окна сохраняются в truncated_windows и о них выдаётся предупреждение.
+
+        Attributes:
+            client(HeadHunter_Client): клиент API
+            min_window(timedelta): окно короче этого больше не делится
+            truncated_windows(list<tuple<str, str, int>>): начало, конец и количество потерянных вакансий окон
+                последнего plan, которые не удалось уложить в ограничение
+            date_format(str): формат дат в запросах
+    """
+    date_format = '%Y-%m-%dT%H:%M:%S'
+
+    def __init__(self, client, min_window=timedelta(minutes=1)):
+        """Инициализирует класс HeadHunter_Planner
+            Args:
+                client(HeadHunter_Client): клиент API
+                min_window(timedelta): наименьшая длина окна
+        """
+        self.client = client
+        self.min_window = min_window
+        self.truncated_windows = []
+
+    def plan(self, start, end):
+        """Разбивает промежуток на окна, запрашивая окна одного уровня деления параллельно
+            Args:
+                start(datetime): начало промежутка
+                end(datetime): конец промежутка (включительно)
+            Returns:
+                list<tuple<str, str, dict>>: начало, конец и первая страница каждого окна в хронологическом порядке
+        """
+        windows = []
+        self.truncated_windows = []
+        level = [(start, end)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.client.max_workers) as executor:
+            while level:
+                first_pages = executor.map(lambda window: self.client.get_page(
+                    window[0].strftime(self.date_format), window[1].strftime(self.date_format)), level)
+                next_level = []
+                for (date_from, date_to), json in zip(level, first_pages):
+                    if self.is_truncated(json) and date_to - date_from > self.min_window:
+                        middle = date_from + (date_to - date_from) // 2
+                        middle = middle.replace(microsecond=0)
+                        next_level.extend([(date_from, middle), (middle + timedelta(seconds=1), date_to)])
+                    else:
+                        window = (date_from.strftime(self.date_format), date_to.strftime(self.date_format), json)
+                        windows.append(window)
+                        if self.is_truncated(json):
+                            self.truncated_windows.append((window[0], window[1],
+                                                           json['found'] - json['pages'] * json.get('per_page', 100)))
+                level = next_level
+        if self.truncated_windows:
+            warnings.warn(f'В {len(self.truncated_windows)} окнах короче {self.min_window} найдено больше вакансий, '
+                          f'чем отдаёт API, не будут загружены '
+                          f'{sum(lost for _, _, lost in self.truncated_windows)} вакансий: {self.truncated_windows}')
+        return sorted(windows, key=lambda window: window[0])
+
+    @staticmethod
+    def is_truncated(json):
+        """Проверяет, найдено ли в окне больше вакансий, чем API может отдать
+            Args:
+                json(dict): первая страница ответа API
+            Returns:
+                bool: нужно ли делить окно
+        """
+        return json['found'] > json['pages'] * json.get('per_page', 100)
@@ -0,0 +1,100 @@
+import csv
+import os
+
+
+class HeadHunter_Writer:
+    """Класс для потоковой записи вакансий из ответов API HeadHunter в csv файл.
+    Каждая страница сразу раскладывается по столбцам без промежуточных словарей вакансий, строки копятся
+    в буфере и записываются через csv.writer пачками по batch_size строк.
+
+        Attributes:
+            file_name(str): файл с вакансиями
+            batch_size(int): количество строк, после которого буфер записывается в файл
+            columns(list<list>): буфер по столбцам name, salary_from, salary_to, salary_currency, area_name,
+                published_at
+            size(int): размер файла после последней записи буфера
+    """
+    header = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+
+    def __init__(self, file_name, append=False, batch_size=5000):
+        """Инициализирует класс HeadHunter_Writer и открывает файл
+            Args:
+                file_name(str): файл с вакансиями
+                append(bool): дописывать в существующий файл, заголовок пишется только в пустой файл
+                batch_size(int): размер пачки строк
+        """
+        self.file_name = file_name
+        self.batch_size = batch_size
+        self.columns = [[] for _ in HeadHunter_Writer.header]
+        self.file = open(file_name, 'a' if append else 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file, lineterminator='\n')
+        if self.file.tell() == 0:
+            self.writer.writerow(HeadHunter_Writer.header)
+        self.size = 0
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def extract_columns(json, columns, is_new=None):
+        """Раскладывает вакансии страницы по столбцам. Зарплаты записываются как float, как их пишет pandas
+            Args:
+                json(dict): страница ответа API
+                columns(list<list>): столбцы, в которые добавляются значения
+                is_new(list<bool>): какие вакансии страницы добавлять, None - все
+        """
+        names, salaries_from, salaries_to, currencies, areas, dates = columns
+        items = json['items']
+        if is_new is not None:
+            items = [vacancy for vacancy, new in zip(items, is_new) if new]
+        for vacancy in items:
+            names.append(vacancy['name'])
+            salary = vacancy['salary']
+            if salary:
+                salary_from, salary_to = salary['from'], salary['to']
+                salaries_from.append(None if salary_from is None else float(salary_from))
+                salaries_to.append(None if salary_to is None else float(salary_to))
+                currencies.append(salary['currency'])
+            else:
+                salaries_from.append(None)
+                salaries_to.append(None)
+                currencies.append(None)
+            areas.append(vacancy['area']['name'])
+            dates.append(vacancy['published_at'])
+
+    def write_page(self, json, is_new=None):
+        """Добавляет вакансии страницы в буфер и записывает его, когда он заполнен
+            Args:
+                json(dict): страница ответа API
+                is_new(list<bool>): какие вакансии страницы записывать, None - все
+            Returns:
+                bool: был ли буфер записан в файл
+        """
+        HeadHunter_Writer.extract_columns(json, self.columns, is_new)
+        if len(self.columns[0]) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self):
+        """Записывает буфер в файл
+            Returns:
+                int: размер файла после записи
+        """
+        if self.columns[0]:
+            self.writer.writerows(zip(*self.columns))
+            for column in self.columns:
+                column.clear()
+        self.file.flush()
+        self.size = os.path.getsize(self.file_name)
+        return self.size
+
+    def close(self):
+        """Записывает буфер и закрывает файл"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
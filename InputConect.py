@@ -2,9 +2,14 @@ import csv
 import re
 import sys
 import math
+import numpy as np
 import prettytable
 from prettytable import PrettyTable
-from datetime import datetime
+
+from VacancyFilter import VacancyFilter
+from VacancyIndex import VacancyIndex
+from VacancySorter import VacancySorter
+from VacancyTable import VacancyTable, VacancyView
 
 class InputConect:
     """Класс для печатанья таблицы по вакансиям.
@@ -14,10 +19,37 @@ class InputConect:
             work_experience_convertor_weight(dict<str, int>): Вес опыта
             formatter_dic(dict<str, str or datetime or list>): Преобразует строку к правильному виду
             filters(dict<str, lambda>): Как должны фильтроваться те или иные поля
-            sorting_rules(dict<str, lambda>): Как должны сортироваться те или иные поля
+            sorting_rules(dict<str, lambda>): Как должны сортироваться те или иные поля, если вакансии не из VacancyTable
+            sorter(VacancySorter): Сортировка по ключам, посчитанным для всей таблицы, или None
             fields(list<str>): Требуемые столбцы
             vacancy_numbers(int): количество вакансий
+            start(int): номер первой выводимой вакансии среди отсортированных, начиная с 0
+            end(int): номер после последней выводимой вакансии
+            table(PrettyTable): Таблица только из выводимых вакансий
         """
+    decoding = {"noExperience": "Нет опыта",
+                "between1And3": "От 1 года до 3 лет",
+                "between3And6": "От 3 до 6 лет",
+                "moreThan6": "Более 6 лет",
+                "AZN": "Манаты",
+                "BYR": "Белорусские рубли",
+                "EUR": "Евро",
+                "GEL": "Грузинский лари",
+                "KGS": "Киргизский сом",
+                "KZT": "Тенге",
+                "RUR": "Рубли",
+                "UAH": "Гривны",
+                "USD": "Доллары",
+                "UZS": "Узбекский сум",
+                'True': 'Да',
+                'False': 'Нет'
+                }
+    work_experience_convertor_weight = {
+        "noExperience": 0,
+        "between1And3": 1,
+        "between3And6": 2,
+        "moreThan6": 3
+    }
 
     def __init__(self, dataset):
         """Инициализирует класс InputConnect
@@ -37,29 +69,6 @@ class InputConect:
                                  'area_name': 'Название региона',
                                  'published_at': 'Дата и время публикации вакансии'
                                  }
-        self.decoding = {"noExperience": "Нет опыта",
-                         "between1And3": "От 1 года до 3 лет",
-                         "between3And6": "От 3 до 6 лет",
-                         "moreThan6": "Более 6 лет",
-                         "AZN": "Манаты",
-                         "BYR": "Белорусские рубли",
-                         "EUR": "Евро",
-                         "GEL": "Грузинский лари",
-                         "KGS": "Киргизский сом",
-                         "KZT": "Тенге",
-                         "RUR": "Рубли",
-                         "UAH": "Гривны",
-                         "USD": "Доллары",
-                         "UZS": "Узбекский сум",
-                         'True': 'Да',
-                         'False': 'Нет'
-                         }
-        self.work_experience_convertor_weight = {
-            "noExperience": 0,
-            "between1And3": 1,
-            "between3And6": 2,
-            "moreThan6": 3
-        }
         self.formatter_dic = {
             'Название': lambda vacancy: vacancy.name,
             'Описание': lambda vacancy: vacancy.description,
@@ -69,72 +78,164 @@ class InputConect:
             'Компания': lambda vacancy: vacancy.employer_name,
             'Оклад': lambda vacancy: self.format_salary_information(vacancy),
             'Название региона': lambda vacancy: vacancy.area_name,
-            'Дата публикации вакансии': lambda vacancy: vacancy.published_at.strftime('%d.%m.%Y'),
+            'Дата публикации вакансии': lambda vacancy: InputConect.format_date(vacancy.published_at),
         }
         self.filters = {
             'Компания': lambda employer_name, vacancy: employer_name == vacancy.employer_name,
-            'Оклад': lambda salary, vacancy: int(float(vacancy.salary.salary_from)) <= int(float(salary)) <= int(
-                float(vacancy.salary.salary_to)),
-            'Дата публикации вакансии': lambda date, vacancy: date == vacancy.published_at.strftime('%d.%m.%Y'),
+            'Оклад': lambda salary, vacancy: self.is_salary_in_range(VacancyIndex.get_salary_range(salary), vacancy),
+            'Дата публикации вакансии': lambda date, vacancy: date == InputConect.format_date(vacancy.published_at),
             'Навыки': lambda skills, vacancy: set(skills.split(', ')).issubset(vacancy.key_skills),
             'Опыт работы': lambda experience_id, vacancy: experience_id == self.decoding[vacancy.experience_id],
             'Премиум-вакансия': lambda premium, vacancy: premium == self.decoding[vacancy.premium],
             'Идентификатор валюты оклада': lambda salary_currency, vacancy: salary_currency == self.decoding[
-                vacancy.salary_currency],
+                vacancy.salary.salary_currency],
             'Название': lambda name, vacancy: name == vacancy.name,
             'Название региона': lambda area_name, vacancy: area_name == vacancy.area_name,
         }
         self.sorting_rules = {
             'Навыки': lambda vacancy: len(vacancy.key_skills),
-            'Оклад': lambda vacancy: ((float(vacancy.salary.salary_from) + float(vacancy.salary.salary_to)) / 2) *
-                                     self.currency_to_rub[
-                                         vacancy.salary_currency],
-            'Дата публикации вакансии': lambda vacancy: datetime.strptime(vacancy.published_at, '%Y-%m-%dT%H:%M:%S%z'),
+            'Оклад': lambda vacancy: (vacancy.salary.salary_from + vacancy.salary.salary_to) / 2,
+            'Дата публикации вакансии': lambda vacancy: vacancy.published_at,
             'Компания': lambda vacancy: vacancy.employer_name,
             'Опыт работы': lambda vacancy: self.work_experience_convertor_weight[vacancy.experience_id],
             'Премиум-вакансия': lambda vacancy: self.decoding[vacancy.premium],
             'Название региона': lambda vacancy: vacancy.area_name,
             'Название': lambda vacancy: vacancy.name,
-            'Идентификатор валюты оклада': lambda vacancy: self.decoding(vacancy.salary_currency)
+            'Идентификатор валюты оклада': lambda vacancy: self.decoding[vacancy.salary.salary_currency]
         }
 
+        self.sorter = None
+        if isinstance(dataset.vacancies_objects, VacancyTable):
+            self.sorter = VacancySorter(dataset.vacancies_objects, {
+                'Опыт работы': self.work_experience_convertor_weight.get,
+                'Премиум-вакансия': self.decoding.get,
+                'Идентификатор валюты оклада': self.decoding.get})
         self.fields = dataset.fields
         self.vacancy_numbers = dataset.vacancy_numbers
-        data_vacancies = self.get_filtered_data_vacancies(dataset.vacancies_objects, dataset.filtering_parameter)
-        self.sort_data_vacancies(data_vacancies, dataset.sorting_parameter, dataset.is_reverse_sorting)
-        self.table = self.create_table(data_vacancies)
+        data_vacancies = self.get_filtered_data_vacancies(dataset.vacancies_objects, dataset.filtering_parameter,
+                                                          getattr(dataset, 'vacancy_index', None))
+        if len(data_vacancies) == 0:
+            print('Нет данных')
+            sys.exit()
+        self.start, self.end = self.get_range(self.vacancy_numbers, len(data_vacancies))
+        data_vacancies = self.select_data_vacancies(data_vacancies, dataset.sorting_parameter,
+                                                    dataset.is_reverse_sorting, self.start, self.end)
+        self.table = self.create_table(data_vacancies, self.start)
 
-    def get_filtered_data_vacancies(self, dataset, filtering_parameter):
-        """Филтурет вакансии по переданному параметру
+    def get_filtered_data_vacancies(self, dataset, filtering_parameter, index=None):
+        """Филтурет вакансии по переданным условиям. Вакансии из VacancyTable фильтруются через VacancyFilter
+        по индексам по полям без проверки каждой строки и возвращаются номерами строк, а не вакансиями
         Args:
-            dataset(list<Vacancy>): Список вакансий
-            filtering_parameter(str): Параметр фильтрации
+            dataset(VacancyTable or list<Vacancy>): Вакансии
+            filtering_parameter(str): Условия фильтрации через '; '
+            index(VacancyIndex): Индексы по полям dataset, если их нет, для VacancyTable они строятся здесь
         Resturns:
-            list<Vacancy>
+            ndarray<int> or list<Vacancy>: номера подходящих строк VacancyTable по возрастанию или вакансии
         """
-        if filtering_parameter != '':
-            parameters = filtering_parameter.split(': ')
-            filter_name = parameters[0]
-            filter_value = parameters[1]
-            filtered_data_vacancies = [row for row in dataset if self.filters[filter_name](filter_value, row)]
-            if len(filtered_data_vacancies) == 0:
-                print('Ничего не найдено')
-                sys.exit()
-            return filtered_data_vacancies
-        return dataset
+        predicates = VacancyFilter.parse(filtering_parameter)
+        if isinstance(dataset, VacancyTable):
+            if len(predicates) == 0:
+                return np.arange(len(dataset))
+            if index is None or index.table is not dataset:
+                index = VacancyIndex(dataset, self.decoding)
+            filtered_data_vacancies = VacancyFilter(index).get_indices(predicates)
+        elif len(predicates) == 0:
+            return list(dataset)
+        else:
+            filtered_data_vacancies = [row for row in dataset if all(
+                self.filters[filter_name](filter_value, row) for filter_name, filter_value in predicates)]
+        if len(filtered_data_vacancies) == 0:
+            print('Ничего не найдено')
+            sys.exit()
+        return filtered_data_vacancies
+
+    @staticmethod
+    def is_salary_in_range(salary_range, vacancy):
+        """Проверяет, пересекается ли вилка оклада вакансии с диапазоном. Для одного числа это то же,
+        что salary_from <= число <= salary_to
+        Args:
+            salary_range(tuple<int, int>): Нижняя и верхняя граница диапазона
+            vacancy(Vacancy): Вакансия
+        Returns:
+            bool
+        """
+        low, high = salary_range
+        salary_from, salary_to = int(float(vacancy.salary.salary_from)), int(float(vacancy.salary.salary_to))
+        return low <= high and salary_from <= salary_to and salary_from <= high and low <= salary_to
+
+    @staticmethod
+    def format_date(published_at):
+        """Приводит дату публикации к виду d.m.Y
+        Args:
+            published_at(datetime): Дата публикации или None, если она некорректна
+        Returns:
+            str: Дата или пустая строка
+        """
+        return published_at.strftime('%d.%m.%Y') if published_at is not None else ''
 
     def sort_data_vacancies(self, data_vacancies, sorting_parameter, is_reverse_sorting):
-        """Сортирует вакансии по переданному параметру
+        """Сортирует вакансии по переданным параметрам. Вакансии из VacancyTable сортируются по заранее
+        посчитанным ключам, остальные - через sorting_rules. Вакансии с равными ключами сохраняют порядок
         Args:
             data_vacancies(list<Vacancy>): Список вакансий
-            sorting_parameter(str): Параметр сортировки
-            is_reverse_sorting(str): Порядок сортировки(Да - прямой, Нет - обратный)
-        Resturns:
-            list<Vacancy>
+            sorting_parameter(str): Параметры сортировки через ', ', первый - главный
+            is_reverse_sorting(str): Порядок сортировки(Да - обратный, Нет - прямой) для всех параметров
+                или для каждого через ', '
         """
-        if sorting_parameter != '':
-            is_reverse = False if is_reverse_sorting == 'Нет' or is_reverse_sorting == '' else True
-            data_vacancies.sort(key=self.sorting_rules[sorting_parameter], reverse=is_reverse)
+        sort_fields = VacancySorter.parse_parameters(sorting_parameter, is_reverse_sorting)
+        if len(sort_fields) == 0:
+            return
+        if self.is_from_sorter_table(data_vacancies):
+            indices = self.sorter.sort([vacancy.index for vacancy in data_vacancies], sort_fields)
+            data_vacancies[:] = [VacancyView(self.sorter.table, index) for index in indices.tolist()]
+            return
+        for field, is_reverse in reversed(sort_fields):
+            data_vacancies.sort(key=self.sorting_rules[field], reverse=is_reverse)
+
+    @staticmethod
+    def get_range(vacancy_numbers, vacancies_count):
+        """Возвращает диапазон вывода так же, как его понимал срез get_string(start, end)
+        Args:
+            vacancy_numbers(str): Диапазон вывода: первый номер и номер после последнего через пробел
+            vacancies_count(int): Количество вакансий
+        Returns:
+            tuple<int, int>: места первой вакансии и после последней, начиная с 0
+        """
+        vacancy_numbers = vacancy_numbers.split(' ') if vacancy_numbers != '' else []
+        start = int(vacancy_numbers[0]) - 1 if len(vacancy_numbers) >= 1 else 0
+        end = int(vacancy_numbers[1]) - 1 if len(vacancy_numbers) == 2 else vacancies_count
+        start, end, _ = slice(start, end).indices(vacancies_count)
+        return start, max(start, end)
+
+    def select_data_vacancies(self, data_vacancies, sorting_parameter, is_reverse_sorting, start, end):
+        """Возвращает вакансии, которые после сортировки оказались бы на местах с start по end.
+        Номера строк VacancyTable не сортируются целиком, а выбираются через VacancySorter.select,
+        и VacancyView создаются только для выбранных строк
+        Args:
+            data_vacancies(ndarray<int> or list<Vacancy>): Номера строк таблицы sorter или список вакансий
+            sorting_parameter(str): Параметры сортировки
+            is_reverse_sorting(str): Порядок сортировки
+            start(int): место первой вакансии
+            end(int): место после последней вакансии
+        Returns:
+            list<Vacancy>: Выбранные вакансии по порядку
+        """
+        sort_fields = VacancySorter.parse_parameters(sorting_parameter, is_reverse_sorting)
+        if isinstance(data_vacancies, np.ndarray):
+            indices = self.sorter.select(data_vacancies, sort_fields, start, end)
+            return [VacancyView(self.sorter.table, index) for index in indices.tolist()]
+        self.sort_data_vacancies(data_vacancies, sorting_parameter, is_reverse_sorting)
+        return data_vacancies[start:end]
+
+    def is_from_sorter_table(self, data_vacancies):
+        """Проверяет, что все вакансии - строки таблицы, для которой посчитаны ключи sorter
+        Args:
+            data_vacancies(list<Vacancy>): Список вакансий
+        Returns:
+            bool
+        """
+        return self.sorter is not None and all(isinstance(vacancy, VacancyView) and vacancy.table is self.sorter.table
+                                               for vacancy in data_vacancies)
 
     def formatter(self, vacancy):
         """Форматирует вакансию к стандартному виду
@@ -164,20 +265,18 @@ class InputConect:
             if len(value) > 100:
                 vacancy[key] = value[:100] + '...'
 
-    def create_table(self, data_vacancies):
-        """Создаёт таблицу
+    def create_table(self, data_vacancies, start=0):
+        """Создаёт таблицу, форматируя только переданные вакансии
         Args:
-            data_vacancies(dict<str,str>)
+            data_vacancies(list<Vacancy>): Выводимые вакансии
+            start(int): место первой вакансии среди всех отсортированных, от него считаются номера строк
         Returns:
             PrettyTable: Таблица
         """
-        if len(data_vacancies) == 0:
-            print('Нет данных')
-            sys.exit()
         table = PrettyTable()
-        columns = ['№'] + list(self.formatter(data_vacancies[0]).keys())
+        columns = ['№'] + list(self.formatter_dic.keys())
         table.field_names = columns
-        for index, vacancy in enumerate(data_vacancies):
+        for index, vacancy in enumerate(data_vacancies, start):
             formatted_vacancy = self.formatter(vacancy)
             self.format_vacancy_for_table(formatted_vacancy)
             table.add_row([str(index + 1)] + list(formatted_vacancy.values()))
@@ -187,12 +286,9 @@ class InputConect:
         return table
 
     def print_table(self):
-        """Печатает таблицу"""
-        vacancy_numbers = self.vacancy_numbers.split(' ') if self.vacancy_numbers != '' else []
+        """Печатает таблицу. В ней уже только вакансии из диапазона вывода"""
         fields = ['№'] + self.fields.split(', ') if self.fields != '' else self.table.field_names
-        start = int(vacancy_numbers[0]) - 1 if len(vacancy_numbers) >= 1 else 0
-        end = int(vacancy_numbers[1]) - 1 if len(vacancy_numbers) == 2 else len(self.table.rows)
-        print(self.table.get_string(start=start, end=end, fields=fields))
+        print(self.table.get_string(fields=fields))
 
     def format_salary_information(self, vacancy):
         """Приводит информацию  о зарплате к стандатному виду для таблицы
@@ -1,30 +1,86 @@
+import os
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from Currency_Controller import Currency_Controller
+from DateParser import DateParser
+from ShardStorage import ShardStorage
 from Vacancies_Controller import Vacancies_Controller
 
 
 class Separator:
-    def __init__(self):
+    def __init__(self, shard_format='csv'):
+        self.shard_storage = ShardStorage(shard_format)
         self.main_df = None
         self.folder_name = None
         self.unique_years = None
         self.folder_regions_name  = None
         self.unique_regions  = None
 
-    def create_files_separated_by_years(self, file_name):
-        """Разделяет файлы по годам и оставляя лишь поля name, area_name, published_at, salary"""
+    def create_files_separated_by_years(self, file_name, chunk_size=None, write_files=True):
+        """Разделяет файлы по годам и оставляя лишь поля name, area_name, published_at, salary
+            Args:
+                file_name(str): файл с вакансиями
+                chunk_size(int): если задан, файл читается частями по chunk_size строк и main_df не сохраняется.
+                    Части дописываются в файлы по годам, поэтому формат feather с chunk_size не поддерживается
+                write_files(bool): записывать ли файлы по годам сразу. Если нет, вакансии остаются только в main_df,
+                    а файлы записываются позже write_files_separated_by_years. С chunk_size файлы пишутся всегда
+            Raises:
+                ValueError: задан chunk_size для формата feather
+        """
+        if chunk_size is not None and self.shard_storage.shard_format == 'feather':
+            raise ValueError('Формат feather не поддерживает дозапись, используйте csv или parquet')
+        self.folder_name = "csv_files"
+        os.makedirs(self.folder_name, exist_ok=True)
+        if chunk_size is not None:
+            self.__stream_files_separated_by_years(file_name, chunk_size)
+            return
+
         df = pd.read_csv(file_name)
         Vacancies_controller = Vacancies_Controller()
         df = Vacancies_controller.get_formatted_dataframe(df)
         df = df.dropna()
-        df["years"] = df["published_at"].apply(lambda s: datetime.strptime(s, '%Y-%m-%dT%H:%M:%S%z').year)
-        years = df["years"].unique()
-        for year in years:
-            data = df[df["years"] == year]
-            data.iloc[:, :-1].to_csv(rf"csv_files\part_{year}.csv", index=False)
+        df["years"] = DateParser.get_years(df["published_at"])
         self.main_df = df
-        self.unique_years = years
-        self.folder_name = "csv_files"
+        self.unique_years = df["years"].unique()
+        if write_files:
+            self.write_files_separated_by_years()
+
+    def write_files_separated_by_years(self):
+        """Записывает вакансии из main_df в файлы по годам"""
+        for year, data in self.main_df.groupby("years", sort=False):
+            self.shard_storage.write(data.iloc[:, :-1], self.get_year_file_path(year))
+
+    def __stream_files_separated_by_years(self, file_name, chunk_size):
+        """Разделяет файл по годам за один проход, держа в памяти не более chunk_size строк
+            Args:
+                file_name(str): файл с вакансиями
+                chunk_size(int): количество строк в одной части
+        """
+        currencies = Currency_Controller.get_frequent_currencies(
+            Currency_Controller.count_currencies(file_name, chunk_size))
+        Vacancies_controller = Vacancies_Controller()
+        writers = {}
+        try:
+            for chunk in pd.read_csv(file_name, chunksize=chunk_size):
+                chunk = Vacancies_controller.get_formatted_dataframe(chunk, currencies).dropna()
+                for year, data in chunk.groupby(DateParser.get_years(chunk["published_at"]), sort=False):
+                    if year not in writers:
+                        writers[year] = self.shard_storage.open_writer(self.get_year_file_path(year))
+                    writers[year].write(data)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        self.main_df = None
+        self.unique_years = np.array(list(writers), dtype=int)
+
+    def get_year_file_path(self, year):
+        """Возвращает путь до файла с вакансиями за год
+            Args:
+                year(int): год
+            Returns:
+                str: путь до файла
+        """
+        return self.shard_storage.get_path(self.folder_name, f"part_{year}")
 
     def create_files_separated_by_region(self, file_name):
         """Разделяет файлы по городам и оставляя лишь поля name, area_name, published_at, salary"""
@@ -32,13 +88,14 @@ class Separator:
         Vacancies_controller = Vacancies_Controller()
         df = Vacancies_controller.get_formatted_dataframe(df)
         df = df.dropna()
+        self.folder_regions_name = "regions"
+        os.makedirs(self.folder_regions_name, exist_ok=True)
         regions = df["area_name"].unique()
         self.unique_regions = []
         for region in regions:
             data = df[df["area_name"] == region]
             if len(data) >= len(df) / 100:
                 self.unique_regions.append(region)
-                data.to_csv(rf"regions\{region}.csv", index=False)
+                self.shard_storage.write(data, self.shard_storage.get_path(self.folder_regions_name, region))
         self.main_df = df
-        self.folder_regions_name = "regions"
 
@@ -0,0 +1,169 @@
+import os
+import numpy as np
+import pandas as pd
+
+from DateParser import DateParser
+
+
+class ShardStorage:
+    """Класс для записи и чтения частей файла вакансий (по годам или по регионам).
+    Кроме csv поддерживаются колоночные форматы parquet и feather: зарплата хранится как float32,
+    name и area_name - как словарные (category) столбцы, published_at - как целое число ГГГГММДД.
+    Для колоночных форматов нужен пакет pyarrow.
+
+        Attributes:
+            shard_format(str): формат частей: csv, parquet или feather
+            extension(str): расширение файлов выбранного формата
+    """
+    extensions = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}
+
+    def __init__(self, shard_format='csv'):
+        """Инициализирует класс ShardStorage
+            Args:
+                shard_format(str): формат частей
+        """
+        if shard_format not in ShardStorage.extensions:
+            raise ValueError(f'Неизвестный формат частей: {shard_format}')
+        self.shard_format = shard_format
+        self.extension = ShardStorage.extensions[shard_format]
+
+    def get_path(self, folder_name, name):
+        """Возвращает путь до части
+            Args:
+                folder_name(str): папка с частями
+                name(str): название части без расширения
+            Returns:
+                str: путь до файла
+        """
+        return os.path.join(folder_name, f"{name}{self.extension}")
+
+    def write(self, df, file_path):
+        """Записывает dataframe в часть целиком
+            Args:
+                df(dataframe): вакансии
+                file_path(str): путь до файла
+        """
+        if self.shard_format == 'csv':
+            df.to_csv(file_path, index=False)
+        elif self.shard_format == 'parquet':
+            ShardStorage.to_typed(df).to_parquet(file_path, index=False, compression='zstd')
+        else:
+            ShardStorage.to_typed(df).reset_index(drop=True).to_feather(file_path, compression='zstd')
+
+    def open_writer(self, file_path):
+        """Открывает часть для последовательной дозаписи
+            Args:
+                file_path(str): путь до файла
+            Returns:
+                ShardWriter: объект с методами write(df) и close()
+        """
+        if self.shard_format == 'csv':
+            return CsvShardWriter(file_path)
+        if self.shard_format == 'parquet':
+            return ParquetShardWriter(file_path)
+        raise ValueError('Формат feather не поддерживает дозапись, используйте csv или parquet')
+
+    def read(self, file_path, columns=None):
+        """Читает часть, загружая только нужные столбцы
+            Args:
+                file_path(str): путь до файла
+                columns(list<str>): нужные столбцы, None - все
+            Returns:
+                dataframe: вакансии
+        """
+        if self.shard_format == 'csv':
+            return pd.read_csv(file_path, usecols=columns)
+        if self.shard_format == 'parquet':
+            df = pd.read_parquet(file_path, columns=columns)
+        else:
+            df = pd.read_feather(file_path, columns=columns)
+        # Средние считаются в float64, чтобы не накапливать ошибку округления float32
+        if 'salary' in df.columns:
+            df['salary'] = df['salary'].astype(np.float64)
+        return df
+
+    @staticmethod
+    def to_typed(df):
+        """Приводит столбцы вакансий к компактным типам колоночного формата
+            Args:
+                df(dataframe): вакансии со столбцами name, area_name, published_at, salary
+            Returns:
+                dataframe: типизированные вакансии
+        """
+        typed = pd.DataFrame(index=df.index)
+        for column in df.columns:
+            if column in ('name', 'area_name'):
+                typed[column] = df[column].astype('category')
+            elif column == 'salary':
+                typed[column] = df[column].astype(np.float32)
+            elif column == 'published_at':
+                typed[column] = DateParser.get_iso_dates(df[column])
+            else:
+                typed[column] = df[column]
+        return typed
+
+
+class CsvShardWriter:
+    """Класс для дозаписи части в формате csv
+        Attributes:
+            file(file): открытый файл
+            has_header(bool): записан ли заголовок
+    """
+
+    def __init__(self, file_path):
+        """Инициализирует класс CsvShardWriter
+            Args:
+                file_path(str): путь до файла
+        """
+        self.file = open(file_path, 'w', encoding='utf-8', newline='')
+        self.has_header = False
+
+    def write(self, df):
+        """Дописывает вакансии в конец файла
+            Args:
+                df(dataframe): вакансии
+        """
+        df.to_csv(self.file, index=False, header=not self.has_header)
+        self.has_header = True
+
+    def close(self):
+        """Закрывает файл"""
+        self.file.close()
+
+
+class ParquetShardWriter:
+    """Класс для дозаписи части в формате parquet, каждая запись становится отдельной группой строк
+        Attributes:
+            file_path(str): путь до файла
+            writer(ParquetWriter): открывается при первой записи, когда известна схема
+    """
+
+    def __init__(self, file_path):
+        """Инициализирует класс ParquetShardWriter
+            Args:
+                file_path(str): путь до файла
+        """
+        self.file_path = file_path
+        self.writer = None
+
+    def write(self, df):
+        """Дописывает вакансии группой строк
+            Args:
+                df(dataframe): вакансии
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(ShardStorage.to_typed(df), preserve_index=False)
+        if self.writer is None:
+            # Коды category в первой группе могут быть int8, а в следующих группах значений бывает больше,
+            # поэтому индексы словаря в схеме всегда int32
+            schema = pa.schema([field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                                if pa.types.is_dictionary(field.type) else field for field in table.schema])
+            self.writer = pq.ParquetWriter(self.file_path, schema, compression='zstd')
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def close(self):
+        """Закрывает файл"""
+        if self.writer is not None:
+            self.writer.close()
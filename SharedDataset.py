@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+
+from DateParser import DateParser
+from StatisticsEngine import StatisticsEngine
+
+
+class SharedDataset:
+    """Класс для публикации отформатированных вакансий в разделяемую память, чтобы процессы пула
+    работали с ними без копирования и повторного чтения файлов.
+    Зарплата, год, коды регионов и коды названий хранятся плоскими массивами numpy,
+    сами строки остаются только в родительском процессе.
+
+        Attributes:
+            rows_count(int): количество вакансий
+            first_year(int): первый год в данных
+            years_count(int): количество лет от первого до последнего
+            names(Index<str>): уникальные названия вакансий, name_codes - номера в этом списке
+            area_names(Index<str>): уникальные регионы, area_codes - номера в этом списке
+            blocks(dict<str, SharedMemory>): блоки разделяемой памяти по названиям массивов
+    """
+
+    def __init__(self, df):
+        """Публикует вакансии в разделяемую память
+            Args:
+                df(dataframe): вакансии со столбцами name, area_name, published_at (или years), salary
+        """
+        years = df["years"] if "years" in df.columns else pd.Series(DateParser.get_years(df["published_at"]),
+                                                                     index=df.index)
+        # Вакансии с некорректной датой (год -1) не публикуются, иначе first_year стал бы -1
+        df, years = df[years >= 0], years[years >= 0]
+        name_codes, self.names = pd.factorize(df["name"])
+        area_codes, self.area_names = pd.factorize(df["area_name"])
+        self.rows_count = len(df.index)
+        self.first_year = int(years.min()) if self.rows_count else 0
+        self.years_count = int(years.max()) - self.first_year + 1 if self.rows_count else 0
+
+        self.blocks = {}
+        try:
+            self.__publish("salary", df["salary"].to_numpy(dtype=np.float64))
+            self.__publish("years", years.to_numpy(dtype=np.int16))
+            self.__publish("name_codes", name_codes.astype(np.int32))
+            self.__publish("area_codes", area_codes.astype(np.int32))
+        except BaseException:
+            # __exit__ не вызывается, если упал конструктор, поэтому уже созданные блоки освобождаются здесь
+            self.close()
+            raise
+
+    def __publish(self, array_name, array):
+        """Копирует массив в новый блок разделяемой памяти
+            Args:
+                array_name(str): название массива
+                array(ndarray): массив
+        """
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+        self.blocks[array_name] = block
+
+    def get_handle(self):
+        """Возвращает описание блоков, по которому процесс может подключиться к данным
+            Returns:
+                dict: количество строк, первый год, количество лет и (имя блока, тип) для каждого массива
+        """
+        dtypes = {"salary": "float64", "years": "int16", "name_codes": "int32", "area_codes": "int32"}
+        return {"rows_count": self.rows_count,
+                "first_year": self.first_year,
+                "years_count": self.years_count,
+                "arrays": {array_name: (block.name, dtypes[array_name]) for array_name, block in self.blocks.items()}}
+
+    @staticmethod
+    def attach(handle):
+        """Подключается к опубликованным данным без копирования
+            Args:
+                handle(dict): описание блоков из get_handle
+            Returns:
+                dict<str, ndarray>: массивы по названиям
+                list<SharedMemory>: блоки, которые нужно держать открытыми, пока используются массивы
+        """
+        arrays = {}
+        blocks = []
+        for array_name, (block_name, dtype) in handle["arrays"].items():
+            block = shared_memory.SharedMemory(name=block_name)
+            arrays[array_name] = np.ndarray((handle["rows_count"],), dtype=dtype, buffer=block.buf)
+            blocks.append(block)
+        return arrays, blocks
+
+    def get_name_matches(self, name_of_profession):
+        """Проверяет название профессии по уникальным названиям, а не по каждой вакансии
+            Args:
+                name_of_profession(str): название профессии
+            Returns:
+                ndarray<bool>: подходит ли название с данным кодом
+        """
+        return StatisticsEngine.get_name_matches(self.names, name_of_profession)
+
+    def get_area_code(self, region):
+        """Возвращает код региона
+            Args:
+                region(str): название региона
+            Returns:
+                int: код региона, -1 если регион не встречается
+        """
+        return int(self.area_names.get_indexer([region])[0]) if region is not None else -1
+
+    def get_row_ranges(self, parts_count):
+        """Делит строки на непрерывные диапазоны для задач пула
+            Args:
+                parts_count(int): количество диапазонов
+            Returns:
+                list<tuple<int, int>>: начало и конец каждого диапазона
+        """
+        bounds = np.linspace(0, self.rows_count, max(parts_count, 1) + 1, dtype=np.int64)
+        return [(int(start), int(end)) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+    def close(self):
+        """Освобождает разделяемую память"""
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
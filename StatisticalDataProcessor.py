@@ -1,12 +1,21 @@
 import math
+import numpy as np
 import pandas as pd
 import concurrent.futures
+import functools
 import os.path
 import sqlite3
 
 from Separator import Separator
+from SharedDataset import SharedDataset
+from ShardStorage import ShardStorage
+from StatisticsEngine import StatisticsEngine
+from VacancyDatabase import VacancyDatabase
 from Vacancies_Controller import Vacancies_Controller
 
+# Параметры статистики внутри процесса пула, задаются один раз StatisticalDataProcessor.initialize_worker
+worker_parameters = {}
+
 
 class StatisticalDataProcessor:
     """Класс для представления статистики по вакансиям.
@@ -20,15 +29,29 @@ class StatisticalDataProcessor:
         number_of_vacancies_profession(list<str>): Динамика количества вакансий по годам для выбранной профессии
         salary_level(list<str>): Уровень зарплат по городам (в порядке убывания)
         vacancy_rate(list<str>):  Доля вакансий по городам (в порядке убывания)
+        shard_storage(ShardStorage): Формат файлов по годам
+        max_workers(int): Количество процессов для подсчёта статистики
+        use_shared_memory(bool): Считать ли статистику по main_df в пуле процессов через разделяемую память
+        separator(Separator): Разделитель, файлы по годам которого ещё не записаны, или None
         """
 
-    def __init__(self):
-        """Инициализирует объект StatisticalDataProcessor"""
+    def __init__(self, max_workers=None, use_shared_memory=False):
+        """Инициализирует объект StatisticalDataProcessor
+        Args:
+            max_workers(int): количество процессов для подсчёта статистики, по умолчанию - число ядер
+            use_shared_memory(bool): считать статистику по main_df в пуле процессов через разделяемую память
+        """
+        self.max_workers = max_workers
+        self.use_shared_memory = use_shared_memory
         self.name_of_profession = None
         self.con = None
+        self.database = None
+        self.year_statistics_from_database = None
         self.years = None
         self.folder_name = None
+        self.shard_storage = ShardStorage()
         self.main_df = None
+        self.separator = None
         self.average_salary = {}
         self.number_of_vacancies = {}
         self.average_salary_profession = {}
@@ -44,16 +67,15 @@ class StatisticalDataProcessor:
         self.average_salary_profession_region = {}
         self.number_of_vacancies_profession_region = {}
 
-    def initialize_statistics(self):
-        """Собирает статистику по зарплаты по годам, количества вакансий по годам, зарплат по годам для выбранной профессии, количество вакансий по годам для выбранной профессии, уровень зарплат по городам, доля вакансий по городам"""
+    def initialize_statistics(self, shard_format='csv'):
+        """Собирает статистику по зарплаты по годам, количества вакансий по годам, зарплат по годам для выбранной профессии, количество вакансий по годам для выбранной профессии, уровень зарплат по городам, доля вакансий по городам
+        Args:
+            shard_format(str): формат файлов по годам: csv, parquet или feather, если они понадобятся
+        """
         file_name = input("Введите название файла: ")
         self.name_of_profession = input("Введите название профессии:  ")
 
-        separator = Separator()
-        separator.create_files_separated_by_years(file_name)
-        self.years = list(separator.unique_years)
-        self.folder_name = separator.folder_name
-        self.main_df = separator.main_df
+        self.separate_by_years(file_name, shard_format)
 
         self.average_salary = {}
         self.number_of_vacancies = {}
@@ -65,6 +87,27 @@ class StatisticalDataProcessor:
         self.vacancy_rate = {}
         self.initialize_city_statistics()
 
+    def separate_by_years(self, file_name, shard_format):
+        """Загружает вакансии в main_df. Статистика по main_df считается в памяти, поэтому файлы по годам
+        не записываются, пока их не запросит write_year_files
+        Args:
+            file_name(str): файл с вакансиями
+            shard_format(str): формат файлов по годам
+        """
+        separator = Separator(shard_format)
+        self.shard_storage = separator.shard_storage
+        separator.create_files_separated_by_years(file_name, write_files=False)
+        self.separator = separator
+        self.years = list(separator.unique_years)
+        self.folder_name = separator.folder_name
+        self.main_df = separator.main_df
+
+    def write_year_files(self):
+        """Записывает файлы по годам, если они ещё не записаны после separate_by_years"""
+        if self.separator is not None:
+            self.separator.write_files_separated_by_years()
+            self.separator = None
+
     def print_statistic(self):
         """Выводит вcю имеющиеся статистику"""
         print(f'Динамика уровня зарплат по годам: {self.average_salary}')
@@ -75,27 +118,164 @@ class StatisticalDataProcessor:
         print(f'Доля вакансий по городам (в порядке убывания): {self.vacancy_rate}')
 
     def initialize_year_statistics(self):
-        """Добавляет в словари статистик значения из файла
+        """Добавляет в словари статистик значения по годам. Если вакансии уже загружены в main_df,
+        статистика считается одним проходом StatisticsEngine (или в пуле процессов через разделяемую память,
+        если задан use_shared_memory), иначе - по файлам с вакансиями за год
         """
-        with concurrent.futures.ProcessPoolExecutor(max_workers=3) as executor:
-            wait_complete = []
-            for task in self.years:
-                future = executor.submit(self.get_statistic_by_year, task)
-                wait_complete.append(future)
-
-        for res in concurrent.futures.as_completed(wait_complete):
-            result = res.result()
-            year = result[0]
-            self.average_salary[year] = result[1]
-            self.number_of_vacancies[year] = result[2]
-            self.average_salary_profession[year] = result[3]
-            self.number_of_vacancies_profession[year] = result[4]
+        if self.main_df is None:
+            self.initialize_year_statistics_from_files()
+            return
+        if self.use_shared_memory:
+            self.initialize_year_statistics_from_shared_memory()
+            return
+        self.average_salary, self.number_of_vacancies, self.average_salary_profession, \
+            self.number_of_vacancies_profession = StatisticsEngine.get_year_statistics(self.main_df,
+                                                                                       self.name_of_profession)
+
+    def initialize_year_statistics_from_files(self):
+        """Добавляет в словари статистик значения из файлов по годам, обрабатывая их в отдельных процессах.
+        Процессы получают параметры один раз при запуске, а задачи содержат лишь год
+        """
+        self.write_year_files()
+        with self.create_executor() as executor:
+            results = list(executor.map(StatisticalDataProcessor.calculate_statistic_by_year, self.years))
+
+        for year, average_salary, number_of_vacancies, average_salary_profession, \
+                number_of_vacancies_profession in filter(None, results):
+            self.average_salary[year] = average_salary
+            self.number_of_vacancies[year] = number_of_vacancies
+            self.average_salary_profession[year] = average_salary_profession
+            self.number_of_vacancies_profession[year] = number_of_vacancies_profession
 
         self.average_salary = dict(sorted(self.average_salary.items()))
         self.number_of_vacancies = dict(sorted(self.number_of_vacancies.items()))
         self.average_salary_profession = dict(sorted(self.average_salary_profession.items()))
         self.number_of_vacancies_profession = dict(sorted(self.number_of_vacancies_profession.items()))
 
+    def initialize_year_statistics_from_shared_memory(self):
+        """Добавляет в словари статистик значения по годам, считая их в пуле процессов по main_df,
+        опубликованному в разделяемую память
+        """
+        first_year, totals = self.calculate_shared_statistics()
+        offsets = np.flatnonzero(totals[0])
+        years = [first_year + int(offset) for offset in offsets]
+        counts, sums, profession_counts, profession_sums = totals[:4, offsets]
+        self.average_salary, self.number_of_vacancies = StatisticsEngine.to_year_dictionaries(years, counts, sums)
+        self.average_salary_profession, self.number_of_vacancies_profession = \
+            StatisticsEngine.to_year_dictionaries(years, profession_counts, profession_sums)
+
+    def initialize_year_and_region_statistics_from_shared_memory(self):
+        """Добавляет в словари статистик значения по годам в регионе, считая их в пуле процессов по main_df,
+        опубликованному в разделяемую память
+        """
+        first_year, totals = self.calculate_shared_statistics()
+        offsets = np.flatnonzero(totals[0])
+        years = [first_year + int(offset) for offset in offsets]
+        region_counts, region_sums = totals[4:6, offsets]
+        self.average_salary_profession_region, self.number_of_vacancies_profession_region = \
+            StatisticsEngine.to_year_dictionaries(years, region_counts, region_sums)
+
+    def calculate_shared_statistics(self):
+        """Публикует main_df в разделяемую память и суммирует частичные результаты процессов пула
+        Returns:
+            int: первый год
+            ndarray: по годам количество и сумма зарплат всех вакансий, вакансий профессии
+                и вакансий профессии в регионе
+        """
+        with SharedDataset(self.main_df) as dataset:
+            workers_count = self.max_workers or os.cpu_count() or 1
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers_count) as executor:
+                parts = list(executor.map(functools.partial(StatisticalDataProcessor.calculate_shared_statistic,
+                                                            dataset.get_handle(),
+                                                            dataset.get_name_matches(self.name_of_profession),
+                                                            dataset.get_area_code(self.region)),
+                                          dataset.get_row_ranges(workers_count * 4)))
+            totals = np.sum(parts, axis=0) if parts else np.zeros((6, 0))
+            return dataset.first_year, totals
+
+    @staticmethod
+    def calculate_shared_statistic(handle, name_matches, area_code, row_range):
+        """Считает частичную статистику по диапазону строк в процессе пула. Процесс подключается
+        к разделяемой памяти только на время задачи, поэтому между задачами в нём не остаётся состояния
+        Args:
+            handle(dict): описание блоков SharedDataset
+            name_matches(ndarray<bool>): подходит ли под профессию название с данным кодом
+            area_code(int): код выбранного региона
+            row_range(tuple<int, int>): начало и конец диапазона
+        Returns:
+            ndarray: по годам количество и сумма зарплат всех вакансий, вакансий профессии
+                и вакансий профессии в регионе
+        """
+        arrays, blocks = SharedDataset.attach(handle)
+        try:
+            return StatisticalDataProcessor.count_shared_rows(arrays, handle, name_matches, area_code, row_range)
+        finally:
+            arrays.clear()
+            for block in blocks:
+                block.close()
+
+    @staticmethod
+    def count_shared_rows(arrays, handle, name_matches, area_code, row_range):
+        """Считает частичную статистику по диапазону строк подключённых массивов
+        Args:
+            arrays(dict<str, ndarray>): массивы SharedDataset
+            handle(dict): описание блоков SharedDataset
+            name_matches(ndarray<bool>): подходит ли под профессию название с данным кодом
+            area_code(int): код выбранного региона
+            row_range(tuple<int, int>): начало и конец диапазона
+        Returns:
+            ndarray: по годам количество и сумма зарплат всех вакансий, вакансий профессии
+                и вакансий профессии в регионе
+        """
+        start, end = row_range
+        years = arrays['years'][start:end].astype(np.intp) - handle['first_year']
+        salary = arrays['salary'][start:end]
+        matched = name_matches[arrays['name_codes'][start:end]]
+        region_matched = matched & (arrays['area_codes'][start:end] == area_code)
+
+        length = handle['years_count']
+        return np.stack([*StatisticsEngine.count_by_years(years, salary, length),
+                         *StatisticsEngine.count_by_years(years, salary, length, matched),
+                         *StatisticsEngine.count_by_years(years, salary, length, region_matched)])
+
+    def create_executor(self):
+        """Создаёт пул процессов, в каждом из которых один раз сохраняются параметры статистики по файлам за год
+        Returns:
+            ProcessPoolExecutor: пул процессов
+        """
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=StatisticalDataProcessor.initialize_worker,
+            initargs=(self.folder_name, self.shard_storage.shard_format, self.name_of_profession, self.region))
+
+    @staticmethod
+    def initialize_worker(folder_name, shard_format, name_of_profession, region):
+        """Сохраняет параметры статистики в модуле процесса пула. Вызывается только в процессах пула,
+        поэтому параметры не разделяются между объектами в основном процессе
+        Args:
+            folder_name(str): папка с файлами по годам
+            shard_format(str): формат файлов по годам
+            name_of_profession(str): название профессии
+            region(str): название региона
+        """
+        worker_parameters.clear()
+        worker_parameters.update({'folder_name': folder_name,
+                                  'shard_storage': ShardStorage(shard_format),
+                                  'name_of_profession': name_of_profession,
+                                  'region': region})
+
+    @staticmethod
+    def calculate_statistic_by_year(year):
+        """Считает статистику за год в процессе пула
+        Args:
+            year(int): год
+        Returns:
+            tuple: год, средняя зарплата, количество вакансий, средняя зарплата профессии, количество вакансий профессии
+        """
+        return StatisticalDataProcessor.read_statistic_by_year(worker_parameters['shard_storage'],
+                                                               worker_parameters['folder_name'],
+                                                               worker_parameters['name_of_profession'], year)
+
     def get_statistic_by_year(self, year):
         """Возвращает статистку за год в порядке:
             Год,
@@ -104,36 +284,38 @@ class StatisticalDataProcessor:
             Среднее значение зарплаты за год для выбранной профессии.
             Количество вакансий за год для выбранной профессии
         """
-        file_path = rf"{self.folder_name}\part_{year}.csv"
+        self.write_year_files()
+        return StatisticalDataProcessor.read_statistic_by_year(self.shard_storage, self.folder_name,
+                                                               self.name_of_profession, year)
+
+    @staticmethod
+    def read_statistic_by_year(shard_storage, folder_name, name_of_profession, year):
+        """Читает файл за год и считает по нему статистику
+        Args:
+            shard_storage(ShardStorage): формат файлов по годам
+            folder_name(str): папка с файлами по годам
+            name_of_profession(str): название профессии
+            year(int): год
+        Returns:
+            tuple: год, средняя зарплата, количество вакансий, средняя зарплата профессии, количество вакансий профессии
+        """
+        file_path = shard_storage.get_path(folder_name, f"part_{year}")
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
-            df_vacancy = df[df["name"].str.contains(self.name_of_profession)]
+            df = shard_storage.read(file_path, columns=["name", "salary"])
+            df_vacancy = df[df["name"].str.contains(name_of_profession)]
 
             average_salary = math.floor(df["salary"].mean())
             number_of_vacancies = len(df.index)
             average_salary_profession = 0 if df_vacancy.empty else math.floor(df_vacancy["salary"].mean())
             number_of_vacancies_profession = 0 if df_vacancy.empty else len(df_vacancy.index)
 
-            return [year, average_salary, number_of_vacancies, average_salary_profession,
-                    number_of_vacancies_profession]
+            return (int(year), average_salary, number_of_vacancies, average_salary_profession,
+                    number_of_vacancies_profession)
 
     def initialize_city_statistics(self):
         """Заполняет словари salary_level и vacancy_rate значениями"""
         pd.set_option('expand_frame_repr', False)
-        df = self.main_df.copy(deep=True)
-        df_length = len(df.index)
-
-        df['count'] = df.groupby('area_name')['area_name'].transform('count')
-        df = df[df['count'] / df_length >= 0.01]
-        df_cities = df.groupby('area_name', as_index=False)['salary'].mean().sort_values(by='salary', ascending=False)
-        df_cities['salary'] = df_cities['salary'].apply(lambda x: float(x))
-        df_cities = df_cities.head(10)
-        self.salary_level = dict(zip(df_cities['area_name'], df_cities['salary']))
-
-        df['share'] = df['count'] / df_length
-        df_share = df.groupby('area_name', as_index=False)['share'].mean().sort_values(by='share', ascending=False)
-        df_share = df_share.head(10)
-        self.vacancy_rate = dict(zip(df_share['area_name'], round(df_share['share'], 4)))
+        self.salary_level, self.vacancy_rate = StatisticsEngine.get_city_statistics(self.main_df)
 
     def get_final_year_statistics(self):
         """Возвращает статистку по зарплате и количеству вакансий в словари
@@ -170,9 +352,12 @@ class StatisticalDataProcessor:
         """
         return ', '.join([f'{key}: {value}' for key, value in dic.items()])
 
-    def initialize_statistics_from_database(self):
+    def initialize_statistics_from_database(self, case_sensitive=False):
         """
-        Выводит информацию о статистике в консоль
+        Выводит информацию о статистике в консоль. Профессию можно задать несколькими названиями через OR,
+        например "аналитик OR analyst", поиск идёт по полнотекстовому индексу названий
+        Args:
+            case_sensitive(bool): учитывать ли регистр при поиске профессии, по умолчанию не учитывается
         """
         file_name = input('Введите название файла: ')
         self.name_of_profession = input("Введите название профессии:  ")
@@ -180,6 +365,9 @@ class StatisticalDataProcessor:
         vacancy_controller.create_formatted_file(file_name)
 
         self.con = sqlite3.connect('currency_dynamic.sqlite')
+        self.database = VacancyDatabase(self.con)
+        self.year_statistics_from_database = self.database.get_year_statistics(self.name_of_profession,
+                                                                                 case_sensitive)
 
         self.print_average_salary_from_database()
         self.print_number_of_vacancies()
@@ -191,65 +379,48 @@ class StatisticalDataProcessor:
 
     def print_average_salary_from_database(self):
         """Печатает динамику уровня зарплат по годам"""
-        data = pd.read_sql_query(
-            "SELECT strftime('%Y', published_at) as year, ROUND(AVG(salary), 4) as average_salary FROM formatted GROUP BY strftime('%Y', published_at)",
-            self.con)
-        print(data)
+        print(self.year_statistics_from_database[['year', 'average_salary']])
         print('\n')
 
     def print_number_of_vacancies(self):
         """Печатает динамику количества вакансий по годам"""
-        data = pd.read_sql_query(
-            "SELECT  strftime('%Y', published_at) as year, COUNT(name) as count FROM formatted GROUP BY strftime('%Y', published_at)",
-            self.con)
-        print(data)
+        print(self.year_statistics_from_database[['year', 'count']])
         print('\n')
 
     def print_average_salary_profession(self):
         """Печатает динамику уровня зарплат по годам для выбранной профессии"""
-        data = pd.read_sql_query(
-            f"SELECT  strftime('%Y', published_at) as year, ROUND(AVG(salary),4) as average_salary FROM formatted WHERE name LIKE '%{self.name_of_profession}%' GROUP BY strftime('%Y', published_at)",
-            self.con)
-        print(data)
+        data = self.year_statistics_from_database
+        data = data[data['count_profession'] > 0][['year', 'average_salary_profession']]
+        print(data.rename(columns={'average_salary_profession': 'average_salary'}).reset_index(drop=True))
         print('\n')
 
     def print_number_of_vacancies_profession(self):
         """Печатает динамику количества вакансий по годам для выбранной профессии"""
-        data = pd.read_sql_query(
-            f"SELECT  strftime('%Y', published_at) as year, COUNT(name) as count FROM formatted WHERE name LIKE '%{self.name_of_profession}%' GROUP BY strftime('%Y', published_at)",
-            self.con)
-        print(data)
+        data = self.year_statistics_from_database
+        data = data[data['count_profession'] > 0][['year', 'count_profession']]
+        print(data.rename(columns={'count_profession': 'count'}).reset_index(drop=True))
         print('\n')
 
     def print_salary_level_by_city(self):
         """Печатает уровень зарплат по городам"""
-        amount = self.con.execute('SELECT COUNT(*) FROM formatted').fetchone()[0]
-        data = pd.read_sql_query(
-            f"SELECT area_name, ROUND(AVG(salary),4) as average_salary FROM formatted GROUP BY area_name HAVING COUNT(name) >= {amount} / 100 ORDER BY AVG(salary) DESC LIMIT 10",
-            self.con)
-        print(data)
+        print(self.database.get_salary_level_by_city())
         print('\n')
 
     def print_vacancy_rate(self):
         """Печатает долю вакансий по городам"""
-        amount = self.con.execute('SELECT COUNT(*) FROM formatted').fetchone()[0]
-        data = pd.read_sql_query(
-            f"SELECT  area_name, ROUND(CAST(COUNT(name) AS FLOAT) / {amount},4) as rate  FROM formatted GROUP BY area_name HAVING COUNT(name) >= {amount}/ 100 ORDER BY COUNT(name) / {amount} DESC LIMIT 10",
-            self.con)
-        print(data)
+        print(self.database.get_vacancy_rate())
         print('\n')
 
-    def initialize_statistics_by_region(self):
-        """Собирает статистику по уровеню зарплат по городам, доли вакансий по городам, уровню зарплат по годам для выбранной профессии и региона, количества вакансий по годам для выбранной профессии и региона """
+    def initialize_statistics_by_region(self, shard_format='csv'):
+        """Собирает статистику по уровеню зарплат по городам, доли вакансий по городам, уровню зарплат по годам для выбранной профессии и региона, количества вакансий по годам для выбранной профессии и региона
+        Args:
+            shard_format(str): формат файлов по годам: csv, parquet или feather, если они понадобятся
+        """
         file_name = input("Введите название файла: ")
         self.name_of_profession = input("Введите название профессии: ")
         self.region = input("Введите название региона: ")
 
-        separator = Separator()
-        separator.create_files_separated_by_years(file_name)
-        self.years = list(separator.unique_years)
-        self.folder_name = separator.folder_name
-        self.main_df = separator.main_df
+        self.separate_by_years(file_name, shard_format)
 
         self.salary_level = {}
         self.vacancy_rate = {}
@@ -260,19 +431,30 @@ class StatisticalDataProcessor:
         self.initialize_year_and_region_statistics()
 
     def initialize_year_and_region_statistics(self):
-        """Добавляет в словари статистик значения из файла
+        """Добавляет в словари статистик значения по годам в регионе. Если вакансии уже загружены в main_df,
+        статистика считается одним проходом StatisticsEngine (или в пуле процессов через разделяемую память,
+        если задан use_shared_memory), иначе - по файлам с вакансиями за год
         """
-        with concurrent.futures.ProcessPoolExecutor(max_workers=3) as executor:
-            wait_complete = []
-            for task in self.years:
-                future = executor.submit(self.get_statistic_by_year_and_region, task)
-                wait_complete.append(future)
-
-        for res in concurrent.futures.as_completed(wait_complete):
-            result = res.result()
-            year = result[0]
-            self.average_salary_profession_region[year] = result[1]
-            self.number_of_vacancies_profession_region[year] = result[2]
+        if self.main_df is None:
+            self.initialize_year_and_region_statistics_from_files()
+            return
+        if self.use_shared_memory:
+            self.initialize_year_and_region_statistics_from_shared_memory()
+            return
+        self.average_salary_profession_region, self.number_of_vacancies_profession_region = \
+            StatisticsEngine.get_year_and_region_statistics(self.main_df, self.name_of_profession, self.region)
+
+    def initialize_year_and_region_statistics_from_files(self):
+        """Добавляет в словари статистик значения из файлов по годам, обрабатывая их в отдельных процессах.
+        Процессы получают параметры один раз при запуске, а задачи содержат лишь год
+        """
+        self.write_year_files()
+        with self.create_executor() as executor:
+            results = list(executor.map(StatisticalDataProcessor.calculate_statistic_by_year_and_region, self.years))
+
+        for year, average_salary, number_of_vacancies in filter(None, results):
+            self.average_salary_profession_region[year] = average_salary
+            self.number_of_vacancies_profession_region[year] = number_of_vacancies
 
         self.average_salary_profession_region = dict(sorted(self.average_salary_profession_region.items()))
         self.number_of_vacancies_profession_region = dict(sorted(self.number_of_vacancies_profession_region.items()))
@@ -283,11 +465,40 @@ class StatisticalDataProcessor:
             Среднее значение зарплаты за год в заданном регионе,
             Количество вакансий за год в заданном регионе.
         """
-        file_path = rf"{self.folder_name}\part_{year}.csv"
+        self.write_year_files()
+        return StatisticalDataProcessor.read_statistic_by_year_and_region(self.shard_storage, self.folder_name,
+                                                                          self.name_of_profession, self.region, year)
+
+    @staticmethod
+    def calculate_statistic_by_year_and_region(year):
+        """Считает статистику профессии в регионе за год в процессе пула
+        Args:
+            year(int): год
+        Returns:
+            tuple: год, средняя зарплата, количество вакансий
+        """
+        return StatisticalDataProcessor.read_statistic_by_year_and_region(worker_parameters['shard_storage'],
+                                                                          worker_parameters['folder_name'],
+                                                                          worker_parameters['name_of_profession'],
+                                                                          worker_parameters['region'], year)
+
+    @staticmethod
+    def read_statistic_by_year_and_region(shard_storage, folder_name, name_of_profession, region, year):
+        """Читает файл за год и считает по нему статистику профессии в регионе
+        Args:
+            shard_storage(ShardStorage): формат файлов по годам
+            folder_name(str): папка с файлами по годам
+            name_of_profession(str): название профессии
+            region(str): название региона
+            year(int): год
+        Returns:
+            tuple: год, средняя зарплата, количество вакансий
+        """
+        file_path = shard_storage.get_path(folder_name, f"part_{year}")
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
-            df = df[(df["name"].str.contains(self.name_of_profession)) & (df["area_name"] == self.region)]
+            df = shard_storage.read(file_path, columns=["name", "area_name", "salary"])
+            df = df[(df["name"].str.contains(name_of_profession)) & (df["area_name"] == region)]
 
-            average_salary = math.floor(df["salary"].mean())
+            average_salary = 0 if df.empty else math.floor(df["salary"].mean())
             vacancy_rate = len(df.index)
-            return [year, average_salary, vacancy_rate]
+            return int(year), average_salary, vacancy_rate
@@ -0,0 +1,150 @@
+import math
+import numpy as np
+import pandas as pd
+
+from DateParser import DateParser
+
+
+class StatisticsEngine:
+    """Класс для подсчёта статистики по годам и городам за один проход groupby по уже загруженным вакансиям.
+    Заменяет чтение файлов по годам в отдельных процессах, когда все вакансии уже есть в памяти.
+    """
+
+    @staticmethod
+    def get_years(df):
+        """Возвращает год публикации каждой вакансии, некорректные даты (год -1) заменяются на NA,
+        поэтому groupby не включает такие вакансии ни в один год
+            Args:
+                df(dataframe): вакансии
+            Returns:
+                Series<Int64>: годы
+        """
+        years = df["years"] if "years" in df.columns else pd.Series(DateParser.get_years(df["published_at"]),
+                                                                     index=df.index)
+        return years.astype("Int64").where(years >= 0)
+
+    @staticmethod
+    def get_year_statistics(df, name_of_profession):
+        """Считает все четыре статистики по годам одним groupby
+            Args:
+                df(dataframe): вакансии со столбцами name, published_at (или years), salary
+                name_of_profession(str): название профессии
+            Returns:
+                list<dict<int, int>>: средняя зарплата, количество вакансий, средняя зарплата профессии,
+                    количество вакансий профессии по годам
+        """
+        matched = df["name"].str.contains(name_of_profession)
+        grouped = pd.DataFrame({"years": StatisticsEngine.get_years(df),
+                                "salary": df["salary"],
+                                "salary_profession": df["salary"].where(matched),
+                                "matched": matched}) \
+            .groupby("years") \
+            .agg(average_salary=("salary", "mean"),
+                 number_of_vacancies=("salary", "size"),
+                 average_salary_profession=("salary_profession", "mean"),
+                 number_of_vacancies_profession=("matched", "sum"))
+
+        years = [int(year) for year in grouped.index]
+        return [dict(zip(years, map(StatisticsEngine.floor_mean, grouped["average_salary"]))),
+                dict(zip(years, map(int, grouped["number_of_vacancies"]))),
+                dict(zip(years, map(StatisticsEngine.floor_mean, grouped["average_salary_profession"]))),
+                dict(zip(years, map(int, grouped["number_of_vacancies_profession"])))]
+
+    @staticmethod
+    def get_year_and_region_statistics(df, name_of_profession, region):
+        """Считает статистику профессии по годам в регионе одним groupby
+            Args:
+                df(dataframe): вакансии со столбцами name, area_name, published_at (или years), salary
+                name_of_profession(str): название профессии
+                region(str): название региона
+            Returns:
+                list<dict<int, int>>: средняя зарплата и количество вакансий профессии в регионе по годам
+        """
+        matched = df["name"].str.contains(name_of_profession) & (df["area_name"] == region)
+        grouped = pd.DataFrame({"years": StatisticsEngine.get_years(df),
+                                "salary": df["salary"].where(matched),
+                                "matched": matched}) \
+            .groupby("years") \
+            .agg(average_salary=("salary", "mean"),
+                 number_of_vacancies=("matched", "sum"))
+
+        years = [int(year) for year in grouped.index]
+        return [dict(zip(years, map(StatisticsEngine.floor_mean, grouped["average_salary"]))),
+                dict(zip(years, map(int, grouped["number_of_vacancies"])))]
+
+    @staticmethod
+    def get_city_statistics(df):
+        """Считает уровень зарплат и долю вакансий по городам, где не меньше 1% вакансий
+            Args:
+                df(dataframe): вакансии со столбцами area_name, salary
+            Returns:
+                list<dict<str, float>>: уровень зарплат по городам, доля вакансий по городам (10 первых, по убыванию)
+        """
+        df = df.copy(deep=True)
+        df_length = len(df.index)
+
+        df['count'] = df.groupby('area_name')['area_name'].transform('count')
+        df = df[df['count'] / df_length >= 0.01]
+        df_cities = df.groupby('area_name', as_index=False)['salary'].mean().sort_values(by='salary', ascending=False)
+        df_cities['salary'] = df_cities['salary'].apply(lambda x: float(x))
+        df_cities = df_cities.head(10)
+        salary_level = dict(zip(df_cities['area_name'], df_cities['salary']))
+
+        df['share'] = df['count'] / df_length
+        df_share = df.groupby('area_name', as_index=False)['share'].mean().sort_values(by='share', ascending=False)
+        df_share = df_share.head(10)
+        vacancy_rate = dict(zip(df_share['area_name'], round(df_share['share'], 4)))
+        return [salary_level, vacancy_rate]
+
+    @staticmethod
+    def get_name_matches(names, name_of_profession):
+        """Проверяет название профессии по уникальным названиям, а не по каждой вакансии
+            Args:
+                names(Index<str>): уникальные названия вакансий
+                name_of_profession(str): название профессии
+            Returns:
+                ndarray<bool>: подходит ли название с данным номером
+        """
+        return pd.Series(names).str.contains(name_of_profession).to_numpy(dtype=bool)
+
+    @staticmethod
+    def count_by_years(year_codes, salary, years_count, mask=None):
+        """Считает количество вакансий и сумму зарплат по годам через np.bincount
+            Args:
+                year_codes(ndarray<int>): номер года каждой вакансии, начиная с 0
+                salary(ndarray<float>): зарплаты
+                years_count(int): количество лет
+                mask(ndarray<bool>): учитываемые вакансии, None - все
+            Returns:
+                ndarray<int>: количество вакансий по годам
+                ndarray<float>: сумма зарплат по годам
+        """
+        if mask is not None:
+            year_codes = year_codes[mask]
+            salary = salary[mask]
+        return np.bincount(year_codes, minlength=years_count), \
+            np.bincount(year_codes, weights=salary, minlength=years_count)
+
+    @staticmethod
+    def to_year_dictionaries(years, counts, sums):
+        """Преобразует результаты count_by_years в словари по годам
+            Args:
+                years(list<int>): года
+                counts(ndarray<int>): количество вакансий по годам
+                sums(ndarray<float>): сумма зарплат по годам
+            Returns:
+                list<dict<int, int>>: средняя зарплата (округлённая вниз, 0 если вакансий нет) и количество вакансий
+        """
+        return [{year: StatisticsEngine.floor_mean(total / count if count else None)
+                 for year, count, total in zip(years, counts, sums)},
+                {year: int(count) for year, count in zip(years, counts)}]
+
+    @staticmethod
+    def floor_mean(value):
+        """Округляет среднее вниз, пустая группа даёт 0
+            Args:
+                value(float): среднее значение
+            Returns:
+                int: округлённое значение
+        """
+        return 0 if pd.isna(value) else math.floor(value)
@@ -1,54 +1,83 @@
 import pandas as pd
-from datetime import datetime
+import numpy as np
 import sqlite3
 
 from Currency_Controller import Currency_Controller
+from CurrencyRateIndex import CurrencyRateIndex
+from DateParser import DateParser
+from VacancyDatabase import VacancyDatabase
 
 
 class Vacancies_Controller:
     """Класс, преобразует переданный dataframe, объединяя столбцы salary_from, salary_to и currency в один столбец salary .
              Attributes:
                 df(dateframe): вакансии
-                currency_values(dateframe): значения валют по месяцам
+                rate_index(CurrencyRateIndex): общий индекс курсов валют по месяцам
         """
 
     def __init__(self):
         """Инициализирует класс Vacancies_Controller
             Args: file_name(str): файл с вакансиями"""
-        self.currency_values = pd.read_csv("currency.csv")
+        self.rate_index = CurrencyRateIndex.get_shared()
         self.con = sqlite3.connect('currency_dynamic.sqlite')
 
-    def get_formatted_dataframe(self, vacancies):
-        """Возвращает dataframe с преобразованной зарлатой
+    def get_formatted_dataframe(self, vacancies, currencies=None):
+        """Возвращает dataframe с преобразованной зарлатой, вакансии с некорректной датой публикации отбрасываются
            Args:
                vacancies(dataframe): вакансии
+               currencies(list<str>): допустимые валюты, если vacancies - лишь часть файла
            Returns:
                  dataframe: вакансии со столбцом salary
         """
-        currency_controller = Currency_Controller()
-        vacancies = currency_controller.filter_vacancies_by_currency(vacancies)
+        vacancies = Currency_Controller.filter_vacancies_by_currency(vacancies, currencies)
+        vacancies = Vacancies_Controller.drop_invalid_dates(vacancies)
 
-        vacancies['salary'] = vacancies.apply(self.get_salary, axis=1)
+        vacancies['salary'] = self.get_salaries(vacancies)
         vacancies = vacancies.drop(columns=['salary_from', 'salary_to', 'salary_currency'])
 
         return vacancies
 
     def create_formatted_file(self, vacancy_file_name):
-        """Создаёт отфильтрованный по зарплатам csv файл"""
+        """Создаёт таблицу formatted с отфильтрованными по зарплатам вакансиями и годом публикации"""
         self.df = pd.read_csv(vacancy_file_name)
-        currency_controller = Currency_Controller()
-        self.df = currency_controller.filter_vacancies_by_currency(self.df)
+        self.df = Currency_Controller.filter_vacancies_by_currency(self.df)
+        self.df = Vacancies_Controller.drop_invalid_dates(self.df)
 
-        self.df['salary'] = self.df.apply(self.get_salary, axis=1)
-        self.df['published_at'] =  self.df.apply(
-            lambda row: datetime.strptime(row['published_at'], '%Y-%m-%dT%H:%M:%S%z').strftime('%Y-%m-%d'),
-            axis=1)
+        self.df['salary'] = self.get_salaries(self.df)
+        self.df['year'] = DateParser.get_years(self.df['published_at'])
+        self.df['published_at'] = DateParser.get_date_strings(self.df['published_at'])
         self.df = self.df.drop(columns=['salary_from', 'salary_to', 'salary_currency'])
 
         cursorObj = self.con.cursor()
         cursorObj.execute('CREATE TABLE IF NOT EXISTS salary_info (name text, salary float, area_name text, published_at date)')
         self.con.commit()
-        self.df.to_sql('formatted', self.con, if_exists='replace', index=False)
+        VacancyDatabase(self.con).write_formatted(self.df)
+
+    @staticmethod
+    def drop_invalid_dates(vacancies):
+        """Отбрасывает вакансии, дату публикации которых не удалось разобрать, иначе они попали бы в год -1
+            Args:
+                vacancies(dataframe): вакансии
+            Returns:
+                dataframe: вакансии с корректной датой публикации
+        """
+        return vacancies[DateParser.get_years(vacancies['published_at']) >= 0]
+
+    def get_salaries(self, vacancies):
+        """Возвращает зарплаты для всех вакансий сразу, результат совпадает с построчным get_salary
+            Args:
+                vacancies(dataframe): вакансии
+            Returns:
+                Series: зарплата или NaN, если её невозможно посчитать
+        """
+        salary_from = pd.to_numeric(vacancies['salary_from'], errors='coerce').to_numpy(dtype=float)
+        salary_to = pd.to_numeric(vacancies['salary_to'], errors='coerce').to_numpy(dtype=float)
+        coefficients = self.rate_index.get_rates(vacancies['published_at'],
+                                                 vacancies['salary_currency'])
+
+        salary = np.where(np.isnan(salary_from), salary_to,
+                          np.where(np.isnan(salary_to), salary_from, (salary_to + salary_from) / 2)) * coefficients
+        return pd.Series(salary, index=vacancies.index, dtype=float)
 
     def get_salary(self, row):
         """Возвращает зарплату в зависимости от полей salary_from, salary_to, salary_currency
@@ -57,9 +86,8 @@ class Vacancies_Controller:
         """
         if (pd.isna(row['salary_from']) and pd.isna(row['salary_to'])) or pd.isna(row['salary_currency']):
             return None
-        current_date = datetime.strptime(row['published_at'], '%Y-%m-%dT%H:%M:%S%z')
         currency_coefficient = self.get_currency_coefficient_from_db(row['salary_currency'],
-                                                                     current_date.strftime('%Y-%m'))
+                                                                     row['published_at'][:7])
         if not currency_coefficient:
             return None
         if pd.isna(row['salary_from']):
@@ -73,17 +101,11 @@ class Vacancies_Controller:
             return x
 
     def get_currency_coefficient_from_db(self, currency_name, current_date):
-        """Получает коэффициент валлюты из базы данных
+        """Получает коэффициент валлюты из загруженного индекса курсов
             Args:
                 currency_name(str): название валюты
                 current_date(str): текущая дата в формате  Y-m
             Returns:
                 float: коэффициент валюты
         """
-        if currency_name == 'RUR':
-            return 1
-        cursorObj = self.con.cursor()
-        cursorObj.execute(f"SELECT {currency_name} FROM currency_dynamic WHERE date = '{current_date}'")
-        rows = cursorObj.fetchall()
-        for row in rows:
-            return row[0]
+        return self.rate_index.get_rate(currency_name, current_date)
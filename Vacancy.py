@@ -1,4 +1,5 @@
-from datetime import datetime
+from CurrencyRateIndex import CurrencyRateIndex
+from DateParser import DateParser
 
 class Salary:
     """Класс для представления зарплаты.
@@ -9,7 +10,9 @@ class Salary:
         salary_currency (str): Валюята оклада
         salary_gross (str): Указан ли оклад до вычета налогов
         average (int): Средняя зарплата
+        currency_to_rub(dict<str, float>): Курсы валют на случай, если месяц отсутствует в CurrencyRateIndex
     """
+    __slots__ = ('salary_from', 'salary_to', 'salary_currency', 'salary_gross', 'average')
     currency_to_rub = {
         "AZN": 35.68,
         "BYR": 23.91,
@@ -23,7 +26,7 @@ class Salary:
         "UZS": 0.0055,
     }
 
-    def __init__(self, salary_from, salary_to, salary_currency, salary_gross="True"):
+    def __init__(self, salary_from, salary_to, salary_currency, salary_gross="True", month=None):
         """Инициализирует объект Salary, выполняет конвертацию для целоисленных полей
 
         Args:
@@ -31,13 +34,30 @@ class Salary:
             salary_to (str or int or float): Верхняя граница  вилки оклада
             salary_gross (str or int or float): Валюята оклада
             salary_currency(str): Указан ли оклад до вычета налогов
+            month(str): Месяц публикации в формате Y-m, по которому берётся курс валюты
         """
-        self.salary_from = float(salary_from) * self.currency_to_rub[salary_currency]
-        self.salary_to = float(salary_to) * self.currency_to_rub[salary_currency]
+        currency_coefficient = Salary.get_currency_coefficient(salary_currency, month)
+        self.salary_from = float(salary_from) * currency_coefficient
+        self.salary_to = float(salary_to) * currency_coefficient
         self.salary_currency = salary_currency
         self.salary_gross = salary_gross
         self.average = int((self.salary_from + self.salary_to) / 2)
 
+    @staticmethod
+    def get_currency_coefficient(salary_currency, month):
+        """Возвращает курс валюты за месяц из общего CurrencyRateIndex или из currency_to_rub
+        Args:
+            salary_currency(str): Валюта оклада
+            month(str): Месяц в формате Y-m
+        Returns:
+            float: Курс валюты в рублях
+        """
+        if month is not None:
+            currency_coefficient = CurrencyRateIndex.get_shared().get_rate(salary_currency, month)
+            if currency_coefficient is not None:
+                return currency_coefficient
+        return Salary.currency_to_rub[salary_currency]
+
 
 class Vacancy:
     """Класс для представления ваканcии.
@@ -53,6 +73,8 @@ class Vacancy:
         premium(str): Премиум
         employer_name(str): Название компании
     """
+    __slots__ = ('name', 'salary', 'area_name', 'published_at', 'description', 'key_skills', 'experience_id',
+                 'premium', 'employer_name')
 
     def __init__(self, vacancy_information):
         """Инициализирует объект Vacancy
@@ -62,9 +84,10 @@ class Vacancy:
         """
         self.name = vacancy_information['name']
         self.salary = Salary(vacancy_information['salary_from'], vacancy_information['salary_to'],
-                             vacancy_information['salary_currency'])
+                             vacancy_information['salary_currency'],
+                             month=vacancy_information['published_at'][:7])
         self.area_name = vacancy_information['area_name']
-        self.published_at = datetime.strptime(vacancy_information['published_at'], '%Y-%m-%dT%H:%M:%S%z')
+        self.published_at = DateParser.parse_date(vacancy_information['published_at'])
         self.description = vacancy_information['description']
         self.key_skills = vacancy_information['key_skills'].split(';')
         self.experience_id = vacancy_information['experience_id']
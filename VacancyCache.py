@@ -0,0 +1,239 @@
+import glob
+import hashlib
+import json
+import os
+import numpy as np
+
+from CurrencyRateIndex import CurrencyRateIndex
+from VacancyTable import VacancyTable
+
+
+class VacancyCache:
+    """Класс для кэширования прочитанных DataSet таблиц вакансий на диске.
+    Таблица сохраняется в один двоичный файл: заголовок JSON, затем массивы столбцов VacancyTable и таблица строк
+    (строки UTF-8 подряд и смещения их начал). При загрузке файл отображается в память через np.memmap, и строки
+    декодируются только при обращении. Ключ кэша - путь, размер, время изменения и хэш содержимого csv файла,
+    а также хэш курсов валют, потому что оклады хранятся уже в рублях. Размер папки кэша ограничен: при
+    превышении удаляются файлы, которые дольше всего не использовались.
+
+        Attributes:
+            cache_folder(str): папка с файлами кэша
+            max_size(int): наибольший размер папки кэша в байтах
+            magic(bytes): начало файла кэша
+            alignment(int): выравнивание массивов в файле
+            block_size(int): размер блока, которыми читается csv файл при подсчёте хэша
+            array_columns(list<str>): столбцы VacancyTable, которые хранятся массивами
+            string_columns(list<str>): столбцы VacancyTable, которые хранятся в таблице строк
+    """
+    magic = b'VACANCY1'
+    alignment = 64
+    block_size = 2 ** 20
+    array_columns = ['salary_from', 'salary_to', 'published_at', 'utc_offsets']
+    string_columns = ['names', 'descriptions', 'key_skills']
+
+    def __init__(self, cache_folder='dataset_cache', max_size=1024 * 2 ** 20):
+        """Инициализирует класс VacancyCache
+            Args:
+                cache_folder(str): папка с файлами кэша
+                max_size(int): наибольший размер папки кэша в байтах
+        """
+        self.cache_folder = cache_folder
+        self.max_size = max_size
+
+    @staticmethod
+    def get_fingerprint(file_name):
+        """Возвращает отпечаток csv файла и курсов валют, по которому ищется кэш
+            Args:
+                file_name(str): путь до csv файла
+            Returns:
+                dict<str, object>: путь, размер, время изменения, хэш содержимого и хэш курсов валют
+        """
+        stat = os.stat(file_name)
+        content_hash = hashlib.blake2b()
+        with open(file_name, 'rb') as file:
+            for block in iter(lambda: file.read(VacancyCache.block_size), b''):
+                content_hash.update(block)
+        rates = CurrencyRateIndex.get_shared()
+        rates_hash = hashlib.blake2b(json.dumps([rates.first_month, rates.currencies]).encode()
+                                     + np.ascontiguousarray(rates.rates).tobytes()).hexdigest()
+        return {'source': os.path.abspath(file_name), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                'content_hash': content_hash.hexdigest(), 'rates_hash': rates_hash}
+
+    def get_path(self, fingerprint):
+        """Возвращает путь до файла кэша: хэш пути исходного файла и хэш всего отпечатка
+            Args:
+                fingerprint(dict<str, object>): отпечаток из get_fingerprint
+            Returns:
+                str: путь до файла кэша
+        """
+        source_hash = VacancyCache.__get_source_hash(fingerprint['source'])
+        key = hashlib.blake2b(json.dumps(fingerprint, sort_keys=True).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_folder, f'{source_hash}-{key}.vcache')
+
+    @staticmethod
+    def __get_source_hash(file_name):
+        """Возвращает хэш абсолютного пути до csv файла, с которого начинаются имена его файлов кэша"""
+        return hashlib.blake2b(os.path.abspath(file_name).encode(), digest_size=8).hexdigest()
+
+    def load(self, file_name):
+        """Загружает таблицу вакансий из кэша, если csv файл и курсы валют не изменились
+            Args:
+                file_name(str): путь до csv файла
+            Returns:
+                VacancyTable: таблица вакансий или None, если подходящего кэша нет
+        """
+        fingerprint = VacancyCache.get_fingerprint(file_name)
+        path = self.get_path(fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            header, table = VacancyCache.read(path)
+        except (ValueError, KeyError, OSError):
+            os.remove(path)
+            return None
+        if header['fingerprint'] != fingerprint:
+            return None
+        os.utime(path)
+        return table
+
+    def store(self, file_name, table):
+        """Сохраняет таблицу вакансий в кэш, удаляет кэш прежних версий этого файла и лишние файлы кэша
+            Args:
+                file_name(str): путь до csv файла, из которого прочитана таблица
+                table(VacancyTable): таблица вакансий
+        """
+        fingerprint = VacancyCache.get_fingerprint(file_name)
+        path = self.get_path(fingerprint)
+        os.makedirs(self.cache_folder, exist_ok=True)
+        VacancyCache.write(f'{path}.tmp', fingerprint, table)
+        os.replace(f'{path}.tmp', path)
+        for old_path in self.__get_paths(file_name):
+            if old_path != path:
+                os.remove(old_path)
+        self.evict()
+
+    def invalidate(self, file_name=None):
+        """Удаляет кэш csv файла или весь кэш
+            Args:
+                file_name(str): путь до csv файла, None - удалить весь кэш
+            Returns:
+                int: количество удалённых файлов
+        """
+        paths = self.__get_paths(file_name)
+        for path in paths:
+            os.remove(path)
+        return len(paths)
+
+    def __get_paths(self, file_name=None):
+        """Возвращает файлы кэша csv файла или все файлы кэша"""
+        prefix = VacancyCache.__get_source_hash(file_name) if file_name is not None else '*'
+        return glob.glob(os.path.join(glob.escape(self.cache_folder), f'{prefix}-*.vcache'))
+
+    def evict(self):
+        """Удаляет файлы кэша, которые дольше всего не использовались, пока размер папки больше max_size"""
+        paths = sorted(self.__get_paths(), key=os.path.getmtime)
+        total_size = sum(os.path.getsize(path) for path in paths)
+        for path in paths:
+            if total_size <= self.max_size:
+                break
+            total_size -= os.path.getsize(path)
+            os.remove(path)
+
+    @staticmethod
+    def write(path, fingerprint, table):
+        """Записывает таблицу вакансий в файл кэша
+            Args:
+                path(str): путь до файла
+                fingerprint(dict<str, object>): отпечаток csv файла
+                table(VacancyTable): таблица вакансий
+        """
+        blocks = [(column, np.ascontiguousarray(getattr(table, column))) for column in VacancyCache.array_columns]
+        blocks += [(f'codes.{column}', np.ascontiguousarray(codes)) for column, codes in table.codes.items()]
+        for column in VacancyCache.string_columns:
+            encoded = [string.encode('utf-8') for string in getattr(table, column)]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(string) + 1 for string in encoded], out=offsets[1:])
+            blocks += [(f'{column}.offsets', offsets),
+                       (f'{column}.data', np.frombuffer(b'\0'.join(encoded) + b'\0', dtype=np.uint8))]
+
+        arrays, position = {}, 0
+        for name, block in blocks:
+            arrays[name] = [block.dtype.str, len(block), position]
+            position += VacancyCache.__align(block.nbytes)
+        header = json.dumps({'fingerprint': fingerprint, 'values': table.values, 'arrays': arrays},
+                            ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as file:
+            file.write(VacancyCache.magic + len(header).to_bytes(8, 'little') + header)
+            file.write(b'\0' * (VacancyCache.__align(file.tell()) - file.tell()))
+            for _, block in blocks:
+                file.write(block.tobytes())
+                file.write(b'\0' * (VacancyCache.__align(block.nbytes) - block.nbytes))
+
+    @staticmethod
+    def read(path):
+        """Отображает файл кэша в память
+            Args:
+                path(str): путь до файла
+            Returns:
+                dict<str, object>: заголовок файла
+                VacancyTable: таблица вакансий, массивы которой только для чтения
+        """
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        if bytes(buffer[:len(VacancyCache.magic)]) != VacancyCache.magic:
+            raise ValueError('Файл не является кэшем вакансий')
+        header_size = int.from_bytes(bytes(buffer[8:16]), 'little')
+        header = json.loads(bytes(buffer[16:16 + header_size]).decode('utf-8'))
+        data_start = VacancyCache.__align(16 + header_size)
+
+        def get_array(name):
+            dtype, length, position = header['arrays'][name]
+            dtype = np.dtype(dtype)
+            start = data_start + position
+            return buffer[start:start + length * dtype.itemsize].view(dtype)
+
+        strings = {column: StringColumn(get_array(f'{column}.data'), get_array(f'{column}.offsets'))
+                   for column in VacancyCache.string_columns}
+        codes = {column: get_array(f'codes.{column}') for column in header['values']}
+        return header, VacancyTable(strings['names'], strings['descriptions'], strings['key_skills'],
+                                    *[get_array(column) for column in VacancyCache.array_columns],
+                                    codes, header['values'])
+
+    @staticmethod
+    def __align(size):
+        """Округляет размер вверх до alignment"""
+        return -(-size // VacancyCache.alignment) * VacancyCache.alignment
+
+
+class StringColumn:
+    """Столбец строк из таблицы строк кэша: строки UTF-8, каждая с '\\0' в конце, и смещения их начал.
+    Отдельная строка декодируется при обращении по номеру, весь столбец при переборе - одним split.
+
+        Attributes:
+            data(ndarray<uint8>): строки
+            offsets(ndarray<int>): смещение начала каждой строки и конец данных
+    """
+    __slots__ = ('data', 'offsets')
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Номер строки вне столбца')
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1] - 1]).decode('utf-8')
+
+    def __iter__(self):
+        strings = bytes(self.data).decode('utf-8').split('\0')[:-1]
+        # '\0' внутри самой строки разбил бы её на части, тогда строки читаются по смещениям
+        if len(strings) != len(self):
+            return (self[index] for index in range(len(self)))
+        return iter(strings)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(list(self), dtype=dtype)
@@ -0,0 +1,145 @@
+import re
+import sqlite3
+import pandas as pd
+
+
+class VacancyDatabase:
+    """Класс для хранения отформатированных вакансий в таблице formatted базы SQLite и запросов статистики к ней.
+    Таблица хранит вычисленный столбец year и индексы по year, area_name и name, все запросы параметризованы.
+    Для поиска профессии по названию строится полнотекстовый индекс formatted_fts (FTS5 с триграммами).
+
+        Attributes:
+            con(Connection): соединение с базой данных
+            total_count(int): количество вакансий в таблице, считается один раз
+    """
+
+    def __init__(self, con):
+        """Инициализирует класс VacancyDatabase
+            Args:
+                con(Connection): соединение с базой данных
+        """
+        self.con = con
+        self.total_count = None
+        # LIKE и lower в SQLite меняют регистр только у латиницы, поэтому для поиска без учёта регистра
+        # по таблице регистр меняется в Python
+        self.con.create_function('unicode_lower', 1, lambda value: value.lower() if isinstance(value, str) else value,
+                                 deterministic=True)
+
+    def write_formatted(self, df):
+        """Перезаписывает таблицу formatted и создаёт индексы
+            Args:
+                df(dataframe): вакансии со столбцами name, area_name, published_at(Y-m-d), salary, year
+        """
+        df.to_sql('formatted', self.con, if_exists='replace', index=False,
+                  dtype={'year': 'INTEGER', 'salary': 'REAL', 'published_at': 'DATE'})
+        self.con.execute('CREATE INDEX IF NOT EXISTS formatted_year ON formatted (year)')
+        self.con.execute('CREATE INDEX IF NOT EXISTS formatted_area_name ON formatted (area_name)')
+        self.con.execute('CREATE INDEX IF NOT EXISTS formatted_name ON formatted (name)')
+        self.create_name_index()
+        self.con.commit()
+        self.total_count = None
+
+    def create_name_index(self):
+        """Перестраивает полнотекстовый индекс formatted_fts по названиям вакансий.
+        Если SQLite собран без FTS5 или без токенизатора trigram, поиск будет идти по таблице
+        """
+        self.con.execute('DROP TABLE IF EXISTS formatted_fts')
+        try:
+            self.con.execute("CREATE VIRTUAL TABLE formatted_fts USING fts5(name, content='formatted', "
+                             "content_rowid='rowid', tokenize='trigram')")
+        except sqlite3.OperationalError:
+            return
+        self.con.execute("INSERT INTO formatted_fts(formatted_fts) VALUES('rebuild')")
+
+    def has_name_index(self):
+        """Проверяет, построен ли полнотекстовый индекс
+            Returns:
+                bool: есть ли таблица formatted_fts
+        """
+        return self.con.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'formatted_fts'").fetchone() is not None
+
+    @staticmethod
+    def get_profession_keywords(name_of_profession):
+        """Разбивает запрос профессии на ключевые слова, разделённые OR, например 'аналитик OR analyst'
+            Args:
+                name_of_profession(str): запрос профессии
+            Returns:
+                list<str>: ключевые слова
+        """
+        return [keyword.strip() for keyword in re.split(r'\s+OR\s+', name_of_profession) if keyword.strip()]
+
+    def get_profession_query(self, name_of_profession, case_sensitive=False):
+        """Возвращает подзапрос rowid вакансий, название которых содержит хотя бы одно из ключевых слов.
+        По умолчанию, как и прежний LIKE, регистр не учитывается, причём не только у латиницы, но и у кириллицы.
+        Триграммный индекс не различает регистр, поэтому при case_sensitive найденные строки проверяются instr
+            Args:
+                name_of_profession(str): запрос профессии
+                case_sensitive(bool): учитывать ли регистр
+            Returns:
+                str: подзапрос с единственным столбцом id
+                dict<str, str>: параметры подзапроса
+        """
+        keywords = VacancyDatabase.get_profession_keywords(name_of_profession)
+        params = {f'keyword{i}': keyword for i, keyword in enumerate(keywords)}
+        if case_sensitive:
+            condition = ' OR '.join(f'instr(name, :{key}) > 0' for key in params)
+        else:
+            condition = ' OR '.join(f'instr(unicode_lower(name), unicode_lower(:{key})) > 0' for key in params)
+        if not keywords:
+            return 'SELECT rowid AS id FROM formatted', params
+
+        # Триграммы не находят слова короче трёх символов
+        if self.has_name_index() and all(len(keyword) >= 3 for keyword in keywords):
+            params['query'] = ' OR '.join('"' + keyword.replace('"', '""') + '"' for keyword in keywords)
+            if case_sensitive:
+                return f'SELECT rowid AS id FROM formatted_fts WHERE formatted_fts MATCH :query AND ({condition})', \
+                    params
+            return 'SELECT rowid AS id FROM formatted_fts WHERE formatted_fts MATCH :query', params
+        return f'SELECT rowid AS id FROM formatted WHERE {condition}', params
+
+    def get_total_count(self):
+        """Возвращает количество вакансий в таблице
+            Returns:
+                int: количество вакансий
+        """
+        if self.total_count is None:
+            self.total_count = self.con.execute('SELECT COUNT(*) FROM formatted').fetchone()[0]
+        return self.total_count
+
+    def get_year_statistics(self, name_of_profession, case_sensitive=False):
+        """Возвращает все четыре статистики по годам одним запросом
+            Args:
+                name_of_profession(str): название профессии или несколько названий через OR
+                case_sensitive(bool): учитывать ли регистр при поиске профессии
+            Returns:
+                dataframe: year, average_salary, count, average_salary_profession, count_profession
+        """
+        profession_query, params = self.get_profession_query(name_of_profession, case_sensitive)
+        return pd.read_sql_query(
+            "SELECT year, ROUND(AVG(salary), 4) AS average_salary, COUNT(name) AS count, "
+            "ROUND(AVG(CASE WHEN matched.id IS NOT NULL THEN salary END), 4) AS average_salary_profession, "
+            "COUNT(matched.id) AS count_profession "
+            f"FROM formatted LEFT JOIN ({profession_query}) AS matched ON matched.id = formatted.rowid "
+            "GROUP BY year ORDER BY year",
+            self.con, params=params)
+
+    def get_salary_level_by_city(self):
+        """Возвращает 10 городов с самым высоким уровнем зарплат среди городов, где не меньше 1% вакансий
+            Returns:
+                dataframe: area_name, average_salary
+        """
+        return pd.read_sql_query(
+            "SELECT area_name, ROUND(AVG(salary), 4) AS average_salary FROM formatted GROUP BY area_name "
+            "HAVING COUNT(name) >= :amount / 100 ORDER BY AVG(salary) DESC LIMIT 10",
+            self.con, params={'amount': self.get_total_count()})
+
+    def get_vacancy_rate(self):
+        """Возвращает 10 городов с самой большой долей вакансий среди городов, где не меньше 1% вакансий
+            Returns:
+                dataframe: area_name, rate
+        """
+        return pd.read_sql_query(
+            "SELECT area_name, ROUND(CAST(COUNT(name) AS FLOAT) / :amount, 4) AS rate FROM formatted "
+            "GROUP BY area_name HAVING COUNT(name) >= :amount / 100 ORDER BY COUNT(name) DESC LIMIT 10",
+            self.con, params={'amount': self.get_total_count()})
@@ -0,0 +1,72 @@
+import numpy as np
+
+
+class VacancyFilter:
+    """Класс составного фильтра вакансий. Фильтр - условия вида 'ключ: значение', разделённые '; ',
+    вакансия должна подходить под все условия, например 'Название региона: Москва; Оклад: 50000 - 100000'.
+    Условия выполняются по плану: сначала самое избирательное по оценке VacancyIndex.count, его номера вакансий
+    берутся из индекса, остальные условия проверяются массивами только для уже отобранных вакансий,
+    и как только не остаётся ни одной вакансии, проверка прекращается.
+
+        Attributes:
+            index(VacancyIndex): индексы по полям вакансий
+            row_visits(int): сколько раз условия проверялись для отдельных вакансий
+            names(list<str>): названия условий
+            separator(str): разделитель условий
+    """
+    names = ['Название', 'Навыки', 'Опыт работы', 'Премиум-вакансия', 'Компания', 'Оклад', 'Название региона',
+             'Дата публикации вакансии', 'Идентификатор валюты оклада']
+    separator = '; '
+
+    def __init__(self, index):
+        """Инициализирует класс VacancyFilter
+            Args:
+                index(VacancyIndex): индексы по полям вакансий
+        """
+        self.index = index
+        self.row_visits = 0
+
+    @staticmethod
+    def parse(filtering_parameter):
+        """Разбирает введённый фильтр на условия
+            Args:
+                filtering_parameter(str): фильтр
+            Returns:
+                list<tuple<str, str>>: название и значение каждого условия или None, если в условии нет ':'
+        """
+        if filtering_parameter == '':
+            return []
+        predicates = []
+        for predicate in filtering_parameter.split(VacancyFilter.separator):
+            if ':' not in predicate:
+                return None
+            filter_name, _, filter_value = predicate.partition(': ')
+            predicates.append((filter_name, filter_value))
+        return predicates
+
+    def plan(self, predicates):
+        """Упорядочивает условия по возрастанию оценки количества подходящих вакансий
+            Args:
+                predicates(list<tuple<str, str>>): условия
+            Returns:
+                list<tuple<str, str>>: условия в порядке выполнения
+        """
+        return sorted(predicates, key=lambda predicate: self.index.count(*predicate))
+
+    def get_indices(self, predicates):
+        """Возвращает номера вакансий, подходящих под все условия
+            Args:
+                predicates(list<tuple<str, str>>): условия
+            Returns:
+                ndarray<int>: номера вакансий по возрастанию
+        """
+        if len(predicates) == 0:
+            return np.arange(len(self.index.table))
+        predicates = self.plan(predicates)
+        indices = self.index.get_indices(*predicates[0])
+        for filter_name, filter_value in predicates[1:]:
+            if len(indices) == 0:
+                break
+            self.row_visits += len(indices)
+            indices = self.index.filter_indices(filter_name, filter_value, indices)
+        return indices
@@ -0,0 +1,271 @@
+from datetime import datetime
+import re
+import numpy as np
+import pandas as pd
+
+
+class VacancyIndex:
+    """Класс индексов по полям VacancyTable для фильтров InputConect.
+    Индекс каждого фильтра строится один раз при первом запросе и затем отвечает на фильтр без просмотра всех
+    вакансий: поля с повторяющимися значениями и название - через словарь значение -> номера вакансий, навыки -
+    через обратный индекс навык -> номера вакансий, дата - через группы по дню публикации, оклад - через дерево
+    интервалов [salary_from, salary_to]. Индексы также проверяют фильтр для уже отобранных номеров вакансий,
+    чтобы VacancyFilter мог начинать с самого избирательного условия.
+
+        Attributes:
+            table(VacancyTable): вакансии
+            decoding(dict<str, str>): расшифровка значений, с которой сравниваются фильтры опыта, премиума и валюты
+            indexes(dict<str, object>): уже построенные индексы по фильтрам
+            hash_filters(dict<str, tuple<str, bool>>): фильтры на равенство: столбец и сравнивается ли введённое
+                значение с расшифровкой
+            salary_range(Pattern): регулярное выражение для диапазона окладов
+            empty(ndarray<int>): пустой массив номеров
+            no_day(int): день вакансий с некорректной датой публикации
+    """
+    hash_filters = {'Компания': ('employer_name', False),
+                    'Название региона': ('area_name', False),
+                    'Опыт работы': ('experience_id', True),
+                    'Премиум-вакансия': ('premium', True),
+                    'Идентификатор валюты оклада': ('salary_currency', True)}
+    salary_range = re.compile(r'\s*(\d+(?:\.\d*)?)\s*-\s*(\d+(?:\.\d*)?)\s*')
+    empty = np.empty(0, dtype=np.int64)
+    no_day = np.iinfo(np.int64).min
+
+    def __init__(self, table, decoding=None):
+        """Инициализирует класс VacancyIndex
+            Args:
+                table(VacancyTable): вакансии
+                decoding(dict<str, str>): расшифровка значений
+        """
+        self.table = table
+        self.decoding = decoding or {}
+        self.indexes = {}
+
+    def get_indices(self, filter_name, filter_value):
+        """Возвращает номера вакансий, подходящих под фильтр
+            Args:
+                filter_name(str): название фильтра, как в InputConect.filters
+                filter_value(str): введённое значение
+            Returns:
+                ndarray<int>: номера вакансий по возрастанию или None, если для фильтра нет индекса
+        """
+        if filter_name in VacancyIndex.hash_filters or filter_name == 'Название':
+            return self.__get_hash(filter_name).get(filter_value, VacancyIndex.empty)
+        if filter_name == 'Навыки':
+            return self.__find_skills(filter_value.split(', '))
+        if filter_name == 'Дата публикации вакансии':
+            return self.__get_dates()[1].get(VacancyIndex.get_day(filter_value), VacancyIndex.empty)
+        if filter_name == 'Оклад':
+            return self.__find_salary(*VacancyIndex.get_salary_range(filter_value))
+        return None
+
+    def count(self, filter_name, filter_value):
+        """Оценивает сверху количество вакансий, подходящих под фильтр, не собирая их номера
+            Args:
+                filter_name(str): название фильтра
+                filter_value(str): введённое значение
+            Returns:
+                int: количество вакансий или None, если для фильтра нет индекса
+        """
+        if filter_name == 'Навыки':
+            index = self.__get_index('Навыки', self.__build_skills)
+            return min(len(index.get(skill, VacancyIndex.empty)) for skill in filter_value.split(', '))
+        if filter_name == 'Оклад':
+            salaries = self.__get_index('Оклад', self.__build_salaries)
+            low, high = VacancyIndex.get_salary_range(filter_value)
+            if low > high:
+                return 0
+            return min(np.searchsorted(salaries['sorted_lower'], high, side='right'),
+                       len(salaries['sorted_upper']) - np.searchsorted(salaries['sorted_upper'], low, side='left'))
+        indices = self.get_indices(filter_name, filter_value)
+        return None if indices is None else len(indices)
+
+    def filter_indices(self, filter_name, filter_value, indices):
+        """Оставляет из номеров вакансий только подходящие под фильтр, проверяя их сразу для всего массива
+            Args:
+                filter_name(str): название фильтра
+                filter_value(str): введённое значение
+                indices(ndarray<int>): номера вакансий по возрастанию
+            Returns:
+                ndarray<int>: подходящие номера вакансий по возрастанию или None, если для фильтра нет индекса
+        """
+        if filter_name in VacancyIndex.hash_filters:
+            column, is_decoded = VacancyIndex.hash_filters[filter_name]
+            codes = [code for code, value in enumerate(self.table.values[column])
+                     if (self.decoding.get(value) if is_decoded else value) == filter_value]
+            return indices[np.isin(self.table.codes[column][indices], codes)]
+        if filter_name == 'Дата публикации вакансии':
+            return indices[self.__get_dates()[0][indices] == VacancyIndex.get_day(filter_value)]
+        if filter_name == 'Оклад':
+            salaries = self.__get_index('Оклад', self.__build_salaries)
+            low, high = VacancyIndex.get_salary_range(filter_value)
+            lower, upper = salaries['lower'][indices], salaries['upper'][indices]
+            return indices[(lower <= upper) & (lower <= high) & (upper >= low) & (low <= high)]
+        if filter_name in ('Название', 'Навыки'):
+            for skill in filter_value.split(', ') if filter_name == 'Навыки' else [filter_value]:
+                indices = np.intersect1d(indices, self.get_indices(filter_name, skill), assume_unique=True)
+            return indices
+        return None
+
+    @staticmethod
+    def get_salary_range(filter_value):
+        """Разбирает значение фильтра 'Оклад': одно число или диапазон вида 50000 - 100000
+            Args:
+                filter_value(str): введённое значение
+            Returns:
+                tuple<int, int>: нижняя и верхняя граница, для одного числа они равны
+        """
+        salary_range = VacancyIndex.salary_range.fullmatch(filter_value)
+        if salary_range is not None:
+            return int(float(salary_range[1])), int(float(salary_range[2]))
+        salary = int(float(filter_value))
+        return salary, salary
+
+    @staticmethod
+    def get_day(date):
+        """Возвращает номер дня от 1970-01-01 для даты вида d.m.Y
+            Args:
+                date(str): введённая дата
+            Returns:
+                int: номер дня или None, если дата записана не так, как её выводит strftime('%d.%m.%Y')
+        """
+        try:
+            parsed_date = datetime.strptime(date, '%d.%m.%Y')
+        except ValueError:
+            return None
+        if parsed_date.strftime('%d.%m.%Y') != date:
+            return None
+        return (parsed_date - datetime(1970, 1, 1)).days
+
+    def __get_index(self, filter_name, build):
+        """Возвращает индекс фильтра, строя его при первом обращении"""
+        if filter_name not in self.indexes:
+            self.indexes[filter_name] = build()
+        return self.indexes[filter_name]
+
+    @staticmethod
+    def group(codes, groups_count):
+        """Группирует номера вакансий по номерам значений
+            Args:
+                codes(ndarray<int>): номер значения каждой вакансии
+                groups_count(int): количество значений
+            Returns:
+                list<ndarray<int>>: номера вакансий по возрастанию для каждого значения
+        """
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=groups_count)
+        return np.split(order, np.cumsum(counts)[:-1]) if groups_count else []
+
+    def __get_hash(self, filter_name):
+        """Возвращает словарь значение фильтра -> номера вакансий по возрастанию, строя его при первом обращении"""
+        return self.__get_index(filter_name, lambda: self.__build_hash(filter_name))
+
+    def __build_hash(self, filter_name):
+        """Строит словарь значение фильтра -> номера вакансий"""
+        if filter_name == 'Название':
+            codes, values = pd.factorize(np.array(self.table.names, dtype=object))
+            is_decoded = False
+        else:
+            column, is_decoded = VacancyIndex.hash_filters[filter_name]
+            codes, values = self.table.codes[column], self.table.values[column]
+        index = {}
+        for value, indices in zip(values, VacancyIndex.group(codes, len(values))):
+            key = self.decoding.get(value) if is_decoded else value
+            index[key] = np.sort(np.concatenate([index[key], indices])) if key in index else indices
+        return index
+
+    def __build_skills(self):
+        """Строит обратный индекс навык -> номера вакансий"""
+        key_skills = self.table.key_skills
+        if len(key_skills) == 0:
+            return {}
+        counts = np.fromiter((skills.count(';') + 1 for skills in key_skills), dtype=np.int64, count=len(key_skills))
+        rows = np.repeat(np.arange(len(key_skills)), counts)
+        codes, skills = pd.factorize(np.array(';'.join(key_skills).split(';'), dtype=object))
+        index = {}
+        for skill, indices in zip(skills, VacancyIndex.group(codes, len(skills))):
+            # номера уже по возрастанию, повтор навыка в одной вакансии даёт соседние одинаковые номера
+            indices = rows[indices]
+            index[skill] = indices[np.concatenate([[True], indices[1:] != indices[:-1]])]
+        return index
+
+    def __find_skills(self, skills):
+        """Ищет вакансии, у которых есть все навыки"""
+        index = self.__get_index('Навыки', self.__build_skills)
+        if any(skill not in index for skill in skills):
+            return VacancyIndex.empty
+        postings = sorted((index[skill] for skill in set(skills)), key=len)
+        result = postings[0]
+        for indices in postings[1:]:
+            result = np.intersect1d(result, indices, assume_unique=True)
+        return result
+
+    def __get_dates(self):
+        """Возвращает день публикации каждой вакансии по её местному времени и словарь день -> номера вакансий,
+        строя их при первом обращении"""
+        return self.__get_index('Дата публикации вакансии', self.__build_dates)
+
+    def __build_dates(self):
+        """Строит индекс день публикации -> номера вакансий"""
+        days = (self.table.published_at + self.table.utc_offsets.astype(np.int64) * 60) // 86400
+        # вакансии с некорректной датой (-1) не попадают ни в один день
+        days[self.table.published_at == -1] = VacancyIndex.no_day
+        unique_days, codes = np.unique(days, return_inverse=True)
+        dates = dict(zip(unique_days.tolist(), VacancyIndex.group(codes, len(unique_days))))
+        dates.pop(VacancyIndex.no_day, None)
+        return days, dates
+
+    def __build_salaries(self):
+        """Строит дерево интервалов по целым частям salary_from и salary_to.
+        В узле хранятся интервалы, содержащие его центр, отсортированные по левой и по правой границе,
+        интервалы левее центра уходят в левое поддерево, правее - в правое
+            Returns:
+                dict<str, object>: границы всех вакансий (lower, upper), узлы дерева, корень - первый (nodes),
+                    номера вакансий по левой границе и отсортированные границы (by_lower, sorted_lower, sorted_upper)
+        """
+        lower = np.trunc(self.table.salary_from).astype(np.int64)
+        upper = np.trunc(self.table.salary_to).astype(np.int64)
+        nodes = []
+
+        def build(indices):
+            if len(indices) == 0:
+                return -1
+            center = np.median(np.concatenate([lower[indices], upper[indices]]))
+            is_left, is_right = upper[indices] < center, lower[indices] > center
+            overlap = indices[~is_left & ~is_right]
+            by_lower = overlap[np.argsort(lower[overlap], kind='stable')]
+            by_upper = overlap[np.argsort(upper[overlap], kind='stable')]
+            node = len(nodes)
+            nodes.append(None)
+            left, right = build(indices[is_left]), build(indices[is_right])
+            nodes[node] = (center, by_lower, lower[by_lower], by_upper, upper[by_upper], left, right)
+            return node
+
+        valid = np.flatnonzero(lower <= upper)
+        build(valid)
+        by_lower = valid[np.argsort(lower[valid], kind='stable')]
+        return {'lower': lower, 'upper': upper, 'nodes': nodes, 'by_lower': by_lower,
+                'sorted_lower': lower[by_lower], 'sorted_upper': np.sort(upper[valid])}
+
+    def __find_salary(self, low, high):
+        """Ищет вакансии, вилка оклада которых пересекается с [low, high]: вилки, содержащие low, находятся
+        по дереву, а вилки, начинающиеся после low, но не позже high, - по отсортированным левым границам"""
+        salaries = self.__get_index('Оклад', self.__build_salaries)
+        if low > high:
+            return VacancyIndex.empty
+        parts = [salaries['by_lower'][np.searchsorted(salaries['sorted_lower'], low, side='right'):
+                                      np.searchsorted(salaries['sorted_lower'], high, side='right')]]
+        nodes = salaries['nodes']
+        node = 0 if nodes else -1
+        while node != -1:
+            center, by_lower, lower, by_upper, upper, left, right = nodes[node]
+            if low < center:
+                parts.append(by_lower[:np.searchsorted(lower, low, side='right')])
+                node = left
+            elif low > center:
+                parts.append(by_upper[np.searchsorted(upper, low, side='left'):])
+                node = right
+            else:
+                parts.append(by_lower)
+                node = -1
+        return np.sort(np.concatenate(parts))
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+
+class VacancySorter:
+    """Класс для сортировки вакансий VacancyTable по заранее посчитанным ключам.
+    Ключ каждого поля считается один раз для всей таблицы: числа берутся из столбцов как есть, строки заменяются
+    номером в отсортированном списке уникальных значений. Сортировка по нескольким полям с разным направлением
+    выполняется одним устойчивым np.lexsort без вызова функций Python для каждой вакансии.
+
+        Attributes:
+            table(VacancyTable): вакансии
+            converters(dict<str, function>): преобразование значений повторяющихся столбцов перед сравнением
+            keys(dict<str, ndarray>): уже посчитанные ключи по полям
+            fields(list<str>): поля, по которым можно сортировать
+            coded_fields(dict<str, str>): поля, которые хранятся в VacancyTable номерами значений, и их столбцы
+    """
+    fields = ['Навыки', 'Оклад', 'Дата публикации вакансии', 'Компания', 'Опыт работы', 'Премиум-вакансия',
+              'Название региона', 'Название', 'Идентификатор валюты оклада']
+    coded_fields = {'Компания': 'employer_name',
+                    'Опыт работы': 'experience_id',
+                    'Премиум-вакансия': 'premium',
+                    'Название региона': 'area_name',
+                    'Идентификатор валюты оклада': 'salary_currency'}
+
+    def __init__(self, table, converters=None):
+        """Инициализирует класс VacancySorter
+            Args:
+                table(VacancyTable): вакансии
+                converters(dict<str, function>): преобразование значений по полям, например расшифровка валюты
+        """
+        self.table = table
+        self.converters = converters or {}
+        self.keys = {}
+
+    def get_key(self, field):
+        """Возвращает ключ сортировки поля для всех вакансий таблицы, считая его при первом обращении
+            Args:
+                field(str): поле из fields
+            Returns:
+                ndarray: ключ, по возрастанию которого вакансии идут в порядке сортировки
+        """
+        if field not in self.keys:
+            self.keys[field] = self.__calculate_key(field)
+        return self.keys[field]
+
+    def __calculate_key(self, field):
+        """Считает ключ сортировки поля"""
+        table = self.table
+        if field == 'Навыки':
+            return np.fromiter((skills.count(';') + 1 for skills in table.key_skills), dtype=np.int64,
+                               count=len(table))
+        if field == 'Оклад':
+            return (table.salary_from + table.salary_to) / 2
+        if field == 'Дата публикации вакансии':
+            return table.published_at
+        if field == 'Название':
+            return pd.factorize(np.array(table.names, dtype=object), sort=True)[0]
+        if field in VacancySorter.coded_fields:
+            return self.__get_coded_key(VacancySorter.coded_fields[field], self.converters.get(field))
+        raise KeyError(field)
+
+    def __get_coded_key(self, column, convert=None):
+        """Считает ключ для столбца с номерами значений: сортируются только уникальные значения
+            Args:
+                column(str): столбец из VacancyTable.coded_columns
+                convert(function): преобразование значения перед сравнением
+            Returns:
+                ndarray<int>: место значения каждой вакансии среди отсортированных уникальных значений
+        """
+        values = self.table.values[column]
+        if convert is not None:
+            values = [convert(value) for value in values]
+        _, ranks = np.unique(np.array(values, dtype=object), return_inverse=True)
+        return ranks[self.table.codes[column]] if len(ranks) else np.zeros(len(self.table), dtype=np.int64)
+
+    def sort(self, indices, sort_fields):
+        """Возвращает номера вакансий в порядке сортировки. Вакансии с одинаковыми ключами
+        остаются в исходном порядке, в том числе при обратном направлении
+            Args:
+                indices(ndarray<int>): номера вакансий в таблице
+                sort_fields(list<tuple<str, bool>>): поля и обратный ли порядок, первое поле главное
+            Returns:
+                ndarray<int>: отсортированные номера вакансий
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if not sort_fields or len(indices) == 0:
+            return indices
+        keys = []
+        for field, is_reverse in reversed(sort_fields):
+            key = self.get_key(field)[indices]
+            keys.append(-key if is_reverse else key)
+        return indices[np.lexsort(keys)]
+
+    def select(self, indices, sort_fields, start, end):
+        """Возвращает только вакансии, которые после sort оказались бы на местах с start по end, не сортируя
+        остальные: границы диапазона по первому полю находятся через np.partition, а полностью сортируются лишь
+        вакансии между границами
+            Args:
+                indices(ndarray<int>): номера вакансий в таблице
+                sort_fields(list<tuple<str, bool>>): поля и обратный ли порядок, первое поле главное
+                start(int): первое место, начиная с 0
+                end(int): место после последнего
+            Returns:
+                ndarray<int>: номера вакансий, то же, что sort(indices, sort_fields)[start:end]
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        start, end = max(start, 0), min(end, len(indices))
+        if not sort_fields or start >= end:
+            return indices[start:end]
+        field, is_reverse = sort_fields[0]
+        key = self.get_key(field)[indices]
+        if is_reverse:
+            key = -key
+        bounds = np.partition(key, [start, end - 1])
+        lower, upper = bounds[start], bounds[end - 1]
+        skipped = np.count_nonzero(key < lower)
+        candidates = indices[(key >= lower) & (key <= upper)]
+        return self.sort(candidates, sort_fields)[start - skipped:end - skipped]
+
+    @staticmethod
+    def parse_parameters(sorting_parameter, is_reverse_sorting):
+        """Разбирает введённые параметры сортировки: поля через ', ' и порядок 'Да' / 'Нет' для всех полей
+        или для каждого поля через ', '
+            Args:
+                sorting_parameter(str): поля сортировки
+                is_reverse_sorting(str): обратный ли порядок
+            Returns:
+                list<tuple<str, bool>>: поля и обратный ли порядок
+        """
+        if sorting_parameter == '':
+            return []
+        fields = sorting_parameter.split(', ')
+        directions = is_reverse_sorting.split(', ') if is_reverse_sorting != '' else ['Нет']
+        if len(directions) == 1:
+            directions = directions * len(fields)
+        return [(field, direction == 'Да') for field, direction in zip(fields, directions)]
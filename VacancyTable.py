@@ -0,0 +1,204 @@
+from array import array
+import numpy as np
+import pandas as pd
+
+from CurrencyRateIndex import CurrencyRateIndex
+from DateParser import DateParser
+from Vacancy import Salary
+
+
+class VacancyTable:
+    """Класс для компактного хранения вакансий по столбцам вместо отдельных объектов Vacancy и Salary.
+    Зарплаты хранятся уже в рублях массивами float64, дата публикации - секундами от начала эпохи со смещением
+    часового пояса, повторяющиеся значения (валюта, опыт, регион, компания, премиум, вычет налогов) - номерами
+    в таблицах уникальных строк. Строки таблицы доступны через лёгкие представления VacancyView, у которых
+    те же поля, что и у Vacancy.
+
+        Attributes:
+            names(list<str>): названия вакансий
+            descriptions(list<str>): описания вакансий
+            key_skills(list<str>): навыки, разделённые ';'
+            salary_from(ndarray<float>): нижняя граница вилки оклада в рублях
+            salary_to(ndarray<float>): верхняя граница вилки оклада в рублях
+            published_at(ndarray<int>): время публикации в секундах от 1970-01-01 UTC
+            utc_offsets(ndarray<int>): смещение часового пояса даты публикации в минутах
+            codes(dict<str, ndarray<int>>): номера значений повторяющихся столбцов
+            values(dict<str, list<str>>): уникальные значения повторяющихся столбцов
+    """
+    coded_columns = ['salary_currency', 'salary_gross', 'experience_id', 'premium', 'area_name', 'employer_name']
+
+    def __init__(self, names, descriptions, key_skills, salary_from, salary_to, published_at, utc_offsets, codes,
+                 values):
+        """Инициализирует объект VacancyTable из готовых столбцов"""
+        self.names = names
+        self.descriptions = descriptions
+        self.key_skills = key_skills
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.published_at = published_at
+        self.utc_offsets = utc_offsets
+        self.codes = codes
+        self.values = values
+
+    @classmethod
+    def from_dictionaries(cls, vacancies):
+        """Создаёт таблицу из вакансий в виде словарей, как их возвращает DataSet.csv_filer.
+        Словари обрабатываются по одному, курсы валют и даты переводятся сразу для всего столбца
+            Args:
+                vacancies(iterable<dict<str, str>>): вакансии
+            Returns:
+                VacancyTable: таблица вакансий
+        """
+        names, descriptions, key_skills, dates = [], [], [], []
+        salary_from, salary_to = array('d'), array('d')
+        coded = {column: [] for column in VacancyTable.coded_columns}
+        for vacancy in vacancies:
+            names.append(vacancy['name'])
+            descriptions.append(vacancy['description'])
+            key_skills.append(vacancy['key_skills'])
+            salary_from.append(float(vacancy['salary_from']))
+            salary_to.append(float(vacancy['salary_to']))
+            dates.append(vacancy['published_at'])
+            for column, column_values in coded.items():
+                if column == 'salary_gross':
+                    # salary_gross может отсутствовать, как и в Salary он тогда считается 'True'
+                    column_values.append(vacancy.get(column, 'True'))
+                else:
+                    column_values.append(vacancy[column])
+
+        codes, values = {}, {}
+        for column in VacancyTable.coded_columns:
+            column_codes, uniques = pd.factorize(np.array(coded.pop(column), dtype=object))
+            codes[column] = column_codes.astype(np.int32)
+            values[column] = list(uniques)
+        currencies = np.array(values['salary_currency'], dtype=object)[codes['salary_currency']]
+        coefficients = VacancyTable.get_currency_coefficients(dates, currencies)
+        published_at, utc_offsets = DateParser.get_timestamps(dates)
+        return cls(names, descriptions, key_skills,
+                   np.frombuffer(salary_from, dtype=np.float64) * coefficients,
+                   np.frombuffer(salary_to, dtype=np.float64) * coefficients,
+                   published_at, utc_offsets, codes, values)
+
+    @staticmethod
+    def get_currency_coefficients(dates, currencies):
+        """Возвращает курсы валют на месяц публикации, как Salary.get_currency_coefficient, но для всех вакансий
+            Args:
+                dates(list<str>): даты публикации
+                currencies(ndarray<str>): валюты окладов
+            Returns:
+                ndarray<float>: курсы валют в рублях
+        """
+        coefficients = CurrencyRateIndex.get_shared().get_rates(dates, currencies)
+        missing = np.isnan(coefficients)
+        coefficients[missing] = [Salary.currency_to_rub[currency] for currency in currencies[missing]]
+        return coefficients
+
+    def get_value(self, column, index):
+        """Возвращает значение повторяющегося столбца
+            Args:
+                column(str): название столбца из coded_columns
+                index(int): номер вакансии
+            Returns:
+                str: значение
+        """
+        return self.values[column][self.codes[column][index]]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Номер вакансии вне таблицы')
+        return VacancyView(self, index)
+
+    def __iter__(self):
+        return (VacancyView(self, index) for index in range(len(self)))
+
+
+class VacancyView:
+    """Представление одной строки VacancyTable с полями Vacancy. Значения читаются из столбцов при обращении.
+
+        Attributes:
+            table(VacancyTable): таблица вакансий
+            index(int): номер вакансии в таблице
+    """
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self):
+        return self.table.names[self.index]
+
+    @property
+    def description(self):
+        return self.table.descriptions[self.index]
+
+    @property
+    def key_skills(self):
+        return self.table.key_skills[self.index].split(';')
+
+    @property
+    def salary(self):
+        return SalaryView(self.table, self.index)
+
+    @property
+    def area_name(self):
+        return self.table.get_value('area_name', self.index)
+
+    @property
+    def published_at(self):
+        # -1 - некорректная дата, как и в Vacancy она тогда None
+        if self.table.published_at[self.index] == -1:
+            return None
+        return DateParser.from_timestamp(self.table.published_at[self.index], self.table.utc_offsets[self.index])
+
+    @property
+    def experience_id(self):
+        return self.table.get_value('experience_id', self.index)
+
+    @property
+    def premium(self):
+        return self.table.get_value('premium', self.index)
+
+    @property
+    def employer_name(self):
+        return self.table.get_value('employer_name', self.index)
+
+
+class SalaryView:
+    """Представление зарплаты одной строки VacancyTable с полями Salary
+
+        Attributes:
+            table(VacancyTable): таблица вакансий
+            index(int): номер вакансии в таблице
+    """
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def salary_from(self):
+        return float(self.table.salary_from[self.index])
+
+    @property
+    def salary_to(self):
+        return float(self.table.salary_to[self.index])
+
+    @property
+    def salary_currency(self):
+        return self.table.get_value('salary_currency', self.index)
+
+    @property
+    def salary_gross(self):
+        return self.table.get_value('salary_gross', self.index)
+
+    @property
+    def average(self):
+        return int((self.salary_from + self.salary_to) / 2)
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+from DataSet import DataSet
+from VacancyCache import VacancyCache
+from VacancyTable import VacancyTable
+
+
+def write_vacancies(file_name, size, seed=0):
+    """Записывает csv файл случайных вакансий с описаниями в html"""
+    random = np.random.default_rng(seed)
+    description = '<p><strong>Обязанности:</strong></p> <ul> <li>разработка и поддержка сервисов</li> </ul> ' * 5
+    with open(file_name, 'w', encoding='utf-8') as file:
+        file.write('name,description,key_skills,experience_id,premium,employer_name,salary_from,salary_to,'
+                   'salary_gross,salary_currency,area_name,published_at\n')
+        for i in range(size):
+            file.write(f'Вакансия {random.integers(size)},"{description}","Python\nSQL\nGit",noExperience,False,'
+                       f'Компания {random.integers(5000)},{random.integers(10, 300) * 1000},'
+                       f'{random.integers(300, 500) * 1000},True,RUR,Город {random.integers(300)},'
+                       f'2022-0{1 + i % 9}-1{i % 10}T12:00:00+0300\n')
+
+
+def read_csv(file_name):
+    """Чтение без кэша: разбор csv файла и очистка ячеек"""
+    list_naming, list_data = DataSet.csv_reader(file_name)
+    return VacancyTable.from_dictionaries(DataSet.csv_filer(list_data, list_naming))
+
+
+def measure(function, *args):
+    """Возвращает результат и время работы в секундах"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as folder_name:
+        file_name = os.path.join(folder_name, 'vacancies.csv')
+        write_vacancies(file_name, size)
+        cache = VacancyCache(os.path.join(folder_name, 'cache'))
+        table, parse_time = measure(read_csv, file_name)
+        _, store_time = measure(cache.store, file_name, table)
+        cached_table, load_time = measure(cache.load, file_name)
+        _, names_time = measure(list, cached_table.names)
+        assert list(cached_table.names) == table.names and list(cached_table.key_skills) == table.key_skills
+        print(f'вакансий: {size}, csv: {os.path.getsize(file_name) / 2 ** 20:.1f} МБ, '
+              f'кэш: {os.path.getsize(cache.get_path(VacancyCache.get_fingerprint(file_name))) / 2 ** 20:.1f} МБ')
+        print(f"{'разбор csv, с':<28} | {parse_time:>6.2f}")
+        print(f"{'запись в кэш, с':<28} | {store_time:>6.2f}")
+        print(f"{'загрузка из кэша, с':<28} | {load_time:>6.2f}")
+        print(f"{'чтение всех названий, с':<28} | {names_time:>6.2f}")
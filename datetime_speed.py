@@ -1,26 +1,65 @@
+import sys
+import time
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
+from DateParser import DateParser
 
-def get_year_1(date_string):
-    year = datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S%z').year
-    return year
 
+def create_dates(rows_count, seed=0):
+    """Создаёт случайные даты публикации в формате вакансий"""
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(1_041_379_200, 1_672_531_200, rows_count)
+    return pd.Series(pd.to_datetime(seconds, unit='s').strftime('%Y-%m-%dT%H:%M:%S') + '+0300')
 
-def get_year_2(date_string):
-    year = int(date_string.split("-")[0])
-    return year
 
+def get_years_strptime(dates):
+    """Год через strptime для каждой строки"""
+    return [datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S%z').year for date_string in dates]
 
-def get_year_3(date_string):
-    year = int(date_string[:4])
-    return year
 
+def get_years_split(dates):
+    """Год через split для каждой строки"""
+    return [int(date_string.split("-")[0]) for date_string in dates]
 
-date_string = '2022-05-31T17:32:31+0300'
 
-for i in range(1000000):
-    get_year_1(date_string)
-for i in range(1000000):
-    get_year_2(date_string)
-for i in range(1000000):
-    get_year_3(date_string)
+def get_years_slice(dates):
+    """Год через срез для каждой строки"""
+    return [int(date_string[:4]) for date_string in dates]
+
+
+def get_years_str_slice(dates):
+    """Год через срез столбца pandas"""
+    return dates.str.slice(0, 4).astype(int)
+
+
+def get_date_strings_strptime(dates):
+    """Дата Y-m-d через strptime и strftime для каждой строки, как раньше в create_formatted_file"""
+    return [datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%S%z').strftime('%Y-%m-%d') for date_string in dates]
+
+
+def measure(function, dates):
+    """Возвращает время работы в секундах"""
+    start = time.perf_counter()
+    function(dates)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 1_000_000]
+    methods = [("год: strptime", get_years_strptime),
+               ("год: split", get_years_split),
+               ("год: срез", get_years_slice),
+               ("год: str.slice", get_years_str_slice),
+               ("год: DateParser", DateParser.get_years),
+               ("месяц: DateParser", DateParser.get_month_ordinals),
+               ("дата: strptime", get_date_strings_strptime),
+               ("дата: DateParser", DateParser.get_date_strings),
+               ("ГГГГММДД: DateParser", DateParser.get_iso_dates)]
+    print(f"{'строк':>10} | {'способ':<22} | {'время, с':>9}")
+    for size in sizes:
+        dates = create_dates(size)
+        assert list(DateParser.get_years(dates)) == get_years_strptime(dates[:1000]) + get_years_slice(dates[1000:])
+        for method_name, method in methods:
+            print(f"{size:>10} | {method_name:<22} | {measure(method, dates):>9.3f}")
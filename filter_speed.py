@@ -0,0 +1,60 @@
+import sys
+import time
+from types import SimpleNamespace
+
+from InputConect import InputConect
+from VacancyFilter import VacancyFilter
+from VacancyIndex import VacancyIndex
+from sort_speed import create_table
+
+
+def filter_with_lambda(filters, table, filter_name, filter_value):
+    """Прежний способ: функция фильтра для каждой вакансии"""
+    return [vacancy.index for vacancy in table if filters[filter_name](filter_value, vacancy)]
+
+
+def filter_chained(filters, table, predicates):
+    """Цепочка одиночных фильтров: каждый проверяет все вакансии, оставшиеся после предыдущего"""
+    vacancies, row_visits = list(table), 0
+    for filter_name, filter_value in predicates:
+        row_visits += len(vacancies)
+        vacancies = [vacancy for vacancy in vacancies if filters[filter_name](filter_value, vacancy)]
+    return [vacancy.index for vacancy in vacancies], row_visits
+
+
+def measure(function, *args):
+    """Возвращает результат и время работы в секундах"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    table = create_table(size)
+    index = VacancyIndex(table, InputConect.decoding)
+    filters = InputConect(SimpleNamespace(fields='', vacancy_numbers='', filtering_parameter='', sorting_parameter='',
+                                          is_reverse_sorting='', vacancies_objects=create_table(1))).filters
+    print(f"{'фильтр':<40} | {'lambda, с':>9} | {'построение, с':>13} | {'запрос, с':>9} | {'найдено':>8}")
+    for filter_name, filter_value in [('Компания', 'Компания 42'), ('Опыт работы', 'Нет опыта'),
+                                      ('Навыки', 'Git, Docker'), ('Дата публикации вакансии', '01.06.2020'),
+                                      ('Оклад', '150000')]:
+        expected, lambda_time = measure(filter_with_lambda, filters, table, filter_name, filter_value)
+        result, build_time = measure(index.get_indices, filter_name, filter_value)
+        _, query_time = measure(index.get_indices, filter_name, filter_value)
+        assert result.tolist() == expected
+        print(f"{filter_name + ': ' + filter_value:<40} | {lambda_time:>9.2f} | {build_time:>13.2f} | "
+              f"{query_time:>9.4f} | {len(result):>8}")
+
+    print()
+    print(f"{'составной фильтр':<74} | {'цепочка, с':>10} | {'план, с':>8} | {'строк: цепочка / план':>22}")
+    for filtering_parameter in ['Опыт работы: Нет опыта; Оклад: 100000 - 150000; Название региона: Город 7',
+                                'Навыки: Python, SQL; Премиум-вакансия: Да; Компания: Компания 42',
+                                'Оклад: 250000; Дата публикации вакансии: 01.06.2020']:
+        predicates = VacancyFilter.parse(filtering_parameter)
+        (expected, chained_visits), chained_time = measure(filter_chained, filters, table, predicates)
+        vacancy_filter = VacancyFilter(index)
+        result, planned_time = measure(vacancy_filter.get_indices, predicates)
+        assert result.tolist() == expected
+        print(f"{filtering_parameter:<74} | {chained_time:>10.2f} | {planned_time:>8.3f} | "
+              f"{chained_visits:>10} / {vacancy_filter.row_visits:<9}")
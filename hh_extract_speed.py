@@ -0,0 +1,59 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+
+from HeadHunter_Writer import HeadHunter_Writer
+
+
+def load_pages(file_name=os.path.join('tests', 'fixtures', 'hh_pages.json')):
+    """Читает страницы ответа API HeadHunter из файла"""
+    with open(file_name, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def write_with_dataframe(pages, file_name):
+    """Прежний способ: словарь на каждую вакансию, общий список и DataFrame.from_dict в конце"""
+    all_vacancies = []
+    for json_page in pages:
+        for vacancy in json_page['items']:
+            all_vacancies.append({'name': vacancy['name'],
+                                  'salary_from': vacancy['salary']['from'] if vacancy['salary'] else None,
+                                  'salary_to': vacancy['salary']['to'] if vacancy['salary'] else None,
+                                  'salary_currency': vacancy['salary']['currency'] if vacancy['salary'] else None,
+                                  'area_name': vacancy['area']['name'],
+                                  'published_at': vacancy['published_at']})
+    pd.DataFrame.from_dict(all_vacancies).to_csv(file_name, index=False)
+
+
+def write_with_writer(pages, file_name):
+    """Потоковая запись по столбцам через HeadHunter_Writer"""
+    with HeadHunter_Writer(file_name) as writer:
+        for json_page in pages:
+            writer.write_page(json_page)
+
+
+def measure(function, *args):
+    """Возвращает время работы в секундах и пик выделенной памяти в мегабайтах"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    fixture = load_pages()
+    sizes = [int(size) for size in sys.argv[1:]] or [20, 200, 2000]
+    print(f"{'страниц':>8} | {'способ':<9} | {'время, с':>9} | {'память, МБ':>10}")
+    for size in sizes:
+        pages = [fixture[i % len(fixture)] for i in range(size)]
+        with tempfile.TemporaryDirectory() as folder_name:
+            for method_name, method in [("dataframe", write_with_dataframe), ("writer", write_with_writer)]:
+                elapsed, peak = measure(method, pages, os.path.join(folder_name, f"{method_name}.csv"))
+                print(f"{size:>8} | {method_name:<9} | {elapsed:>9.3f} | {peak:>10.1f}")
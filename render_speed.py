@@ -0,0 +1,36 @@
+import sys
+import time
+from types import SimpleNamespace
+
+from InputConect import InputConect
+from sort_speed import create_table
+
+
+def render_all(input_conect, dataset, start, end):
+    """Прежний способ: отсортировать и отформатировать все вакансии, а затем вырезать диапазон в get_string"""
+    data_vacancies = list(dataset.vacancies_objects)
+    input_conect.sort_data_vacancies(data_vacancies, dataset.sorting_parameter, dataset.is_reverse_sorting)
+    return input_conect.create_table(data_vacancies).get_string(start=start, end=end)
+
+
+def render_range(dataset):
+    """Выбор и форматирование только вакансий из диапазона вывода"""
+    return InputConect(dataset).table.get_string()
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    dataset = SimpleNamespace(fields='', vacancy_numbers='1 21', filtering_parameter='', sorting_parameter='Оклад',
+                              is_reverse_sorting='Да', vacancies_objects=create_table(size))
+    print(f"{'вакансий':>9} | {'диапазон':<9} | {'все строки, с':>13} | {'диапазон, с':>11}")
+    for vacancy_numbers in ['1 21', '1000 1100']:
+        dataset.vacancy_numbers = vacancy_numbers
+        start = time.perf_counter()
+        expected = render_range(dataset)
+        range_time = time.perf_counter() - start
+        input_conect = InputConect(dataset)
+        start = time.perf_counter()
+        result = render_all(input_conect, dataset, input_conect.start, input_conect.end)
+        all_time = time.perf_counter() - start
+        assert result == expected
+        print(f"{size:>9} | {vacancy_numbers:<9} | {all_time:>13.2f} | {range_time:>11.2f}")
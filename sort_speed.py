@@ -0,0 +1,67 @@
+import sys
+import time
+from types import SimpleNamespace
+import numpy as np
+
+from InputConect import InputConect
+from VacancySorter import VacancySorter
+from VacancyTable import VacancyTable
+
+
+def create_table(size, seed=0):
+    """Создаёт таблицу случайных вакансий без чтения файла"""
+    random = np.random.default_rng(seed)
+    salary_from = random.integers(1, 300, size).astype(np.float64) * 1000
+    names = [f'Вакансия {number}' for number in random.integers(0, size // 10 + 1, size)]
+    key_skills = [';'.join(['Python', 'SQL', 'Git', 'Linux', 'Docker'][:count])
+                  for count in random.integers(1, 6, size)]
+    values = {'salary_currency': ['RUR', 'USD', 'EUR', 'KZT'],
+              'salary_gross': ['True', 'False'],
+              'experience_id': ['noExperience', 'between1And3', 'between3And6', 'moreThan6'],
+              'premium': ['True', 'False'],
+              'area_name': [f'Город {number}' for number in range(500)],
+              'employer_name': [f'Компания {number}' for number in range(20000)]}
+    codes = {column: random.integers(0, len(column_values), size).astype(np.int32)
+             for column, column_values in values.items()}
+    return VacancyTable(names, [''] * size, key_skills, salary_from, salary_from * 1.5,
+                        random.integers(1.5e9, 1.7e9, size), np.full(size, 180, dtype=np.int16), codes, values)
+
+
+def sort_with_rules(input_conect, table, sort_fields):
+    """Прежний способ: list.sort с функцией ключа по каждому полю"""
+    vacancies = list(table)
+    for field, is_reverse in reversed(sort_fields):
+        vacancies.sort(key=input_conect.sorting_rules[field], reverse=is_reverse)
+    return [vacancy.index for vacancy in vacancies]
+
+
+def sort_with_keys(sorter, table, sort_fields):
+    """Сортировка по ключам VacancySorter"""
+    return sorter.sort(np.arange(len(table)), sort_fields).tolist()
+
+
+def measure(function, *args):
+    """Возвращает результат и время работы в секундах"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    table = create_table(size)
+    input_conect = InputConect(SimpleNamespace(fields='', vacancy_numbers='', filtering_parameter='',
+                                               sorting_parameter='', is_reverse_sorting='',
+                                               vacancies_objects=create_table(1)))
+    print(f"{'поля':<40} | {'lambda, с':>9} | {'ключи, с':>9} | {'повтор, с':>9}")
+    for parameters in [('Оклад', 'Да'), ('Дата публикации вакансии', 'Нет'), ('Компания', 'Нет'),
+                       ('Опыт работы, Оклад', 'Нет, Да'), ('Название региона, Навыки, Название', 'Да, Нет, Нет')]:
+        sort_fields = VacancySorter.parse_parameters(*parameters)
+        sorter = VacancySorter(table, {'Опыт работы': InputConect.work_experience_convertor_weight.get,
+                                       'Премиум-вакансия': InputConect.decoding.get,
+                                       'Идентификатор валюты оклада': InputConect.decoding.get})
+        expected, rules_time = measure(sort_with_rules, input_conect, table, sort_fields)
+        result, keys_time = measure(sort_with_keys, sorter, table, sort_fields)
+        _, repeat_time = measure(sort_with_keys, sorter, table, sort_fields)
+        assert result == expected
+        print(f"{parameters[0]:<40} | {rules_time:>9.2f} | {keys_time:>9.2f} | {repeat_time:>9.2f}")
@@ -0,0 +1,64 @@
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+from StatisticalDataProcessor import StatisticalDataProcessor
+from ShardStorage import ShardStorage
+
+
+def create_vacancies(rows_count, seed=0):
+    """Создаёт случайные вакансии в том виде, в котором их оставляет Separator.main_df"""
+    rng = np.random.default_rng(seed)
+    years = rng.integers(2007, 2023, rows_count)
+    return pd.DataFrame({
+        "name": rng.choice(["Программист", "Аналитик данных", "Менеджер по продажам", "Бухгалтер"], rows_count),
+        "area_name": rng.choice(["Москва", "Санкт-Петербург", "Казань", "Уфа", "Екатеринбург"], rows_count),
+        "published_at": [f"{year}-06-15T10:00:00+0300" for year in years],
+        "salary": rng.uniform(10000, 300000, rows_count).round(2),
+        "years": years,
+    })
+
+
+def create_processor(df, folder_name):
+    """Создаёт StatisticalDataProcessor и файлы по годам, как после Separator.create_files_separated_by_years"""
+    storage = ShardStorage()
+    for year, data in df.groupby("years"):
+        storage.write(data.iloc[:, :-1], storage.get_path(folder_name, f"part_{year}"))
+    processor = StatisticalDataProcessor()
+    processor.name_of_profession = "Аналитик"
+    processor.folder_name = folder_name
+    processor.years = list(df["years"].unique())
+    processor.main_df = df
+    return processor
+
+
+def measure(function):
+    """Возвращает время работы в секундах, пик памяти процесса и пик RSS дочерних процессов в мегабайтах"""
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    children_peak = children_after / 2 ** 10 if children_after > children_before else 0.0
+    return elapsed, peak, children_peak
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 1_000_000]
+    print(f"{'строк':>10} | {'способ':<8} | {'время, с':>9} | {'память, МБ':>10} | {'процессы, МБ':>12}")
+    for size in sizes:
+        df = create_vacancies(size)
+        with tempfile.TemporaryDirectory() as folder_name:
+            processor = create_processor(df, folder_name)
+            for method_name, method in [("pool", processor.initialize_year_statistics_from_files),
+                                        ("groupby", processor.initialize_year_statistics),
+                                        ("shared", processor.initialize_year_statistics_from_shared_memory)]:
+                elapsed, peak, children_peak = measure(method)
+                print(f"{size:>10} | {method_name:<8} | {elapsed:>9.3f} | {peak:>10.1f} | {children_peak:>12.1f}")
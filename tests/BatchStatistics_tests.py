@@ -0,0 +1,25 @@
+import tempfile
+import unittest
+from BatchStatistics import BatchStatistics
+from StatisticsFixture import load_vacancies, create_processor, read_year_statistics, read_region_statistics
+
+
+class MyTestCase(unittest.TestCase):
+    def test_statistics_by_files(self):
+        professions = ['Менеджер', 'Программист', 'Аналитик']
+        regions = ['Москва', 'Санкт-Петербург', 'Уфа']
+        statistics = BatchStatistics(professions, regions)
+        statistics.main_df = load_vacancies()
+        statistics.initialize_statistics()
+        with tempfile.TemporaryDirectory() as folder_name:
+            for profession in professions:
+                processor = create_processor(statistics.main_df, folder_name, profession)
+                self.assertEqual(read_year_statistics(processor), statistics.year_statistics[profession])
+                for region in regions:
+                    processor.region = region
+                    self.assertEqual(read_region_statistics(processor),
+                                     statistics.region_statistics[profession][region])
+
+
+if __name__ == '__main__':
+    unittest.main()
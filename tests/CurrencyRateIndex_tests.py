@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+import pandas as pd
+from CurrencyRateIndex import CurrencyRateIndex
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = CurrencyRateIndex(pd.DataFrame({'date': ['2022-11', '2022-12'],
+                                                     'USD': [61.0, 63.5],
+                                                     'EUR': [None, 66.2]}))
+
+    def test_get_rate(self):
+        self.assertEqual(63.5, self.index.get_rate('USD', '2022-12'))
+        self.assertEqual(1, self.index.get_rate('RUR', '2001-01'))
+
+    def test_get_rate_unknown(self):
+        self.assertIsNone(self.index.get_rate('EUR', '2022-11'))
+        self.assertIsNone(self.index.get_rate('USD', '2023-01'))
+        self.assertIsNone(self.index.get_rate('KZT', '2022-12'))
+
+    def test_get_rates(self):
+        rates = self.index.get_rates(pd.Series(['2022-11', '2022-12', '2022-12', '2023-01', '2022-12']),
+                                     pd.Series(['USD', 'EUR', 'RUR', 'USD', None]))
+        np.testing.assert_array_equal(np.array([61.0, 66.2, 1.0, np.nan, np.nan]), rates)
+
+    def test_duplicate_months(self):
+        with self.assertRaisesRegex(ValueError, '2022-11'):
+            CurrencyRateIndex(pd.DataFrame({'date': ['2022-11', '2022-12', '2022-11'], 'USD': [61.0, 63.5, 62.0]}))
+        with self.assertRaises(ValueError):
+            CurrencyRateIndex(pd.DataFrame({'date': ['2022-11', 'месяц'], 'USD': [61.0, 63.5]}))
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import pandas as pd
+from CurrencyRateStore import CurrencyRateStore
+
+
+class CBR_Stub:
+    """Локальный сервер, отдающий XML_daily.asp: курс USD равен номеру месяца, курс KZT - номеру месяца за 100"""
+
+    def __init__(self):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                date_req = parse_qs(urlparse(self.path).query)['date_req'][0]
+                stub.requests.append(date_req)
+                month = int(date_req.split('/')[1])
+                data = ('<?xml version="1.0" encoding="windows-1251"?>'
+                        f'<ValCurs Date="{date_req.replace("/", ".")}" name="Foreign Currency Market">'
+                        f'<Valute ID="R01235"><NumCode>840</NumCode><CharCode>USD</CharCode><Nominal>1</Nominal>'
+                        f'<Name>Доллар США</Name><Value>{month},5</Value></Valute>'
+                        f'<Valute ID="R01335"><NumCode>398</NumCode><CharCode>KZT</CharCode><Nominal>100</Nominal>'
+                        f'<Name>Казахстанских тенге</Name><Value>{month},0</Value></Valute>'
+                        '</ValCurs>').encode('windows-1251')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/xml; charset=windows-1251')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}/scripts/XML_daily.asp'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.stub = CBR_Stub()
+        self.folder = tempfile.TemporaryDirectory()
+        self.store = CurrencyRateStore(os.path.join(self.folder.name, 'cache'), self.stub.base_url, max_workers=4)
+
+    def tearDown(self):
+        self.store.close()
+        self.stub.close()
+        self.folder.cleanup()
+
+    def test_get_rates(self):
+        rates = self.store.get_rates(['2022-01', '2022-02', '2022-03'])
+        self.assertEqual({'USD': 2.5, 'KZT': 0.02}, rates['2022-02'])
+        self.assertEqual(['12/01/2022', '12/02/2022', '12/03/2022'], sorted(self.stub.requests))
+
+    def test_cache(self):
+        self.store.get_rates(['2022-01', '2022-02'])
+        rates = CurrencyRateStore(self.store.cache_folder, self.stub.base_url).get_rates(['2022-01', '2022-02',
+                                                                                        '2022-03'])
+        self.assertEqual(3, len(self.stub.requests))
+        self.assertEqual(3.5, rates['2022-03']['USD'])
+
+    def test_merge(self):
+        file_name = os.path.join(self.folder.name, 'currency.csv')
+        con = sqlite3.connect(os.path.join(self.folder.name, 'currency_dynamic.sqlite'))
+        CurrencyRateStore.merge(self.store.get_currency_dataframe(['2022-02', '2022-03'], ['USD', 'KZT']),
+                                file_name, con)
+        CurrencyRateStore.merge(self.store.get_currency_dataframe(['2022-01', '2022-03'], ['USD', 'KZT']),
+                                file_name, con)
+        df = pd.read_csv(file_name)
+        self.assertEqual(['2022-01', '2022-02', '2022-03'], list(df['date']))
+        self.assertEqual([1.5, 2.5, 3.5], list(df['USD']))
+        table = pd.read_sql_query('SELECT * FROM currency_dynamic ORDER BY date', con)
+        con.close()
+        self.assertEqual(list(df['date']), list(table['date']))
+        self.assertEqual(list(df['KZT']), list(table['KZT']))
+
+    def test_merge_currencies(self):
+        file_name = os.path.join(self.folder.name, 'currency.csv')
+        con = sqlite3.connect(os.path.join(self.folder.name, 'currency_dynamic.sqlite'))
+        CurrencyRateStore.merge(pd.DataFrame({'date': ['2022-01', '2022-02'], 'USD': [1.5, 2.5],
+                                              'KZT': [0.01, 0.02]}), file_name, con)
+        CurrencyRateStore.merge(pd.DataFrame({'date': ['2022-02', '2022-03'], 'USD': [20.5, 3.5],
+                                              'EUR': [2.0, None]}), file_name, con)
+        df = pd.read_csv(file_name)
+        self.assertEqual(['date', 'USD', 'KZT', 'EUR'], list(df.columns))
+        self.assertEqual([1.5, 20.5, 3.5], list(df['USD']))
+        self.assertEqual([0.01, 0.02], list(df['KZT'][:2]))
+        self.assertTrue(pd.isna(df['KZT'][2]))
+        self.assertEqual(2.0, df['EUR'][1])
+        table = pd.read_sql_query('SELECT * FROM currency_dynamic ORDER BY date', con)
+        con.close()
+        self.assertEqual(list(df.columns), list(table.columns))
+        self.assertEqual(list(df['USD']), list(table['USD']))
+
+
+if __name__ == '__main__':
+    unittest.main()
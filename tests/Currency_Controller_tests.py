@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from Currency_Controller import Currency_Controller
+
+
+class MyTestCase(unittest.TestCase):
+    def test_lazy_constructor(self):
+        controller = Currency_Controller('missing_vacancies.csv')
+        self.assertEqual('missing_vacancies.csv', controller.file_path)
+        with self.assertRaises(FileNotFoundError):
+            controller.df
+
+    def test_count_currencies(self):
+        df = pd.DataFrame({'name': ['Программист'] * 7,
+                           'salary_currency': ['USD', 'RUR', None, 'USD', 'EUR', 'USD', 'RUR'],
+                           'published_at': [f'2022-0{i + 1}-05T10:00:00+0300' for i in range(7)]})
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            df.to_csv(file_name, index=False)
+            summary = Currency_Controller.count_currencies(file_name, chunk_size=2, with_dates=True)
+            counts = Currency_Controller.count_currencies(file_name, chunk_size=2)
+        self.assertEqual({'EUR': 1, 'RUR': 2, 'USD': 3}, counts.to_dict())
+        self.assertEqual({'EUR': 1, 'RUR': 2, 'USD': 3}, summary['count'].to_dict())
+        self.assertEqual('2022-01-05T10:00:00+0300', summary.loc['USD', 'min'])
+        self.assertEqual('2022-06-05T10:00:00+0300', summary.loc['USD', 'max'])
+
+
+    def test_count_currencies_empty(self):
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            pd.DataFrame({'salary_currency': [], 'published_at': []}).to_csv(file_name, index=False)
+            self.assertEqual(0, len(Currency_Controller.count_currencies(file_name, chunk_size=2)))
+            self.assertEqual(['count', 'min', 'max'],
+                             list(Currency_Controller.count_currencies(file_name, 2, with_dates=True).columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import pandas as pd
+from DateParser import DateParser
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dates = pd.Series(['2022-05-31T17:32:31+0300', ' 2021-02-03T00:00:00+0300', '2022-13-01T00:00:00+0300',
+                                'дата', None, '2007-12-03'])
+
+    def test_get_years(self):
+        self.assertEqual([2022, 2021, 2022, -1, -1, 2007], list(DateParser.get_years(self.dates)))
+
+    def test_get_month_ordinals(self):
+        self.assertEqual([2022 * 12 + 4, 2021 * 12 + 1, -1, -1, -1, 2007 * 12 + 11],
+                         list(DateParser.get_month_ordinals(self.dates)))
+        self.assertEqual([2003 * 12], list(DateParser.get_month_ordinals(['2003-01'])))
+
+    def test_get_iso_dates(self):
+        self.assertEqual([20220531, 20210203, -1, -1, -1, 20071203], list(DateParser.get_iso_dates(self.dates)))
+
+    def test_get_date_strings(self):
+        self.assertEqual(['2022-05-31', '2021-02-03', None, None, None, '2007-12-03'],
+                         list(DateParser.get_date_strings(self.dates)))
+
+    def test_impossible_day(self):
+        dates = pd.Series(['2022-02-31T00:00:00+0300', '2022-02-29T00:00:00+0300', '2020-02-29T12:00:00+0300',
+                           '1900-02-29T00:00:00+0300', '2000-02-29T00:00:00+0300', '2022-04-31T00:00:00+0300'])
+        self.assertEqual([-1, -1, 20200229, -1, 20000229, -1], list(DateParser.get_iso_dates(dates)))
+        self.assertEqual([None, None, '2020-02-29', None, '2000-02-29', None], list(DateParser.get_date_strings(dates)))
+        self.assertEqual([-1, -1, 2020, -1, 2000, -1], list(DateParser.get_components(dates)[0]))
+        timestamps, offsets = DateParser.get_timestamps(dates)
+        self.assertEqual([-1, -1, 1582966800, -1, 951771600, -1], list(timestamps))
+        self.assertEqual([0, 0, 180, 0, 180, 0], list(offsets))
+
+
+if __name__ == '__main__':
+    unittest.main()
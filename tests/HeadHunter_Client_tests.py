@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from HeadHunter_Client import HeadHunter_Client
+from HeadHunter_Api import HeadHunter_Vacancies
+from HeadHunter_Stub import HeadHunter_Stub, create_vacancy
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [create_vacancy(i, f'2022-12-20T{i % 24:02d}:{i % 60:02d}:30+0300', 1000 + i)
+                          for i in range(750)]
+
+    def test_get_pages(self):
+        with HeadHunter_Stub(self.vacancies) as stub:
+            client = HeadHunter_Client(stub.base_url, max_workers=4, requests_per_second=None)
+            windows = [('2022-12-20T00:00:00', '2022-12-20T11:59:59'), ('2022-12-20T12:00:00', '2022-12-20T23:59:59')]
+            pages = list(client.get_pages(windows))
+            client.close()
+        self.assertEqual(8, len(pages))
+        self.assertEqual(750, sum(len(json['items']) for _, _, _, json in pages))
+
+    def test_retry(self):
+        with HeadHunter_Stub(self.vacancies, failures=2) as stub:
+            client = HeadHunter_Client(stub.base_url, requests_per_second=None, backoff=0.01)
+            json = client.get_page('2022-12-20T00:00:00', '2022-12-20T23:59:59')
+            client.close()
+            self.assertEqual(3, len(stub.requests))
+        self.assertEqual(750, json['found'])
+
+    def test_get_vacancies(self):
+        with HeadHunter_Stub(self.vacancies) as stub, tempfile.TemporaryDirectory() as folder_name:
+            client = HeadHunter_Client(stub.base_url, requests_per_second=None)
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            HeadHunter_Vacancies(client).get_vacancies(file_name)
+            df = pd.read_csv(file_name)
+        self.assertEqual(750, len(df.index))
+        self.assertEqual(['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at'],
+                         list(df.columns))
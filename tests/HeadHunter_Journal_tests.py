@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+import pandas as pd
+from HeadHunter_Client import HeadHunter_Client
+from HeadHunter_Api import HeadHunter_Vacancies
+from HeadHunter_Journal import HeadHunter_Journal
+from HeadHunter_Writer import HeadHunter_Writer
+from HeadHunter_Stub import HeadHunter_Stub, create_vacancy
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [create_vacancy(i, f'2022-12-{20 + i % 2}T{i % 24:02d}:{i % 60:02d}:{i % 59:02d}+0300', 1000)
+                          for i in range(3000)]
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.folder.name, 'vacancies.csv')
+        self.journal = HeadHunter_Journal(os.path.join(self.folder.name, 'journal.sqlite'))
+
+    def tearDown(self):
+        self.journal.close()
+        self.folder.cleanup()
+
+    def update(self, stub, now):
+        client = HeadHunter_Client(stub.base_url, requests_per_second=None)
+        HeadHunter_Vacancies(client).update_vacancies(self.file_name, datetime(2022, 12, 20),
+                                                      datetime(2022, 12, 21, 23, 59, 59), self.journal, now)
+        client.close()
+
+    def test_update_twice(self):
+        with HeadHunter_Stub(self.vacancies) as stub:
+            self.update(stub, datetime(2023, 1, 1))
+            requests_count = len(stub.requests)
+            self.update(stub, datetime(2023, 1, 1))
+            self.assertEqual(requests_count, len(stub.requests))
+        df = pd.read_csv(self.file_name)
+        self.assertEqual(3000, len(df.index))
+        self.assertEqual(HeadHunter_Writer.header, list(df.columns))
+
+    def test_resume(self):
+        published = [vacancy for i, vacancy in enumerate(self.vacancies) if i % 2 == 0 or i < 2000]
+        with HeadHunter_Stub(published) as stub:
+            self.update(stub, datetime(2022, 12, 21, 12))
+        self.assertTrue(self.journal.is_day_completed('2022-12-20'))
+        self.assertFalse(self.journal.is_day_completed('2022-12-21'))
+        with HeadHunter_Stub(self.vacancies) as stub:
+            self.update(stub, datetime(2023, 1, 1))
+            self.assertTrue(all(request['date_from'].startswith('2022-12-21') for request in stub.requests))
+        df = pd.read_csv(self.file_name)
+        self.assertEqual(3000, len(df.index))
+
+    def test_restore_output(self):
+        with HeadHunter_Stub(self.vacancies) as stub:
+            self.update(stub, datetime(2022, 12, 21, 12))
+            with open(self.file_name, 'a', encoding='utf-8') as file:
+                file.write('недописанная строка')
+            self.update(stub, datetime(2023, 1, 1))
+        df = pd.read_csv(self.file_name)
+        self.assertEqual(3000, len(df.index))
+        self.assertFalse(df['name'].str.contains('недописанная').any())
+
+
+if __name__ == '__main__':
+    unittest.main()
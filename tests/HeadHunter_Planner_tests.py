@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime
+from HeadHunter_Client import HeadHunter_Client
+from HeadHunter_Planner import HeadHunter_Planner
+from HeadHunter_Stub import HeadHunter_Stub, create_vacancy
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [create_vacancy(i, f'2022-12-20T{i % 24:02d}:{i % 60:02d}:{i % 59:02d}+0300')
+                          for i in range(4500)]
+
+    def test_plan(self):
+        with HeadHunter_Stub(self.vacancies) as stub:
+            client = HeadHunter_Client(stub.base_url, requests_per_second=None)
+            windows = HeadHunter_Planner(client).plan(datetime(2022, 12, 20), datetime(2022, 12, 20, 23, 59, 59))
+            client.close()
+        self.assertGreater(len(windows), 2)
+        self.assertEqual('2022-12-20T00:00:00', windows[0][0])
+        self.assertEqual('2022-12-20T23:59:59', windows[-1][1])
+        self.assertTrue(all(not HeadHunter_Planner.is_truncated(json) for _, _, json in windows))
+        self.assertEqual(4500, sum(json['found'] for _, _, json in windows))
+
+    def test_truncated_window(self):
+        vacancies = [create_vacancy(i, '2022-12-20T12:00:00+0300') for i in range(2500)]
+        with HeadHunter_Stub(vacancies) as stub:
+            client = HeadHunter_Client(stub.base_url, requests_per_second=None)
+            planner = HeadHunter_Planner(client)
+            with self.assertWarns(UserWarning):
+                windows = planner.plan(datetime(2022, 12, 20), datetime(2022, 12, 20, 23, 59, 59))
+            client.close()
+        self.assertEqual(2500, sum(json['found'] for _, _, json in windows))
+        self.assertEqual(1, len(planner.truncated_windows))
+        date_from, date_to, lost = planner.truncated_windows[0]
+        self.assertTrue(date_from <= '2022-12-20T12:00:00' <= date_to)
+        self.assertEqual(500, lost)
+
+    def test_get_pages(self):
+        with HeadHunter_Stub(self.vacancies) as stub:
+            client = HeadHunter_Client(stub.base_url, requests_per_second=None)
+            windows = HeadHunter_Planner(client).plan(datetime(2022, 12, 20), datetime(2022, 12, 20, 23, 59, 59))
+            planned_requests = len(stub.requests)
+            pages = list(client.get_pages(windows))
+            client.close()
+            fetched_requests = len(stub.requests) - planned_requests
+        ids = [vacancy['id'] for _, _, _, json in pages for vacancy in json['items']]
+        self.assertEqual(4500, len(set(ids)))
+        self.assertEqual(4500, len(ids))
+        self.assertEqual(len(pages) - len(windows), fetched_requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
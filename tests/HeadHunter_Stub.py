@@ -0,0 +1,75 @@
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+class HeadHunter_Stub:
+    """Локальный сервер, отдающий /vacancies в формате API HeadHunter по заранее заданному списку вакансий.
+    Как и настоящее API, отдаёт не больше 2000 вакансий на один запрос (20 страниц по 100).
+
+        Attributes:
+            vacancies(list<dict>): вакансии в формате API
+            failures(int): сколько первых запросов завершатся ошибкой 500
+            requests(list<dict<str, str>>): параметры всех полученных запросов
+    """
+
+    def __init__(self, vacancies, failures=0):
+        self.vacancies = sorted(vacancies, key=lambda vacancy: vacancy['published_at'])
+        self.failures = failures
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.create_handler())
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_response(self, params):
+        with self.lock:
+            self.requests.append(params)
+            if self.failures > 0:
+                self.failures -= 1
+                return 500, {}
+        per_page = int(params.get('per_page', 20))
+        page = int(params.get('page', 0))
+        found = [vacancy for vacancy in self.vacancies
+                 if params['date_from'] <= vacancy['published_at'][:19] <= params['date_to']]
+        pages = min((len(found) + per_page - 1) // per_page, 2000 // per_page)
+        return 200, {'items': found[page * per_page:(page + 1) * per_page] if page < pages else [],
+                     'found': len(found), 'pages': pages, 'page': page, 'per_page': per_page}
+
+    def create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                status, body = stub.get_response(params) if url.path == '/vacancies' else (404, {})
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def create_vacancy(number, published_at, salary=None):
+    """Создаёт вакансию в формате API HeadHunter"""
+    return {'id': str(number),
+            'name': f'Вакансия {number}',
+            'salary': {'from': salary, 'to': None, 'currency': 'RUR', 'gross': True} if salary else None,
+            'area': {'id': '1', 'name': 'Москва'},
+            'published_at': published_at}
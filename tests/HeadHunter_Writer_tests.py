@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from HeadHunter_Writer import HeadHunter_Writer
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'hh_pages.json'), encoding='utf-8') as file:
+            self.pages = json.load(file)
+
+    def test_same_as_pandas(self):
+        vacancies = [{'name': vacancy['name'],
+                      'salary_from': vacancy['salary']['from'] if vacancy['salary'] else None,
+                      'salary_to': vacancy['salary']['to'] if vacancy['salary'] else None,
+                      'salary_currency': vacancy['salary']['currency'] if vacancy['salary'] else None,
+                      'area_name': vacancy['area']['name'],
+                      'published_at': vacancy['published_at']}
+                     for page in self.pages for vacancy in page['items']]
+        with tempfile.TemporaryDirectory() as folder_name:
+            expected_file_name = os.path.join(folder_name, 'expected.csv')
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            pd.DataFrame.from_dict(vacancies).to_csv(expected_file_name, index=False)
+            with HeadHunter_Writer(file_name, batch_size=250) as writer:
+                for page in self.pages:
+                    writer.write_page(page)
+            with open(expected_file_name, encoding='utf-8') as expected, open(file_name, encoding='utf-8') as actual:
+                self.assertEqual(expected.read(), actual.read())
+
+    def test_append(self):
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            with HeadHunter_Writer(file_name) as writer:
+                writer.write_page(self.pages[0])
+            with HeadHunter_Writer(file_name, append=True) as writer:
+                writer.write_page(self.pages[1], [i % 2 == 0 for i in range(100)])
+            df = pd.read_csv(file_name)
+        self.assertEqual(150, len(df.index))
+        self.assertEqual(HeadHunter_Writer.header, list(df.columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from Separator import Separator
+from StatisticalDataProcessor import StatisticalDataProcessor
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.current_directory = os.getcwd()
+        os.chdir(self.folder.name)
+        count = 6000
+        pd.DataFrame({'name': [['Программист', 'Аналитик', 'Тестировщик'][i % 3] for i in range(count)],
+                      'salary_from': [10000 * (1 + i % 5) if i % 7 else None for i in range(count)],
+                      'salary_to': [15000 * (1 + i % 4) if i % 5 else None for i in range(count)],
+                      'salary_currency': ['RUR' if i % 11 else 'KZT' for i in range(count)],
+                      'area_name': [['Москва', 'Казань', 'Уфа'][i % 3] for i in range(count)],
+                      'published_at': [f'20{20 + i % 3}-0{1 + i % 9}-1{i % 10}T10:00:00+0300' if i % 13 else 'вчера'
+                                       for i in range(count)]}).to_csv('vacancies.csv', index=False)
+
+    def tearDown(self):
+        os.chdir(self.current_directory)
+        self.folder.cleanup()
+
+    def read_shards(self, separator):
+        """Читает файлы по годам, записанные separator"""
+        return {int(year): separator.shard_storage.read(separator.get_year_file_path(year)).reset_index(drop=True)
+                for year in separator.unique_years}
+
+    def test_stream_same_as_in_memory(self):
+        for shard_format in ['csv', 'parquet']:
+            separator = Separator(shard_format)
+            separator.create_files_separated_by_years('vacancies.csv')
+            expected = self.read_shards(separator)
+            expected_years = sorted(separator.unique_years.tolist())
+
+            separator = Separator(shard_format)
+            separator.create_files_separated_by_years('vacancies.csv', chunk_size=700)
+            self.assertIsNone(separator.main_df)
+            self.assertEqual(expected_years, sorted(separator.unique_years.tolist()))
+            self.assertEqual([2020, 2021, 2022], expected_years)
+            self.assertEqual(4890, sum(len(shard) for shard in expected.values()))
+            for year, shard in self.read_shards(separator).items():
+                pd.testing.assert_frame_equal(expected[year], shard, check_dtype=False)
+
+    def test_write_files_later(self):
+        separator = Separator()
+        separator.create_files_separated_by_years('vacancies.csv', write_files=False)
+        self.assertEqual([], os.listdir('csv_files'))
+        separator.write_files_separated_by_years()
+        self.assertEqual(sorted(f'part_{year}.csv' for year in separator.unique_years), sorted(os.listdir('csv_files')))
+
+    def test_statistics_without_files(self):
+        processor = StatisticalDataProcessor(max_workers=1)
+        with mock.patch('builtins.input', side_effect=['vacancies.csv', 'Программист']):
+            processor.initialize_statistics()
+        self.assertEqual([], os.listdir('csv_files'))
+        self.assertEqual(processor.number_of_vacancies_profession[2021],
+                         processor.get_statistic_by_year(2021)[4])
+        self.assertEqual(3, len(os.listdir('csv_files')))
+
+    def test_stream_feather(self):
+        separator = Separator('feather')
+        with self.assertRaises(ValueError):
+            separator.create_files_separated_by_years('vacancies.csv', chunk_size=700)
+        self.assertFalse(os.path.exists('csv_files'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from ShardStorage import ShardStorage
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'name': ['Программист', 'Аналитик'],
+                                'area_name': ['Москва', 'Казань'],
+                                'published_at': ['2022-12-20T02:19:59+0300', '2021-01-05T10:00:00+0300'],
+                                'salary': [100000.5, 55000.0]})
+
+    def test_to_typed(self):
+        typed = ShardStorage.to_typed(self.df)
+        self.assertEqual('category', str(typed['name'].dtype))
+        self.assertEqual('float32', str(typed['salary'].dtype))
+        self.assertEqual([20221220, 20210105], list(typed['published_at']))
+
+    def test_read_columns(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow не установлен')
+        storage = ShardStorage('parquet')
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_path = storage.get_path(folder_name, 'part_2022')
+            writer = storage.open_writer(file_path)
+            writer.write(self.df.iloc[:1])
+            writer.write(self.df.iloc[1:])
+            writer.close()
+            df = storage.read(file_path, columns=['name', 'salary'])
+        self.assertEqual(['name', 'salary'], list(df.columns))
+        self.assertEqual(['Программист', 'Аналитик'], list(df['name']))
+        self.assertEqual([100000.5, 55000.0], list(df['salary']))
+
+    def test_growing_categories(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow не установлен')
+        storage = ShardStorage('parquet')
+        chunks = [pd.DataFrame({'name': [f'Вакансия {i}' for i in range(start, start + size)],
+                                'area_name': ['Москва'] * size,
+                                'published_at': ['2022-12-20T02:19:59+0300'] * size,
+                                'salary': [100000.0] * size})
+                  for start, size in [(0, 2), (2, 300)]]
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_path = storage.get_path(folder_name, 'part_2022')
+            writer = storage.open_writer(file_path)
+            for chunk in chunks:
+                writer.write(chunk)
+            writer.close()
+            df = storage.read(file_path, columns=['name'])
+        self.assertEqual([f'Вакансия {i}' for i in range(302)], list(df['name']))
+
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, ShardStorage, 'xml')
@@ -0,0 +1,49 @@
+import unittest
+from multiprocessing import shared_memory
+import pandas as pd
+from SharedDataset import SharedDataset
+from StatisticsFixture import record_blocks
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'name': ['Программист', 'Аналитик', 'Программист 1С'],
+                                'area_name': ['Москва', 'Казань', 'Москва'],
+                                'published_at': ['2021-01-05T10:00:00+0300', '2022-12-20T02:19:59+0300',
+                                                 '2022-02-01T00:00:00+0300'],
+                                'salary': [100000.5, 55000.0, 70000.0]})
+
+    def test_attach(self):
+        with SharedDataset(self.df) as dataset:
+            arrays, blocks = SharedDataset.attach(dataset.get_handle())
+            self.assertEqual([100000.5, 55000.0, 70000.0], list(arrays['salary']))
+            self.assertEqual([2021, 2022, 2022], list(arrays['years']))
+            self.assertEqual([0, 1, 0], list(arrays['area_codes']))
+            del arrays
+            for block in blocks:
+                block.close()
+
+    def test_malformed_date(self):
+        self.df.loc[3] = ['Программист', 'Москва', 'вчера', 1000000.0]
+        with SharedDataset(self.df) as dataset:
+            self.assertEqual(3, dataset.rows_count)
+            self.assertEqual(2021, dataset.first_year)
+            self.assertEqual(2, dataset.years_count)
+
+    def test_unlink_on_error(self):
+        names, patch = record_blocks(fail_after=2)
+        with patch, self.assertRaises(MemoryError):
+            SharedDataset(self.df)
+        self.assertEqual(2, len(names))
+        for name in names:
+            self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, name=name)
+
+    def test_get_name_matches(self):
+        with SharedDataset(self.df) as dataset:
+            self.assertEqual([True, False, True], list(dataset.get_name_matches('Программист')))
+            self.assertEqual(1, dataset.get_area_code('Казань'))
+            self.assertEqual(-1, dataset.get_area_code('Уфа'))
+
+    def test_get_row_ranges(self):
+        with SharedDataset(self.df) as dataset:
+            self.assertEqual([(0, 1), (1, 2), (2, 3)], dataset.get_row_ranges(4))
@@ -1,5 +1,12 @@
+import os
+import tempfile
 import unittest
+from multiprocessing import shared_memory
 from main import StatisticalDataProcessor
+from StatisticalDataProcessor import worker_parameters
+from StatisticsEngine import StatisticsEngine
+from StatisticsFixture import load_vacancies, create_processor, read_year_statistics, read_region_statistics, \
+    record_blocks
 
 
 class MyTestCase(unittest.TestCase):
@@ -16,3 +23,50 @@ class MyTestCase(unittest.TestCase):
         statistics = ['2019: 146789', '2022: 204316']
         result = {2019: 146789, 2022: 204316}
         self.assertEqual(result, StatisticalDataProcessor.convert_year_statistic_to_dictionary(statistics))
+
+    def test_pool_statistics(self):
+        df = load_vacancies(os.path.join(os.path.dirname(__file__), 'fixtures', 'salary_info_years.csv'))
+        with tempfile.TemporaryDirectory() as folder_name:
+            processor = create_processor(df, folder_name, 'Программист', 'Москва', max_workers=2)
+            processor.initialize_year_statistics_from_files()
+            processor.initialize_year_and_region_statistics_from_files()
+            self.assertEqual(read_year_statistics(processor), processor.get_final_year_statistics())
+            self.assertEqual(read_region_statistics(processor), processor.get_final_region_statistics())
+            self.assertEqual({2020: 2, 2021: 1, 2022: 1}, processor.get_final_year_statistics()[3])
+
+    def test_pool_worker_parameters(self):
+        df = load_vacancies(os.path.join(os.path.dirname(__file__), 'fixtures', 'salary_info_years.csv'))
+        with tempfile.TemporaryDirectory() as folder_name:
+            processors = [create_processor(df, folder_name, name, 'Москва', max_workers=2)
+                          for name in ['Программист', 'Аналитик']]
+            for processor in processors:
+                processor.initialize_year_statistics_from_files()
+                processor.initialize_year_and_region_statistics_from_files()
+            for processor in processors:
+                self.assertEqual(read_year_statistics(processor), processor.get_final_year_statistics())
+                self.assertEqual(read_region_statistics(processor), processor.get_final_region_statistics())
+        self.assertEqual({}, worker_parameters)
+
+    def test_shared_memory_statistics(self):
+        df = load_vacancies(os.path.join(os.path.dirname(__file__), 'fixtures', 'salary_info_years.csv'))
+        with tempfile.TemporaryDirectory() as folder_name:
+            processor = create_processor(df, folder_name, 'Аналитик', 'Казань', max_workers=2)
+        processor.initialize_year_statistics_from_shared_memory()
+        processor.initialize_year_and_region_statistics_from_shared_memory()
+        average_salary, number_of_vacancies, average_salary_profession, number_of_vacancies_profession = \
+            StatisticsEngine.get_year_statistics(df, 'Аналитик')
+        self.assertEqual([average_salary, average_salary_profession, number_of_vacancies,
+                          number_of_vacancies_profession], processor.get_final_year_statistics())
+        self.assertEqual(StatisticsEngine.get_year_and_region_statistics(df, 'Аналитик', 'Казань'),
+                         processor.get_final_region_statistics())
+
+    def test_shared_memory_unlink_on_error(self):
+        df = load_vacancies(os.path.join(os.path.dirname(__file__), 'fixtures', 'salary_info_years.csv'))
+        with tempfile.TemporaryDirectory() as folder_name:
+            processor = create_processor(df, folder_name, '(', max_workers=2)
+        names, patch = record_blocks()
+        with patch, self.assertRaises(Exception):
+            processor.calculate_shared_statistics()
+        self.assertEqual(4, len(names))
+        for name in names:
+            self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, name=name)
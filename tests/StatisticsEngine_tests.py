@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from StatisticsEngine import StatisticsEngine
+from StatisticsFixture import load_vacancies, create_processor, read_year_statistics, read_region_statistics
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'name': ['Программист', 'Аналитик', 'Программист 1С', 'Программист'],
+                                'area_name': ['Москва', 'Казань', 'Москва', 'Москва'],
+                                'published_at': ['2021-01-05T10:00:00+0300', '2022-12-20T02:19:59+0300',
+                                                 '2022-02-01T00:00:00+0300', 'вчера'],
+                                'salary': [100000.5, 55000.0, 70000.0, 1000000.0]})
+
+    def test_malformed_date(self):
+        self.assertEqual([{2021: 100000, 2022: 62500}, {2021: 1, 2022: 2}, {2021: 100000, 2022: 70000},
+                          {2021: 1, 2022: 1}],
+                         StatisticsEngine.get_year_statistics(self.df, 'Программист'))
+        self.assertEqual([{2021: 100000, 2022: 70000}, {2021: 1, 2022: 1}],
+                         StatisticsEngine.get_year_and_region_statistics(self.df, 'Программист', 'Москва'))
+
+    def test_statistics_by_files(self):
+        file_names = [os.path.join(os.path.dirname(__file__), 'fixtures', 'salary_info_years.csv'),
+                      os.path.join(os.path.dirname(__file__), '..', 'salary_info_100.csv')]
+        for file_name in file_names:
+            df = load_vacancies(file_name)
+            with tempfile.TemporaryDirectory() as folder_name:
+                for profession, region in [('Программист', 'Москва'), ('Аналитик', 'Казань'), ('Врач', 'Москва')]:
+                    processor = create_processor(df, folder_name, profession, region)
+                    average_salary, number_of_vacancies, average_salary_profession, \
+                        number_of_vacancies_profession = StatisticsEngine.get_year_statistics(df, profession)
+                    self.assertEqual(read_year_statistics(processor),
+                                     [average_salary, average_salary_profession, number_of_vacancies,
+                                      number_of_vacancies_profession])
+                    self.assertEqual(read_region_statistics(processor),
+                                     StatisticsEngine.get_year_and_region_statistics(df, profession, region))
+
+    def test_floor_mean(self):
+        self.assertEqual(100000, StatisticsEngine.floor_mean(100000.7))
+        self.assertEqual(0, StatisticsEngine.floor_mean(None))
+        self.assertEqual(0, StatisticsEngine.floor_mean(float('nan')))
+        self.assertIsInstance(StatisticsEngine.floor_mean(5.5), int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+from multiprocessing import shared_memory
+from unittest import mock
+import pandas as pd
+
+from DateParser import DateParser
+from ShardStorage import ShardStorage
+from StatisticalDataProcessor import StatisticalDataProcessor
+
+
+def load_vacancies(file_name=os.path.join(os.path.dirname(__file__), '..', 'salary_info_100.csv')):
+    """Читает уже отформатированные вакансии (name, area_name, published_at, salary) в том виде,
+    в котором их оставляет Separator.main_df"""
+    df = pd.read_csv(file_name).dropna()
+    df["years"] = DateParser.get_years(df["published_at"])
+    return df.reset_index(drop=True)
+
+
+def create_processor(df, folder_name, name_of_profession, region=None, max_workers=None):
+    """Создаёт StatisticalDataProcessor и файлы по годам, как после Separator.create_files_separated_by_years"""
+    storage = ShardStorage()
+    for year, data in df.groupby("years"):
+        storage.write(data.drop(columns="years"), storage.get_path(folder_name, f"part_{year}"))
+    processor = StatisticalDataProcessor(max_workers=max_workers)
+    processor.name_of_profession = name_of_profession
+    processor.region = region
+    processor.folder_name = folder_name
+    processor.years = sorted(int(year) for year in df["years"].unique())
+    processor.main_df = df
+    return processor
+
+
+def read_year_statistics(processor):
+    """Считает статистику по файлам за каждый год последовательно, без пула процессов
+        Returns:
+            list<dict<int, int>>: статистика в порядке get_final_year_statistics
+    """
+    statistics = [{}, {}, {}, {}]
+    for year in processor.years:
+        year, average_salary, number_of_vacancies, average_salary_profession, number_of_vacancies_profession = \
+            processor.get_statistic_by_year(year)
+        for dictionary, value in zip(statistics, [average_salary, average_salary_profession, number_of_vacancies,
+                                                  number_of_vacancies_profession]):
+            dictionary[year] = value
+    return statistics
+
+
+def read_region_statistics(processor):
+    """Считает статистику профессии в регионе по файлам за каждый год последовательно, без пула процессов
+        Returns:
+            list<dict<int, int>>: статистика в порядке get_final_region_statistics
+    """
+    statistics = [{}, {}]
+    for year in processor.years:
+        year, average_salary, number_of_vacancies = processor.get_statistic_by_year_and_region(year)
+        statistics[0][year] = average_salary
+        statistics[1][year] = number_of_vacancies
+    return statistics
+
+
+def record_blocks(fail_after=None):
+    """Подменяет SharedMemory так, чтобы запоминать имена созданных блоков и падать после fail_after блоков"""
+    names = []
+    create_block = shared_memory.SharedMemory
+
+    def create(*args, **kwargs):
+        if fail_after is not None and len(names) == fail_after:
+            raise MemoryError('Нет разделяемой памяти')
+        block = create_block(*args, **kwargs)
+        names.append(block.name)
+        return block
+
+    return names, mock.patch.object(shared_memory, 'SharedMemory', side_effect=create)
+
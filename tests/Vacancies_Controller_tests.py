@@ -0,0 +1,16 @@
+import unittest
+import pandas as pd
+from Vacancies_Controller import Vacancies_Controller
+
+
+class MyTestCase(unittest.TestCase):
+    def test_drop_invalid_dates(self):
+        vacancies = pd.DataFrame({'name': ['Программист', 'Аналитик', 'Тестировщик'],
+                                  'published_at': ['2022-12-20T02:19:59+0300', 'вчера', None],
+                                  'salary_currency': ['RUR', 'RUR', 'RUR']})
+        vacancies = Vacancies_Controller.drop_invalid_dates(vacancies)
+        self.assertEqual(['Программист'], list(vacancies['name']))
+
+
+if __name__ == '__main__':
+    unittest.main()
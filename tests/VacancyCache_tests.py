@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from DataSet import DataSet
+from InputConect import InputConect
+from VacancyCache import VacancyCache, StringColumn
+from VacancyTable import VacancyTable
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.folder.name, 'vacancies.csv')
+        self.write_vacancies(8)
+        self.cache = VacancyCache(os.path.join(self.folder.name, 'cache'))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write_vacancies(self, count, file_name=None):
+        with open(file_name or self.file_name, 'w', encoding='utf-8') as file:
+            file.write('name,description,key_skills,experience_id,premium,employer_name,salary_from,salary_to,'
+                       'salary_gross,salary_currency,area_name,published_at\n')
+            for i in range(count):
+                file.write(f'Программист {i},<p>Описание {i}</p>,"Python\nSQL",{["noExperience", "moreThan6"][i % 2]},'
+                           f'False,Компания {i % 3},{10000 * (i + 1)},{20000 * (i + 1)},True,'
+                           f'{["RUR", "EUR"][i % 2]},{["Москва", "Казань"][i % 2]},2022-0{1 + i % 9}-1{i}T12:00:00+0300\n')
+
+    def read_table(self):
+        list_naming, list_data = DataSet.csv_reader(self.file_name)
+        return VacancyTable.from_dictionaries(DataSet.csv_filer(list_data, list_naming))
+
+    def render(self, table):
+        dataset = SimpleNamespace(fields='', vacancy_numbers='', filtering_parameter='Название региона: Москва',
+                                  sorting_parameter='Оклад', is_reverse_sorting='Да', vacancies_objects=table)
+        return InputConect(dataset).table.get_string()
+
+    def test_round_trip(self):
+        table = self.read_table()
+        self.assertIsNone(self.cache.load(self.file_name))
+        self.cache.store(self.file_name, table)
+        cached_table = self.cache.load(self.file_name)
+        self.assertIsInstance(cached_table.names, StringColumn)
+        self.assertEqual(list(table.descriptions), list(cached_table.descriptions))
+        self.assertEqual(self.render(table), self.render(cached_table))
+
+    def test_source_changed(self):
+        self.cache.store(self.file_name, self.read_table())
+        self.write_vacancies(9)
+        self.assertIsNone(self.cache.load(self.file_name))
+        self.cache.store(self.file_name, self.read_table())
+        self.assertEqual(9, len(self.cache.load(self.file_name)))
+        self.assertEqual(1, len(os.listdir(self.cache.cache_folder)))
+
+    def test_invalidate_and_evict(self):
+        other_file_name = os.path.join(self.folder.name, 'other.csv')
+        self.write_vacancies(4, other_file_name)
+        self.cache.store(self.file_name, self.read_table())
+        self.cache.store(other_file_name, self.read_table())
+        self.assertEqual(1, self.cache.invalidate(other_file_name))
+        self.assertIsNotNone(self.cache.load(self.file_name))
+
+        self.cache.store(other_file_name, self.read_table())
+        os.utime(self.cache.get_path(VacancyCache.get_fingerprint(self.file_name)), (0, 0))
+        self.cache.max_size = os.path.getsize(self.cache.get_path(VacancyCache.get_fingerprint(other_file_name)))
+        self.cache.evict()
+        self.assertIsNone(self.cache.load(self.file_name))
+        self.assertIsNotNone(self.cache.load(other_file_name))
+        self.assertEqual(1, self.cache.invalidate())
+
+    def test_string_column(self):
+        strings = ['Python', '', 'С\0нулём', 'Разработка ПО']
+        table = VacancyTable(strings, strings, strings, *([[0.0] * 4] * 2), [0] * 4, [0] * 4, {}, {})
+        path = os.path.join(self.folder.name, 'strings.vcache')
+        VacancyCache.write(path, {}, table)
+        column = VacancyCache.read(path)[1].names
+        self.assertEqual(strings, list(column))
+        self.assertEqual('Разработка ПО', column[-1])
+
+    def test_dataset(self):
+        with mock.patch.object(DataSet, 'cache', self.cache), \
+                mock.patch('builtins.input', side_effect=[self.file_name, 'Программист'] * 2):
+            first_table = DataSet().vacancies_objects
+            second_table = DataSet().vacancies_objects
+        self.assertIsInstance(first_table.names, list)
+        self.assertIsInstance(second_table.names, StringColumn)
+        self.assertEqual(self.render(first_table), self.render(second_table))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import sqlite3
+import unittest
+import pandas as pd
+from VacancyDatabase import VacancyDatabase
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.database = VacancyDatabase(sqlite3.connect(':memory:'))
+        self.database.write_formatted(pd.DataFrame({
+            'name': ['Программист', "Аналитик 'данных'", 'Программист 1С', 'Менеджер', 'Python developer'],
+            'area_name': ['Москва', 'Казань', 'Москва', 'Москва', 'Москва'],
+            'published_at': ['2021-01-05', '2022-12-20', '2022-02-01', '2022-03-01', '2022-04-01'],
+            'salary': [100000.0, 55000.0, 70000.0, None, None],
+            'year': [2021, 2022, 2022, 2022, 2022]}))
+
+    def test_get_year_statistics(self):
+        data = self.database.get_year_statistics('Программист')
+        self.assertEqual([2021, 2022], list(data['year']))
+        self.assertEqual([100000.0, 62500.0], list(data['average_salary']))
+        self.assertEqual([1, 4], list(data['count']))
+        self.assertEqual([100000.0, 70000.0], list(data['average_salary_profession']))
+        self.assertEqual([1, 1], list(data['count_profession']))
+
+    def test_get_year_statistics_quote(self):
+        data = self.database.get_year_statistics("'данных'")
+        self.assertEqual([0, 1], list(data['count_profession']))
+
+    def test_get_vacancy_rate(self):
+        data = self.database.get_vacancy_rate()
+        self.assertEqual(['Москва', 'Казань'], list(data['area_name']))
+        self.assertEqual([0.8, 0.2], list(data['rate']))
+        self.assertEqual(5, self.database.total_count)
+
+    def test_get_year_statistics_keywords(self):
+        self.assertEqual(['аналитик', 'менеджер'], VacancyDatabase.get_profession_keywords('аналитик OR менеджер'))
+        data = self.database.get_year_statistics('аналитик OR менеджер')
+        self.assertEqual([0, 2], list(data['count_profession']))
+        data = self.database.get_year_statistics('аналитик OR Менеджер', case_sensitive=True)
+        self.assertEqual([0, 1], list(data['count_profession']))
+
+    def test_get_year_statistics_short_keyword(self):
+        data = self.database.get_year_statistics('1С', case_sensitive=True)
+        self.assertEqual([0, 1], list(data['count_profession']))
+        data = self.database.get_year_statistics('1с')
+        self.assertEqual([0, 1], list(data['count_profession']))
+        data = self.database.get_year_statistics('1с', case_sensitive=True)
+        self.assertEqual([0, 0], list(data['count_profession']))
+
+    def test_get_year_statistics_without_name_index(self):
+        self.database.con.execute('DROP TABLE formatted_fts')
+        data = self.database.get_year_statistics('программист OR менеджер')
+        self.assertEqual([1, 2], list(data['count_profession']))
+
+    def test_get_year_statistics_default_case(self):
+        # Как и прежний LIKE, по умолчанию регистр латиницы не учитывается
+        data = self.database.get_year_statistics('python')
+        self.assertEqual([0, 1], list(data['count_profession']))
+        data = self.database.get_year_statistics('python', case_sensitive=True)
+        self.assertEqual([0, 0], list(data['count_profession']))
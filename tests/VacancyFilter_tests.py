@@ -0,0 +1,72 @@
+import itertools
+import unittest
+from InputConect import InputConect
+from VacancyFilter import VacancyFilter
+from VacancyIndex import VacancyIndex
+from VacancyTableFixture import create_table, create_dataset
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies, self.table = create_table(
+            120, salary_currency=lambda i: 'RUR',
+            area_name=lambda i: ['Москва', 'Казань', 'Екатеринбург', 'Пермь', 'Омск'][i % 5],
+            published_at=lambda i: f'2022-0{1 + i % 3}-1{i % 7}T{20 + i % 4}:32:31+0300')
+        self.index = VacancyIndex(self.table, InputConect.decoding)
+        self.dataset = create_dataset(self.table)
+        self.input_conect = InputConect(self.dataset)
+
+    def filter_with_lambdas(self, predicates):
+        return [view.index for view in self.table
+                if all(self.input_conect.filters[name](value, view) for name, value in predicates)]
+
+    def test_same_as_lambdas(self):
+        for filtering_parameter in ['Название региона: Москва; Опыт работы: Нет опыта',
+                                    'Навыки: SQL; Оклад: 40000 - 60000; Премиум-вакансия: Нет',
+                                    'Компания: Сбер; Дата публикации вакансии: 11.02.2022',
+                                    'Оклад: 25000; Название: Аналитик; Идентификатор валюты оклада: Рубли',
+                                    'Оклад: 60000 - 30000', 'Название региона: Москва; Компания: Нет такой']:
+            predicates = VacancyFilter.parse(filtering_parameter)
+            expected = self.filter_with_lambdas(predicates)
+            for permutation in itertools.permutations(predicates):
+                self.assertEqual(expected, VacancyFilter(self.index).get_indices(list(permutation)).tolist(),
+                                 filtering_parameter)
+
+    def test_fewer_row_visits(self):
+        predicates = VacancyFilter.parse('Опыт работы: Нет опыта; Премиум-вакансия: Да; Название региона: Москва')
+        vacancy_filter = VacancyFilter(self.index)
+        self.assertEqual(self.filter_with_lambdas(predicates), vacancy_filter.get_indices(predicates).tolist())
+        chained_visits, rows = 0, list(self.table)
+        for name, value in predicates:
+            chained_visits += len(rows)
+            rows = [row for row in rows if self.input_conect.filters[name](value, row)]
+        self.assertLess(vacancy_filter.row_visits, chained_visits)
+        self.assertEqual('Название региона', vacancy_filter.plan(predicates)[0][0])
+
+    def test_input_conect(self):
+        self.dataset.filtering_parameter = 'Навыки: SQL, Git; Оклад: 30000 - 45000'
+        table_without_index = InputConect(self.dataset).table.get_string()
+        self.dataset.vacancy_index = self.index
+        self.assertEqual(table_without_index, InputConect(self.dataset).table.get_string())
+
+    def test_small_tables(self):
+        predicates = VacancyFilter.parse('Навыки: Python; Оклад: 12000; Название региона: Москва; '
+                                         'Опыт работы: Нет опыта')
+        for count in [0, 1]:
+            vacancy_filter = VacancyFilter(VacancyIndex(create_table(count)[1], InputConect.decoding))
+            self.assertEqual(list(range(count)), vacancy_filter.get_indices(predicates).tolist())
+            self.assertEqual(list(range(count)), vacancy_filter.get_indices([]).tolist())
+            self.assertEqual([], vacancy_filter.get_indices(predicates + [('Компания', 'Сбер')]).tolist())
+            self.assertEqual(0 if count == 0 else len(predicates) - 1, vacancy_filter.row_visits)
+
+    def test_parse(self):
+        self.assertEqual([], VacancyFilter.parse(''))
+        self.assertIsNone(VacancyFilter.parse('Оклад: 100; Москва'))
+        self.assertEqual([('Оклад', '10 - 20'), ('Навыки', 'SQL, Git')],
+                         VacancyFilter.parse('Оклад: 10 - 20; Навыки: SQL, Git'))
+        self.assertEqual((10, 20), VacancyIndex.get_salary_range('10 - 20'))
+        self.assertEqual((15, 15), VacancyIndex.get_salary_range('15.5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from InputConect import InputConect
+from VacancyIndex import VacancyIndex
+from VacancyTableFixture import create_table, create_dataset
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies, self.table = create_table(60)
+        self.index = VacancyIndex(self.table, InputConect.decoding)
+        self.dataset = create_dataset(self.table)
+        self.filters = InputConect(self.dataset).filters
+
+    def assert_same_as_filter(self, filter_name, filter_value):
+        expected = [view.index for view in self.table if self.filters[filter_name](filter_value, view)]
+        self.assertEqual(expected, self.index.get_indices(filter_name, filter_value).tolist(),
+                         f'{filter_name}: {filter_value}')
+
+    def test_hash(self):
+        for filter_name, filter_value in [('Компания', 'Сбер'), ('Название региона', 'Казань'),
+                                          ('Опыт работы', 'От 3 до 6 лет'), ('Премиум-вакансия', 'Да'),
+                                          ('Идентификатор валюты оклада', 'Евро'), ('Название', 'Аналитик'),
+                                          ('Компания', 'Нет такой')]:
+            self.assert_same_as_filter(filter_name, filter_value)
+
+    def test_skills(self):
+        for skills in ['Python', 'SQL, Git', 'Git, SQL, Linux', 'Python, Linux', 'Java']:
+            self.assert_same_as_filter('Навыки', skills)
+
+    def test_date(self):
+        for date in ['10.01.2022', '13.02.2022', '3.02.2022', '16.03.2022', '31.02.2022']:
+            self.assert_same_as_filter('Дата публикации вакансии', date)
+
+    def test_salary(self):
+        for salary in ['0', '10000', '14999', '15000', '30000.5', '50000', '75000', '105000', '200000',
+                       '0 - 12000', '31000 - 39000', '60000 - 90000', '90000 - 60000']:
+            self.assert_same_as_filter('Оклад', salary)
+
+    def test_input_conect(self):
+        self.dataset.filtering_parameter, self.dataset.sorting_parameter = 'Навыки: SQL, Git', 'Оклад'
+        table_without_index = InputConect(self.dataset).table.get_string()
+        self.dataset.vacancy_index = self.index
+        self.assertEqual(table_without_index, InputConect(self.dataset).table.get_string())
+        self.assertIn('Навыки', self.index.indexes)
+
+    def test_small_tables(self):
+        predicates = [('Компания', 'Яндекс'), ('Название региона', 'Москва'), ('Опыт работы', 'Нет опыта'),
+                      ('Премиум-вакансия', 'Да'), ('Идентификатор валюты оклада', 'Рубли'),
+                      ('Название', 'Программист'), ('Навыки', 'Python'), ('Дата публикации вакансии', '10.01.2022'),
+                      ('Оклад', '12000'), ('Оклад', '0 - 90000')]
+        for count in [0, 1]:
+            index = VacancyIndex(create_table(count)[1], InputConect.decoding)
+            for filter_name, filter_value in predicates:
+                self.assertEqual(list(range(count)), index.get_indices(filter_name, filter_value).tolist(), filter_name)
+                self.assertEqual(count, index.count(filter_name, filter_value), filter_name)
+                self.assertEqual(list(range(count)),
+                                 index.filter_indices(filter_name, filter_value, np.arange(count)).tolist(), filter_name)
+            self.assertEqual([], index.get_indices('Компания', 'Сбер').tolist())
+
+    def test_no_index(self):
+        self.assertIsNone(self.index.get_indices('Описание', 'Описание'))
+
+
+if __name__ == '__main__':
+    unittest.main()
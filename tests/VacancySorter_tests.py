@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+from unittest import mock
+from InputConect import InputConect
+from Vacancy import Vacancy
+from VacancySorter import VacancySorter
+from VacancyTable import VacancyTable, VacancyView
+from VacancyTableFixture import create_table, create_dataset, skills
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies, self.table = create_table(
+            24, key_skills=lambda i: ';'.join(skills[:1 + i % 4]), salary_to=lambda i: str(20000 * (1 + i % 5)),
+            published_at=lambda i: f'2022-0{1 + i % 3}-1{i % 7}T1{i % 5}:32:31+0300')
+        self.dataset = create_dataset(self.table)
+
+    def test_same_as_sorting_rules(self):
+        input_conect = InputConect(self.dataset)
+        for field in VacancySorter.fields:
+            for is_reverse in ['Да', 'Нет']:
+                views, vacancies = list(self.table), [Vacancy(vacancy) for vacancy in self.vacancies]
+                input_conect.sort_data_vacancies(views, field, is_reverse)
+                input_conect.sort_data_vacancies(vacancies, field, is_reverse)
+                self.assertEqual([vacancy.name + vacancy.employer_name for vacancy in vacancies],
+                                 [view.name + view.employer_name for view in views], field)
+                self.assertEqual([vacancy.published_at for vacancy in vacancies],
+                                 [view.published_at for view in views], field)
+
+    def test_multiple_fields(self):
+        input_conect = InputConect(self.dataset)
+        views = list(self.table)
+        input_conect.sort_data_vacancies(views, 'Название, Оклад', 'Нет, Да')
+        expected = sorted(range(24), key=lambda i: (self.vacancies[i]['name'], -self.table.salary_from[i], i))
+        self.assertEqual(expected, [view.index for view in views])
+
+    def test_stable(self):
+        sorter = VacancySorter(self.table)
+        indices = sorter.sort(range(24), [('Премиум-вакансия', True)])
+        self.assertEqual(list(range(0, 24, 2)), indices[:12].tolist())
+        self.assertEqual(list(range(1, 24, 2)), indices[12:].tolist())
+
+    def test_select(self):
+        sorter = VacancySorter(self.table)
+        for sort_fields in [[('Оклад', True)], [('Премиум-вакансия', False), ('Навыки', True)], [('Название', False)]]:
+            for start, end in [(0, 5), (3, 17), (20, 24), (0, 24), (7, 8), (10, 10)]:
+                self.assertEqual(sorter.sort(range(24), sort_fields)[start:end].tolist(),
+                                 sorter.select(range(24), sort_fields, start, end).tolist())
+
+    def test_table_range(self):
+        self.dataset.sorting_parameter, self.dataset.is_reverse_sorting = 'Оклад', 'Да'
+        full_table = InputConect(self.dataset).table
+        self.dataset.vacancy_numbers = '3 8'
+        table = InputConect(self.dataset).table
+        self.assertEqual(5, len(table.rows))
+        self.assertEqual(full_table.get_string(start=2, end=7), table.get_string())
+
+    def test_views_only_for_range(self):
+        self.dataset.vacancy_numbers = '3 8'
+        expected = InputConect(self.dataset).table.get_string()
+        for sorting_parameter in ['', 'Оклад']:
+            self.dataset.sorting_parameter, self.dataset.is_reverse_sorting = sorting_parameter, 'Да'
+            with mock.patch('InputConect.VacancyView', wraps=VacancyView) as view, \
+                    mock.patch.object(VacancyTable, '__iter__', side_effect=AssertionError):
+                table = InputConect(self.dataset).table
+            self.assertEqual(5, view.call_count)
+            self.assertEqual(5, len(table.rows))
+            if sorting_parameter == '':
+                self.assertEqual(expected, table.get_string())
+
+    def test_get_range(self):
+        self.assertEqual((0, 24), InputConect.get_range('', 24))
+        self.assertEqual((4, 24), InputConect.get_range('5', 24))
+        self.assertEqual((0, 19), InputConect.get_range('1 20', 24))
+        self.assertEqual((24, 24), InputConect.get_range('30 40', 24))
+
+    def test_small_tables(self):
+        for count in [0, 1]:
+            sorter = VacancySorter(create_table(count)[1])
+            for field in VacancySorter.fields:
+                self.assertEqual(list(range(count)), sorter.sort(np.arange(count), [(field, True)]).tolist(), field)
+                self.assertEqual(list(range(count)), sorter.select(np.arange(count), [(field, False)], 0, 5).tolist(),
+                                 field)
+                self.assertEqual(count, len(sorter.get_key(field)), field)
+
+    def test_single_row_input_conect(self):
+        self.dataset.vacancies_objects = create_table(1)[1]
+        self.dataset.sorting_parameter, self.dataset.is_reverse_sorting = 'Оклад, Название', 'Да'
+        self.assertEqual(1, len(InputConect(self.dataset).table.rows))
+
+    def test_parse_parameters(self):
+        self.assertEqual([], VacancySorter.parse_parameters('', 'Да'))
+        self.assertEqual([('Оклад', False)], VacancySorter.parse_parameters('Оклад', ''))
+        self.assertEqual([('Оклад', True), ('Название', True)], VacancySorter.parse_parameters('Оклад, Название', 'Да'))
+        self.assertEqual([('Оклад', True), ('Название', False)],
+                         VacancySorter.parse_parameters('Оклад, Название', 'Да, Нет'))
+
+
+if __name__ == '__main__':
+    unittest.main()
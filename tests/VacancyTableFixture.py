@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+from VacancyTable import VacancyTable
+
+skills = ['Python', 'SQL', 'Git', 'Linux']
+columns = {'name': lambda i: ['Программист', 'Аналитик', 'Тестировщик'][i % 3],
+           'description': lambda i: 'Описание',
+           'key_skills': lambda i: ';'.join(skills[i % 2:1 + i % 5]),
+           'experience_id': lambda i: ['noExperience', 'between1And3', 'between3And6', 'moreThan6'][i % 4],
+           'premium': lambda i: ['True', 'False'][i % 2],
+           'employer_name': lambda i: ['Яндекс', 'Сбер', 'Авито'][i % 3],
+           'salary_from': lambda i: str(10000 * (1 + i % 5)),
+           'salary_to': lambda i: str(15000 * (1 + i % 7)),
+           'salary_gross': lambda i: 'True',
+           'salary_currency': lambda i: ['RUR', 'KZT', 'EUR', 'USD'][i % 4],
+           'area_name': lambda i: ['Москва', 'Казань', 'Екатеринбург'][i % 3],
+           'published_at': lambda i: f'2022-0{1 + i % 3}-1{i % 7}T{20 + i % 4}:32:31+0{i % 2}00'}
+
+
+def create_vacancies(count, **overrides):
+    """Создаёт вакансии-словари, как их возвращает DataSet.csv_filer. Значение каждого столбца - функция от номера
+    вакансии, overrides заменяет функции отдельных столбцов"""
+    functions = {**columns, **overrides}
+    return [{column: function(i) for column, function in functions.items()} for i in range(count)]
+
+
+def create_dataset(table):
+    """Создаёт объект с параметрами DataSet, которые читает InputConect, без ввода с клавиатуры"""
+    return SimpleNamespace(fields='', vacancy_numbers='', filtering_parameter='', sorting_parameter='',
+                           is_reverse_sorting='', vacancies_objects=table)
+
+
+def create_table(count, **overrides):
+    """Создаёт вакансии create_vacancies и их таблицу VacancyTable"""
+    vacancies = create_vacancies(count, **overrides)
+    return vacancies, VacancyTable.from_dictionaries(vacancies)
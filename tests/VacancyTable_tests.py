@@ -0,0 +1,54 @@
+import unittest
+from types import SimpleNamespace
+from InputConect import InputConect
+from Vacancy import Vacancy
+from VacancyTable import VacancyTable
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [{'name': f'Программист {i}', 'description': 'Описание', 'key_skills': 'Python;SQL;Git'[:6 + i],
+                           'experience_id': ['noExperience', 'between1And3', 'moreThan6'][i % 3],
+                           'premium': ['True', 'False'][i % 2], 'employer_name': ['Яндекс', 'Сбер'][i % 2],
+                           'salary_from': str(10000 * (i + 1)), 'salary_to': str(20000 * (i + 1)),
+                           'salary_gross': 'True', 'salary_currency': ['RUR', 'USD', 'KZT', 'EUR'][i % 4],
+                           'area_name': ['Москва', 'Казань'][i % 2],
+                           'published_at': f'20{10 + i}-0{1 + i % 9}-1{i % 10}T1{i % 10}:32:31+0300'}
+                          for i in range(8)]
+        self.table = VacancyTable.from_dictionaries(self.vacancies)
+
+    def test_same_as_vacancy(self):
+        self.assertEqual(8, len(self.table))
+        for view, vacancy in zip(self.table, map(Vacancy, self.vacancies)):
+            for field in ['name', 'description', 'key_skills', 'area_name', 'published_at', 'experience_id',
+                          'premium', 'employer_name']:
+                self.assertEqual(getattr(vacancy, field), getattr(view, field))
+            for field in ['salary_from', 'salary_to', 'salary_currency', 'salary_gross', 'average']:
+                self.assertEqual(getattr(vacancy.salary, field), getattr(view.salary, field))
+
+    def test_input_conect(self):
+        dataset = SimpleNamespace(fields='', vacancy_numbers='', filtering_parameter='Название региона: Москва',
+                                  sorting_parameter='Оклад', is_reverse_sorting='Да', vacancies_objects=self.table)
+        table_from_views = InputConect(dataset).table.get_string()
+        dataset.vacancies_objects = [Vacancy(vacancy) for vacancy in self.vacancies]
+        self.assertEqual(InputConect(dataset).table.get_string(), table_from_views)
+
+    def test_missing_column(self):
+        vacancies = [{key: value for key, value in vacancy.items() if key != 'salary_gross'}
+                     for vacancy in self.vacancies]
+        self.assertEqual('True', VacancyTable.from_dictionaries(vacancies)[0].salary.salary_gross)
+        for column in ['area_name', 'employer_name', 'experience_id', 'salary_currency']:
+            vacancies = [{key: value for key, value in vacancy.items() if key != column} for vacancy in self.vacancies]
+            with self.assertRaises(KeyError):
+                VacancyTable.from_dictionaries(vacancies)
+            with self.assertRaises(KeyError):
+                Vacancy(vacancies[0])
+
+    def test_getitem(self):
+        self.assertEqual('Программист 7', self.table[-1].name)
+        with self.assertRaises(IndexError):
+            self.table[8]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
+import os
+import tempfile
 import unittest
-from main import DataSet
+from unittest import mock
+from DataSet import DataSet
+from InputConect import InputConect
 
 
 class MyTestCase(unittest.TestCase):
@@ -27,3 +31,68 @@ class MyTestCase(unittest.TestCase):
         cell = 'Управление проектами\nВедение переговоров\nРазработка ПО'
         result = 'Управление проектами;Ведение переговоров;Разработка ПО'
         self.assertEqual(DataSet.convert_cell_to_standard(cell), result)
+
+    def test_csv_reader_streaming(self):
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write('name,key_skills,area_name\n<b>Программист</b>,"Python\nSQL",Москва\nАналитик,,Казань\n'
+                           'Тестировщик,Selenium,Уфа\n')
+            list_naming, rows = DataSet.csv_reader(file_name)
+            vacancies = DataSet.csv_filer(rows, list_naming)
+            self.assertEqual({'name': 'Программист', 'key_skills': 'Python;SQL', 'area_name': 'Москва'},
+                             next(vacancies))
+            self.assertEqual('Тестировщик', next(vacancies)['name'])
+            self.assertEqual([], list(vacancies))
+            self.assertTrue(rows.gi_frame is None)
+
+    def test_raw_filter(self):
+        list_naming = ['name', 'experience_id', 'area_name']
+        rows = [['Программист', 'noExperience', '<b>Москва</b>'], ['Аналитик', 'moreThan6', 'Казань'],
+                ['Тестировщик', 'noExperience', ' Москва ']]
+        raw_filter = DataSet.get_raw_filter(list_naming, 'Название региона: Москва')
+        self.assertEqual(['Программист', 'Тестировщик'],
+                         [vacancy['name'] for vacancy in DataSet.csv_filer(rows, list_naming, raw_filter)])
+        raw_filter = DataSet.get_raw_filter(list_naming, 'Опыт работы: Более 6 лет')
+        self.assertEqual(['Аналитик'], [vacancy['name'] for vacancy in DataSet.csv_filer(rows, list_naming, raw_filter)])
+        self.assertIsNone(DataSet.get_raw_filter(list_naming, 'Оклад: 100000'))
+        self.assertEqual((1, {'noExperience'}),
+                         DataSet.get_raw_filter(list_naming, 'Оклад: 100000; Опыт работы: Нет опыта; Название: А'))
+        self.assertIsNone(DataSet.get_raw_filter(list_naming, ''))
+
+    def test_raw_filter_without_cache(self):
+        self.assertIsNone(DataSet.cache)
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write('name,description,key_skills,experience_id,premium,employer_name,salary_from,salary_to,'
+                           'salary_gross,salary_currency,area_name,published_at\n'
+                           'Программист,Описание,Python,noExperience,False,Компания,10000,20000,True,RUR,Москва,'
+                           '2022-07-05T18:19:30+0300\n'
+                           'Аналитик,Описание,SQL,noExperience,False,Компания,10000,20000,True,RUR,Казань,'
+                           '2022-07-05T18:19:30+0300\n')
+            with mock.patch('builtins.input', side_effect=[file_name, 'Программист']):
+                dataset = DataSet()
+            dataset.filtering_parameter = 'Название региона: Казань'
+            self.assertEqual(['Аналитик'], list(dataset.vacancies_objects.names))
+            self.assertFalse(os.path.exists('dataset_cache'))
+
+    def test_impossible_date(self):
+        with tempfile.TemporaryDirectory() as folder_name:
+            file_name = os.path.join(folder_name, 'vacancies.csv')
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write('name,description,key_skills,experience_id,premium,employer_name,salary_from,salary_to,'
+                           'salary_gross,salary_currency,area_name,published_at\n'
+                           'Программист,Описание,Python,noExperience,False,Компания,10000,20000,True,RUR,Москва,'
+                           '2022-02-31T18:19:30+0300\n'
+                           'Аналитик,Описание,SQL,noExperience,False,Компания,10000,20000,True,RUR,Казань,'
+                           '2022-07-05T18:19:30+0300\n')
+            with mock.patch('builtins.input', side_effect=[file_name, 'Программист']):
+                dataset = DataSet()
+            vacancies = dataset.vacancies_objects
+            self.assertEqual(['Программист', 'Аналитик'], list(vacancies.names))
+            self.assertIsNone(vacancies[0].published_at)
+            self.assertEqual('05.07.2022', vacancies[1].published_at.strftime('%d.%m.%Y'))
+            self.assertEqual([1], list(dataset.vacancy_index.get_indices('Дата публикации вакансии', '05.07.2022')))
+            self.assertEqual([], list(dataset.vacancy_index.get_indices('Дата публикации вакансии', '31.12.1969')))
+            self.assertEqual('', InputConect.format_date(vacancies[0].published_at))